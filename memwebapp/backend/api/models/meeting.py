@@ -1,7 +1,7 @@
-from sqlalchemy import Column, String, Text, DateTime, Boolean, JSON, Integer, ForeignKey, Enum, Float
+from sqlalchemy import Column, String, Text, DateTime, Boolean, Integer, ForeignKey, Enum, Float, Index, JSON
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from database.base import Base
 import enum
 import uuid
@@ -25,11 +25,11 @@ class MeetingRecord(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     title = Column(String, nullable=False, index=True)
     description = Column(Text, nullable=True)
-    participants = Column(JSON, nullable=True)  # List of participant names
-    transcription = Column(JSON, nullable=True)  # List of transcription segments
+    participants = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)  # List of participant names
+    transcription = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)  # List of transcription segments
     summary = Column(Text, nullable=True)        # String summary (what audio service returns)
     key_points = Column(Text, nullable=True)     # String key points (what audio service returns)
-    action_items = Column(JSON, nullable=True)    # List of action items extracted from transcription
+    action_items = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)    # List of action items extracted from transcription
     audio_filename = Column(String, nullable=True)  # Local filename (for backward compatibility)
     s3_audio_path = Column(String, nullable=True)   # S3 path for audio file
     templateid = Column(String, nullable=True)
@@ -43,7 +43,26 @@ class MeetingRecord(Base):
     
     # Analytics fields
     analytics_status = Column(Enum(AnalyticsStatus), default=AnalyticsStatus.PENDING, nullable=False, index=True)
-    analytics_data = Column(JSON, nullable=True)  # Store comprehensive analytics as JSON
+    analytics_data = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)  # Store comprehensive analytics as JSON
+    analytics_mode = Column(String, default="sync", server_default="sync", nullable=False)  # "sync" or "batch" (low-priority, Gemini Batch API)
     
     # Relationship with User model
-    user = relationship("User", back_populates="meetings") 
\ No newline at end of file
+    user = relationship("User", back_populates="meetings")
+    
+    # Composite indexes for the meeting list / status / watchdog queries
+    __table_args__ = (
+        Index('ix_meeting_records_user_created', 'user_id', created_at.desc()),
+        Index('ix_meeting_records_user_status', 'user_id', 'status'),
+        Index(
+            'ix_meeting_records_pending_with_audio',
+            'status',
+            postgresql_where=(audio_filename.isnot(None) & (audio_filename != ''))
+        ),
+        # Speaker lookups / renames filter with JSONB containment on transcription
+        Index(
+            'ix_meeting_records_transcription_gin',
+            transcription,
+            postgresql_using='gin',
+            postgresql_ops={'transcription': 'jsonb_path_ops'}
+        ),
+    ) 
\ No newline at end of file
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, String, Text, DateTime, Boolean, JSON, Integer, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, Boolean, Integer, ForeignKey, JSON
 from sqlalchemy.sql import func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from database.base import Base
 import uuid
 
@@ -12,7 +12,7 @@ class Template(Base):
     description = Column(Text, nullable=True)
     transcription_prompt = Column(Text, nullable=True)  # AI prompt for transcription
     summary_prompt = Column(Text, nullable=True)  # AI prompt for generating summaries
-    key_points_prompt = Column(JSON, nullable=True)  # List of key points to extract
+    key_points_prompt = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)  # List of key points to extract
     speaker_diarization = Column(Text, nullable=True)  # Speaker identification instructions
     created_by = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)  # NULL for default templates
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
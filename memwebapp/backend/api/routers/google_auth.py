@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 from database.connection import get_db
-from api.services.google_auth_service import google_auth_service
+from api.services.google_auth_service import get_google_auth_service
 from api.models.user import User
 from config.settings import settings
 import logging
@@ -25,7 +25,7 @@ async def google_login(request: Request):
     logger.info("🚀 Google login initiated - generating auth URL")
     
     redirect_uri = get_redirect_uri_google(request)
-    auth_url = google_auth_service.get_auth_url(redirect_uri)
+    auth_url = get_google_auth_service().get_auth_url(redirect_uri)
     logger.info(f"🔗 Generated Google auth URL: {auth_url}")
     
     return RedirectResponse(url=auth_url)
@@ -47,7 +47,7 @@ async def google_callback_post(request: Request, db: Session = Depends(get_db)):
         redirect_uri = get_redirect_uri_google(request)
         
         # Authenticate user
-        auth_result = await google_auth_service.authenticate_google_user(code, db, redirect_uri)
+        auth_result = await get_google_auth_service().authenticate_google_user(code, db, redirect_uri)
         logger.info("✅ Google authentication successful")
         
         # For development: Always redirect to custom scheme for mobile apps
@@ -74,7 +74,7 @@ async def google_callback_get(code: str, request: Request, db: Session = Depends
         redirect_uri = get_redirect_uri_google(request)
         
         # Authenticate user
-        auth_result = await google_auth_service.authenticate_google_user(code, db, redirect_uri)
+        auth_result = await get_google_auth_service().authenticate_google_user(code, db, redirect_uri)
         logger.info("✅ Google authentication successful")
         
         return create_auth_redirect_response(request, auth_result, "google")
@@ -89,6 +89,7 @@ async def google_callback_get(code: str, request: Request, db: Session = Depends
 @router.get("/status")
 async def google_auth_status():
     """Check Google authentication configuration status"""
+    google_auth_service = get_google_auth_service()
     return {
         "configured": bool(google_auth_service.client_id != ""),
         "client_id": google_auth_service.client_id[:8] + "..." if google_auth_service.client_id else "Not configured",
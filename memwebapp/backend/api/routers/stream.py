@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Request, Query, UploadFile, File, Form, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Request, Query, UploadFile, File, Form
 from sqlalchemy.orm import Session
 from api.services.auth_service import get_current_user
 from database.connection import get_db
@@ -126,7 +126,6 @@ async def upload_audio_chunk(
 @router.post("/finalize/{meeting_id}")
 async def finalize_stream(
     meeting_id: UUID,
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -145,9 +144,9 @@ async def finalize_stream(
             
         logger.info(f"Initiating background finalization for meeting {meeting_id}...")
         
-        # Add to background tasks
-        from api.services.meeting_service import finalize_meeting_background_execution
-        background_tasks.add_task(finalize_meeting_background_execution, meeting_id)
+        # Hand off to the dedicated finalization worker pool
+        from api.services.finalize_worker_service import finalize_worker_service
+        finalize_worker_service.submit(meeting_id)
         
         return {
             "status": "processing_started", 
@@ -19,8 +19,7 @@ from api.services.template_service import (
     update_template,
     delete_template,
     hard_delete_template,
-    search_templates,
-    search_templates_count,
+    search_templates_with_count,
     get_templates_with_filters,
     get_default_templates,
     get_user_templates,
@@ -243,8 +242,7 @@ async def search_templates_endpoint(
     """Search templates by title and description"""
     try:
         skip = (page - 1) * limit
-        templates = search_templates(db, q, skip=skip, limit=limit, active_only=active_only)
-        total = search_templates_count(db, q, active_only=active_only)
+        templates, total = search_templates_with_count(db, q, skip=skip, limit=limit, active_only=active_only)
         
         # Convert templates to response format with key points
         templates_with_key_points = [template_to_response_with_key_points(template) for template in templates]
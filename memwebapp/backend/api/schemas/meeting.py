@@ -1,5 +1,5 @@
-from pydantic import BaseModel, ConfigDict
-from typing import Optional, List, Any, Dict
+from pydantic import BaseModel, ConfigDict, field_validator
+from typing import Optional, List, Any, Dict, Literal
 from datetime import datetime
 from uuid import UUID, uuid4
 from api.models.meeting import TranscriptionStatus, AnalyticsStatus
@@ -51,7 +51,15 @@ class MeetingRecordUpdate(BaseModel):
     status: Optional[TranscriptionStatus] = None
     analytics_status: Optional[AnalyticsStatus] = None
     analytics_data: Optional[Dict[str, Any]] = None
+    analytics_mode: Optional[Literal["sync", "batch"]] = None  # Omit to leave unchanged
     duration: Optional[int] = None
+    
+    @field_validator('analytics_mode')
+    def validate_analytics_mode(cls, v):
+        # The column is NOT NULL: an explicit null would reach the UPDATE via exclude_unset
+        if v is None:
+            raise ValueError('analytics_mode must be "sync" or "batch"')
+        return v
 
 class MeetingRecordResponse(MeetingRecordBase):
     id: UUID
@@ -29,7 +29,6 @@ class TemplateResponse(TemplateBase):
     created_at: datetime
     updated_at: datetime
     is_active: bool
-    key_points: Optional[List[str]] = None
 
     class Config:
         from_attributes = True
@@ -6,18 +6,14 @@ from typing import Optional, Dict, List
 import google.generativeai as genai
 from pydub import AudioSegment
 from config.settings import settings
+from config.logging_config import setup_logging
 from sqlalchemy.orm import Session
 from database.connection import get_db
 from api.services.template_service import get_templates
 import json
 
 # Configure logging with timestamps
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S',
-    force=True  # Override any existing configuration
-)
+setup_logging()
 logger = logging.getLogger(__name__)
 
 class AISuggestionService:
@@ -10,22 +10,25 @@ import math
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from google.generativeai import types
 from config.settings import settings
+from api.services.ffmpeg_process import open_ffmpeg_stream
+from config.logging_config import setup_logging
 import json
 from sqlalchemy.orm import Session
 from database.connection import get_db
 from api.services.template_service import get_template, get_template_by_title
 import glob
 import shutil
+import subprocess
+import tempfile
+from uuid import UUID
 
 # Configure logging with timestamps
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S',
-    force=True  # Override any existing configuration
-)
+setup_logging()
 logger = logging.getLogger(__name__)
 
+# Extensions pydub/ffmpeg can decode for chunking and validation
+AUDIO_FILE_EXTENSIONS = frozenset({"wav", "mp3", "m4a", "aac", "flac", "ogg", "wma", "opus", "webm"})
+
 class AudioProcessor:
     def __init__(self):
         """Initialize the audio processor with necessary models and configurations"""
@@ -59,7 +62,6 @@ class AudioProcessor:
             # Try to get template by UUID first, then by title for backward compatibility
             if template_id:
                 try:
-                    from uuid import UUID
                     uuid_template_id = UUID(template_id)
                     template = get_template(db, uuid_template_id)
                 except ValueError:
@@ -166,7 +168,6 @@ Only return the pure JSON array inside triple backticks and nothing else."""
             # Try to get template by UUID first, then by title for backward compatibility
             if template_id:
                 try:
-                    from uuid import UUID
                     uuid_template_id = UUID(template_id)
                     template = get_template(db, uuid_template_id)
                 except ValueError:
@@ -235,7 +236,6 @@ Only return the pure JSON array inside triple backticks and nothing else."""
             
             # Look for name introductions
             for pattern in name_patterns:
-                import re
                 matches = re.findall(pattern, text)
                 for name in matches:
                     if name and len(name) > 1:  # Valid name
@@ -313,7 +313,6 @@ Only return the pure JSON array inside triple backticks and nothing else."""
             # Try to get template by UUID first, then by title for backward compatibility
             if template_id:
                 try:
-                    from uuid import UUID
                     uuid_template_id = UUID(template_id)
                     template = get_template(db, uuid_template_id)
                 except ValueError:
@@ -378,10 +377,9 @@ Only return the pure JSON array inside triple backticks and nothing else."""
             # Determine file format
             file_name = os.path.basename(audio_path)
             file_extension = file_name.split(".")[-1].lower()
-            supported_formats = ["wav", "mp3", "m4a", "aac", "flac", "ogg", "wma", "opus", "webm"]
-            if file_extension not in supported_formats:
+            if file_extension not in AUDIO_FILE_EXTENSIONS:
                 logger.error(f"Unsupported audio format: {file_extension}")
-                raise ValueError(f"Unsupported audio format: {file_extension}. Supported formats: {', '.join(supported_formats)}")
+                raise ValueError(f"Unsupported audio format: {file_extension}. Supported formats: {', '.join(sorted(AUDIO_FILE_EXTENSIONS))}")
             
             # Set output directory - use nonlocal to access the outer scope variable
             nonlocal output_dir
@@ -716,7 +714,6 @@ Only return the pure JSON array inside triple backticks and nothing else."""
                 logger.warning("⚠️ Continuing anyway - Gemini may still be able to process it")
             
             # Upload the audio file and get the content
-            import io
             audio_file = {
                 "mime_type": "audio/mpeg",
                 "data": audio_data
@@ -1059,6 +1056,37 @@ Only return the pure JSON array inside triple backticks and nothing else."""
         logger.error("PROCESS-STREAM: No audio could be processed")
         return None
 
+    def open_stitched_audio_stream(self, meeting_id: str) -> Optional[subprocess.Popen]:
+        """
+        Start an ffmpeg process that mixes the appended recording files
+        (mic_recording.webm, tab_recording.webm) and writes MP3 to stdout,
+        so the stitched audio can be streamed to S3 without an intermediate WAV.
+        Returns None if there are no recording files.
+        """
+        meeting_dir = os.path.join(os.path.abspath("temp_audio"), str(meeting_id))
+        inputs = [
+            path for path in (
+                os.path.join(meeting_dir, "mic_recording.webm"),
+                os.path.join(meeting_dir, "tab_recording.webm")
+            )
+            if os.path.exists(path)
+        ]
+        
+        if not inputs:
+            logger.warning(f"PROCESS-STREAM: No recording files found in {meeting_dir}")
+            return None
+        
+        command = ["ffmpeg", "-nostdin", "-loglevel", "error"]
+        for path in inputs:
+            command += ["-i", path]
+        if len(inputs) == 2:
+            # Same mix as the pydub mic.overlay(tab) in stitch_audio_chunks_v3 (mic length wins)
+            command += ["-filter_complex", "amix=inputs=2:duration=first:normalize=0"]
+        command += ["-f", "mp3", "-b:a", "192k", "-q:a", "2", "pipe:1"]
+        
+        logger.info(f"PROCESS-STREAM: Streaming {len(inputs)} recording(s) for {meeting_id} through ffmpeg")
+        return open_ffmpeg_stream(command)
+
     def transcribe_chunks(self, audio_uri, template_id=None):
         """Transcribe multiple audio chunks in parallel."""
         logger.info(f"Starting parallel transcription of chunks from: {audio_uri} with template {template_id}")
@@ -1169,9 +1197,8 @@ Only return the pure JSON array inside triple backticks and nothing else."""
             # Check file extension
             file_name = os.path.basename(audio_path)
             file_extension = file_name.split(".")[-1].lower()
-            supported_formats = ["wav", "mp3", "m4a", "aac", "flac", "ogg", "wma", "webm", "opus"]
-            if file_extension not in supported_formats:
-                raise ValueError(f"Unsupported audio format: {file_extension}. Supported formats: {', '.join(supported_formats)}")
+            if file_extension not in AUDIO_FILE_EXTENSIONS:
+                raise ValueError(f"Unsupported audio format: {file_extension}. Supported formats: {', '.join(sorted(AUDIO_FILE_EXTENSIONS))}")
             
             # Try to load the audio file
             try:
@@ -1494,9 +1521,6 @@ Return only valid JSON, no additional text or explanations."""
             # Parse JSON from response
             try:
                 # Try to extract JSON from the response
-                import json
-                import re
-                
                 logger.info("🔍 [Action Items] Parsing JSON from response...")
                 
                 # Remove markdown code blocks if present
@@ -1644,6 +1668,33 @@ Return only valid JSON, no additional text or explanations."""
             logger.error(f"❌ Error merging audio files: {str(e)}")
             raise Exception(f"Failed to merge audio files: {str(e)}")
     
+    def open_merged_audio_stream(self, primary_audio_path: str, secondary_audio_path: str) -> subprocess.Popen:
+        """
+        Start an ffmpeg process that mixes the secondary audio over the primary audio
+        and writes the result as MP3 to stdout, so it can be streamed to S3 without
+        an intermediate file on disk.
+        
+        Args:
+            primary_audio_path: Path to the primary audio file
+            secondary_audio_path: Path to the secondary audio file to overlay
+            
+        Returns:
+            The running ffmpeg process; read the merged MP3 from its stdout
+        """
+        logger.info(f"🎵 Starting piped audio merge: {primary_audio_path} + {secondary_audio_path}")
+        
+        # amix with duration=longest and normalize=0 matches pydub's overlay onto a
+        # silence-extended primary track (no per-input volume reduction)
+        command = [
+            "ffmpeg", "-nostdin", "-loglevel", "error",
+            "-i", primary_audio_path,
+            "-i", secondary_audio_path,
+            "-filter_complex", "amix=inputs=2:duration=longest:normalize=0",
+            "-f", "mp3", "-b:a", "192k", "-q:a", "2",
+            "pipe:1"
+        ]
+        return open_ffmpeg_stream(command)
+    
     def validate_secondary_audio_file(self, audio_path: str) -> bool:
         """
         Validate secondary audio file for merging.
@@ -1756,7 +1807,6 @@ Return only valid JSON, no additional text or explanations."""
             
             if needs_new_file:
                 # Create temporary file for normalized audio
-                import tempfile
                 temp_fd, normalized_path = tempfile.mkstemp(suffix='.mp3')
                 os.close(temp_fd)
                 
@@ -5,9 +5,15 @@ import threading
 import time
 import os
 import math
+import shutil
 import tempfile
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from config.logging_config import setup_logging
+from config.settings import settings
 from typing import List, Optional
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from database.connection import SessionLocal
 from api.models.meeting import MeetingRecord, TranscriptionStatus, AnalyticsStatus
@@ -15,27 +21,39 @@ from api.models.user import User
 from api.services.audio_service import AudioProcessor
 from api.services.meeting_service import update_meeting_record
 from api.services.dashboard_service import dashboard_service
-from api.services.flat_meeting_analytics import flat_analytics
-from api.services.mobile_audio_analytics import mobile_audio_analytics
+from api.services.flat_meeting_analytics import get_flat_analytics
+from api.services.mobile_audio_analytics import get_mobile_audio_analytics
 from api.services.s3_service import s3_service
 from api.services.template_service import get_template
 from api.schemas.meeting import MeetingRecordUpdate
 
 # Configure logging with timestamps
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S',
-    force=True  # Override any existing configuration
-)
+setup_logging()
 logger = logging.getLogger(__name__)
 
+# How long a batch run waits on Gemini; batch-mode meetings still PROCESSING well after
+# that were claimed by a run that died (restart/crash) and are put back to PENDING
+BATCH_ANALYTICS_TIMEOUT_SECONDS = 24 * 3600
+BATCH_ANALYTICS_STALE_AFTER = timedelta(seconds=BATCH_ANALYTICS_TIMEOUT_SECONDS) + timedelta(hours=1)
+
+# Sync-mode meetings transcribed but still analytics PENDING lost their queued job (restart/shutdown)
+# and are re-submitted; the grace period covers the gap between the COMPLETED write and the submit,
+# the lookback keeps old meetings that never had analytics from being swept up
+ORPHANED_ANALYTICS_SWEEP_INTERVAL_SECONDS = 300
+ORPHANED_ANALYTICS_GRACE = timedelta(minutes=5)
+ORPHANED_ANALYTICS_LOOKBACK = timedelta(days=7)
+
 class BackgroundTranscriptionService:
     def __init__(self):
         self.audio_processor = AudioProcessor()
         self.is_running = False
         self.worker_thread = None
         self.stop_event = threading.Event()
+        # Analytics (LLM-latency bound) run on their own pool so the transcription
+        # worker can move on to the next meeting instead of waiting on Gemini
+        self.analytics_executor = None
+        self._analytics_in_flight = set()
+        self._analytics_in_flight_lock = threading.Lock()
         
     def start(self):
         """Start the background transcription service"""
@@ -51,6 +69,11 @@ class BackgroundTranscriptionService:
             
             self.is_running = True
             self.stop_event.clear()
+            with self._analytics_in_flight_lock:
+                self._analytics_in_flight.clear()
+            self.analytics_executor = ThreadPoolExecutor(
+                max_workers=settings.ANALYTICS_MAX_WORKERS, thread_name_prefix="analytics"
+            )
             self.worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
             self.worker_thread.start()
             logger.info("🎵 Background transcription service started successfully")
@@ -78,6 +101,10 @@ class BackgroundTranscriptionService:
         self.stop_event.set()
         if self.worker_thread:
             self.worker_thread.join(timeout=10)
+        if self.analytics_executor:
+            # Dropped jobs leave their meetings analytics PENDING; the next start re-submits them
+            self.analytics_executor.shutdown(wait=False, cancel_futures=True)
+            self.analytics_executor = None
         logger.info("Background transcription service stopped")
         
     def _worker_loop(self):
@@ -85,9 +112,14 @@ class BackgroundTranscriptionService:
         logger.info("🔄 Background worker loop started")
         consecutive_errors = 0
         max_consecutive_errors = 5
+        next_analytics_sweep = 0.0
         
         while self.is_running and not self.stop_event.is_set():
             try:
+                if time.monotonic() >= next_analytics_sweep:
+                    self._requeue_orphaned_analytics()
+                    next_analytics_sweep = time.monotonic() + ORPHANED_ANALYTICS_SWEEP_INTERVAL_SECONDS
+                
                 # Get pending meetings with audio files
                 pending_meetings = self._get_pending_meetings()
                 
@@ -166,27 +198,8 @@ class BackgroundTranscriptionService:
                 self._update_meeting_status(db, meeting.id, TranscriptionStatus.FAILED)
                 return
             
-            # Retrieve audio content (Local file or S3 download)
-            if os.path.exists(meeting.s3_audio_path):
-                logger.info(f"📁 Local audio file found: {meeting.s3_audio_path}")
-                try:
-                    with open(meeting.s3_audio_path, 'rb') as f:
-                        audio_content = f.read()
-                    logger.info(f"✅ Loaded {len(audio_content)} bytes from local file")
-                except Exception as e:
-                    logger.error(f"❌ Failed to read local file: {e}")
-                    self._update_meeting_status(db, meeting.id, TranscriptionStatus.FAILED)
-                    return
-            else:
-                logger.info(f"📥 Downloading audio file from S3: {meeting.s3_audio_path}")
-                audio_content = s3_service.download_audio_file(meeting.s3_audio_path)
-            
-            if not audio_content:
-                logger.error(f"Failed to retrieve audio content (S3 or local): {meeting.s3_audio_path}")
-                self._update_meeting_status(db, meeting.id, TranscriptionStatus.FAILED)
-                return
-            
-            # Create temporary file for audio content
+            # Copy the audio (local file or S3 object) into a temporary file in chunks,
+            # so the recording is never held in memory as a whole.
             # S3 audio is always MP3, but local stitch might be WAV.
             # We'll use the original extension if possible or default to .mp3
             _, ext = os.path.splitext(meeting.s3_audio_path)
@@ -194,11 +207,30 @@ class BackgroundTranscriptionService:
                 ext = '.mp3'
                 
             temp_audio_file = tempfile.NamedTemporaryFile(delete=False, suffix=ext)
-            temp_audio_file.write(audio_content)
-            temp_audio_file.flush()
-            temp_audio_file.close()
+            try:
+                if os.path.exists(meeting.s3_audio_path):
+                    logger.info(f"📁 Local audio file found: {meeting.s3_audio_path}")
+                    with open(meeting.s3_audio_path, 'rb') as source:
+                        shutil.copyfileobj(source, temp_audio_file)
+                else:
+                    logger.info(f"📥 Downloading audio file from S3: {meeting.s3_audio_path}")
+                    for chunk in s3_service.stream_audio_file(meeting.s3_audio_path):
+                        temp_audio_file.write(chunk)
+            except Exception as e:
+                # A partial copy is not usable either
+                logger.error(f"❌ Failed to retrieve audio content: {e}")
+                self._update_meeting_status(db, meeting.id, TranscriptionStatus.FAILED)
+                return
+            finally:
+                temp_audio_file.close()
+            
+            audio_size = os.path.getsize(temp_audio_file.name)
+            if not audio_size:
+                logger.error(f"Failed to retrieve audio content (S3 or local): {meeting.s3_audio_path}")
+                self._update_meeting_status(db, meeting.id, TranscriptionStatus.FAILED)
+                return
             
-            logger.info(f"✅ Audio file downloaded and saved to temporary file: {temp_audio_file.name}")
+            logger.info(f"✅ Audio file ({audio_size} bytes) saved to temporary file: {temp_audio_file.name}")
             
             # Normalize and preprocess audio for better transcription quality
             try:
@@ -369,16 +401,11 @@ class BackgroundTranscriptionService:
             except Exception as duration_error:
                 logger.error(f"❌ [Background] Failed to save duration: {duration_error}")
             
-            # Extract flat analytics from transcript
-            try:
-                logger.info(f"📊 [Background] Calling _extract_flat_meeting_analytics for meeting {meeting.id}")
-                self._extract_flat_meeting_analytics(db, meeting, transcription, participants, duration_minutes)
-                logger.info(f"📊 [Background] Analytics extraction completed for meeting {meeting.id}")
-            except Exception as analytics_error:
-                logger.error(f"❌ [Background] Analytics extraction failed for meeting {meeting.id}: {str(analytics_error)}")
-                import traceback
-                logger.error(f"❌ [Background] Analytics error traceback: {traceback.format_exc()}")
-                raise
+            # Extract flat analytics from transcript (on the analytics pool when the service is running)
+            if self.analytics_executor:
+                self._submit_analytics(meeting.id, transcription, participants, duration_minutes)
+            else:
+                self._run_analytics(meeting.id, transcription, participants, duration_minutes)
             
         except Exception as e:
             logger.error(f"❌ Error processing meeting {meeting.id}: {str(e)}")
@@ -399,13 +426,85 @@ class BackgroundTranscriptionService:
                     logger.warning(f"Failed to clean up temporary file {temp_audio_file.name}: {cleanup_error}")
             db.close()
             
+    def _submit_analytics(self, meeting_id, transcription: List[dict], participants: List[str], duration_minutes: Optional[int]) -> bool:
+        """Queue analytics for a meeting on the analytics pool (False if it is already queued or running)"""
+        with self._analytics_in_flight_lock:
+            if meeting_id in self._analytics_in_flight:
+                return False
+            self._analytics_in_flight.add(meeting_id)
+        try:
+            self.analytics_executor.submit(self._run_claimed_analytics, meeting_id, transcription, participants, duration_minutes)
+        except Exception:
+            self._release_analytics(meeting_id)
+            raise
+        logger.info(f"📊 [Background] Queued analytics extraction for meeting {meeting_id}")
+        return True
+    
+    def _run_claimed_analytics(self, meeting_id, transcription: List[dict], participants: List[str], duration_minutes: Optional[int]):
+        try:
+            self._run_analytics(meeting_id, transcription, participants, duration_minutes)
+        finally:
+            self._release_analytics(meeting_id)
+    
+    def _release_analytics(self, meeting_id):
+        with self._analytics_in_flight_lock:
+            self._analytics_in_flight.discard(meeting_id)
+    
+    def _requeue_orphaned_analytics(self):
+        """Re-submit sync-mode meetings whose queued analytics job was dropped before it ran"""
+        executor = self.analytics_executor
+        if not executor:
+            return
+        now = datetime.now(timezone.utc)
+        with SessionLocal() as db:
+            meetings = db.query(
+                MeetingRecord.id, MeetingRecord.transcription, MeetingRecord.participants, MeetingRecord.duration
+            ).filter(
+                MeetingRecord.analytics_mode == "sync",
+                MeetingRecord.status == TranscriptionStatus.COMPLETED,
+                MeetingRecord.analytics_status == AnalyticsStatus.PENDING,
+                MeetingRecord.transcription.isnot(None),
+                MeetingRecord.s3_audio_path.isnot(None),
+                MeetingRecord.s3_audio_path != "",
+                MeetingRecord.updated_at < now - ORPHANED_ANALYTICS_GRACE,
+                MeetingRecord.updated_at >= now - ORPHANED_ANALYTICS_LOOKBACK
+            ).all()
+        
+        requeued = 0
+        for meeting_id, transcription, participants, duration in meetings:
+            if not participants:
+                participants = self._extract_participants_from_transcription(transcription)
+            if self._submit_analytics(meeting_id, transcription, participants, duration):
+                requeued += 1
+        if requeued:
+            logger.warning(f"📊 [ANALYTICS] Re-queued {requeued} meetings whose analytics job was dropped")
+    
+    def _run_analytics(self, meeting_id, transcription: List[dict], participants: List[str], duration_minutes: Optional[int]):
+        """Extract analytics for a transcribed meeting with its own DB session"""
+        db = SessionLocal()
+        try:
+            meeting = db.query(MeetingRecord).filter(MeetingRecord.id == meeting_id).first()
+            if not meeting:
+                logger.warning(f"⚠️ [Background] Meeting {meeting_id} disappeared before analytics extraction")
+                return
+            logger.info(f"📊 [Background] Calling _extract_flat_meeting_analytics for meeting {meeting_id}")
+            self._extract_flat_meeting_analytics(db, meeting, transcription, participants, duration_minutes)
+            logger.info(f"📊 [Background] Analytics extraction completed for meeting {meeting_id}")
+        except Exception as analytics_error:
+            logger.error(f"❌ [Background] Analytics extraction failed for meeting {meeting_id}: {str(analytics_error)}")
+            import traceback
+            logger.error(f"❌ [Background] Analytics error traceback: {traceback.format_exc()}")
+        finally:
+            db.close()
+    
     def _update_meeting_status(self, db: Session, meeting_id: int, status: TranscriptionStatus):
         """Update meeting status in database"""
         try:
-            meeting = db.query(MeetingRecord).filter(MeetingRecord.id == meeting_id).first()
-            if meeting:
-                meeting.status = status
-                db.commit()
+            updated = db.query(MeetingRecord).filter(MeetingRecord.id == meeting_id).update(
+                {MeetingRecord.status: status}, synchronize_session=False
+            )
+            db.commit()
+            if updated:
                 logger.info(f"Updated meeting {meeting_id} status to {status.value}")
         except Exception as e:
             logger.error(f"Error updating meeting {meeting_id} status: {str(e)}")
@@ -416,14 +515,8 @@ class BackgroundTranscriptionService:
         if not transcription:
             return []
         
-        participants = set()
-        for segment in transcription:
-            if isinstance(segment, dict) and 'speaker' in segment:
-                speaker = segment['speaker']
-                if speaker and speaker not in participants:
-                    participants.add(speaker)
-        
-        return list(participants)
+        # dict.fromkeys dedupes while keeping first-appearance order, so the list is deterministic
+        return list(dict.fromkeys(segment['speaker'] for segment in transcription if isinstance(segment, dict) and segment.get('speaker')))
     
     def _calculate_duration_from_transcription(self, transcription: List[dict]) -> Optional[int]:
         """Calculate meeting duration in minutes from transcription timestamps"""
@@ -481,6 +574,11 @@ class BackgroundTranscriptionService:
             # Detect if this is a mobile meeting (mobile app creates meetings with s3_audio_path)
             is_mobile_meeting = self._is_mobile_meeting(meeting)
             
+            if is_mobile_meeting and meeting.analytics_mode == "batch":
+                # Low-priority meeting: analytics stay PENDING until process_batch_analytics picks them up
+                logger.info(f"📦 [ANALYTICS] Batch analytics mode - deferring meeting {meeting.id} to the next Gemini batch")
+                return
+            
             if is_mobile_meeting:
                 logger.info(f"📱 [ANALYTICS] Mobile meeting detected - using Mobile Audio Analytics")
             else:
@@ -498,7 +596,7 @@ class BackgroundTranscriptionService:
             # Extract analytics using appropriate service based on meeting source
             if is_mobile_meeting:
                 # Use mobile audio analytics for mobile app meetings
-                flat_analytics_data = mobile_audio_analytics.extract_analytics(
+                flat_analytics_data = get_mobile_audio_analytics().extract_analytics(
                     meeting_id=meeting.id,
                     user_email=user_email,
                     meeting_title=meeting.title,
@@ -509,7 +607,7 @@ class BackgroundTranscriptionService:
                 )
             else:
                 # Use flat analytics for extension meetings (video-based)
-                flat_analytics_data = flat_analytics.extract_analytics(
+                flat_analytics_data = get_flat_analytics().extract_analytics(
                     meeting_id=meeting.id,
                     user_email=user_email,
                     meeting_title=meeting.title,
@@ -519,54 +617,7 @@ class BackgroundTranscriptionService:
                     duration_minutes=duration_minutes
                 )
             
-            # Log sentiment before saving
-            logger.info(f"💾 [ANALYTICS] Before saving - sentiment: {flat_analytics_data.get('sentiment', 'NOT_FOUND')}, score: {flat_analytics_data.get('sentiment_score', 'NOT_FOUND')}")
-            logger.info(f"💾 [ANALYTICS] Analytics data keys before save: {list(flat_analytics_data.keys())[:10]}... (total: {len(flat_analytics_data)})")
-            
-            # CRITICAL: Verify sentiment is in the data before saving
-            if 'sentiment' not in flat_analytics_data or 'sentiment_score' not in flat_analytics_data:
-                logger.error(f"❌ [ANALYTICS] CRITICAL ERROR: Sentiment missing from flat_analytics_data before saving!")
-                logger.error(f"❌ [ANALYTICS] Missing keys: sentiment={('sentiment' not in flat_analytics_data)}, sentiment_score={('sentiment_score' not in flat_analytics_data)}")
-                logger.error(f"❌ [ANALYTICS] All keys: {list(flat_analytics_data.keys())}")
-                # Add default sentiment if missing
-                if 'sentiment' not in flat_analytics_data:
-                    flat_analytics_data['sentiment'] = 'neutral'
-                    logger.warning(f"⚠️ [ANALYTICS] Added default sentiment: neutral")
-                if 'sentiment_score' not in flat_analytics_data:
-                    flat_analytics_data['sentiment_score'] = 5.0
-                    logger.warning(f"⚠️ [ANALYTICS] Added default sentiment_score: 5.0")
-            
-            # Update meeting with flat analytics data
-            meeting_update = MeetingRecordUpdate(
-                analytics_status=AnalyticsStatus.COMPLETED,
-                analytics_data=flat_analytics_data
-            )
-            
-            update_meeting_record(db=db, meeting_id=meeting.id, meeting=meeting_update)
-            
-            # Verify what was saved
-            updated_meeting = db.query(MeetingRecord).filter(MeetingRecord.id == meeting.id).first()
-            if updated_meeting and updated_meeting.analytics_data:
-                saved_sentiment = updated_meeting.analytics_data.get('sentiment', 'NOT_FOUND')
-                saved_score = updated_meeting.analytics_data.get('sentiment_score', 'NOT_FOUND')
-                logger.info(f"✅ [ANALYTICS] Verified saved - sentiment: {saved_sentiment}, score: {saved_score}")
-                logger.info(f"✅ [ANALYTICS] Saved analytics data keys: {list(updated_meeting.analytics_data.keys())[:10]}... (total: {len(updated_meeting.analytics_data)})")
-            else:
-                logger.error(f"❌ [ANALYTICS] Failed to verify saved analytics data!")
-            
-            logger.info(f"Successfully extracted flat analytics for meeting {meeting.id}")
-            logger.info(f"Analytics contains {len(flat_analytics_data)} fields")
-            
-            # Send analytics data to dashboard backend
-            try:
-                import asyncio
-                dashboard_success = asyncio.run(dashboard_service.send_analytics_data(flat_analytics_data))
-                if dashboard_success:
-                    logger.info(f"Successfully sent analytics data to dashboard for meeting {meeting.id}")
-                else:
-                    logger.warning(f"Failed to send analytics data to dashboard for meeting {meeting.id}")
-            except Exception as dashboard_error:
-                logger.error(f"Error sending analytics data to dashboard for meeting {meeting.id}: {str(dashboard_error)}")
+            self._save_flat_analytics(db, meeting.id, flat_analytics_data, transcription)
             
 
                 
@@ -577,6 +628,66 @@ class BackgroundTranscriptionService:
             except Exception as update_error:
                 logger.error(f"Failed to update analytics status to FAILED: {update_error}")
     
+    def _save_flat_analytics(self, db: Session, meeting_id, flat_analytics_data: dict, transcription: List[dict]):
+        """Store extracted flat analytics on the meeting and forward them to the dashboard backend"""
+        if flat_analytics_data.get("skipped_reason"):
+            # Nothing was analyzed: store the scoreless result as is and keep it off the dashboard
+            update_meeting_record(db=db, meeting_id=meeting_id, meeting=MeetingRecordUpdate(
+                analytics_status=AnalyticsStatus.COMPLETED,
+                analytics_data=flat_analytics_data
+            ))
+            logger.info(f"⏭️ [ANALYTICS] Analytics skipped for meeting {meeting_id}: {flat_analytics_data['skipped_reason']}")
+            return
+        
+        # Log sentiment before saving
+        logger.info(f"💾 [ANALYTICS] Before saving - sentiment: {flat_analytics_data.get('sentiment', 'NOT_FOUND')}, score: {flat_analytics_data.get('sentiment_score', 'NOT_FOUND')}")
+        logger.info(f"💾 [ANALYTICS] Analytics data keys before save: {list(flat_analytics_data.keys())[:10]}... (total: {len(flat_analytics_data)})")
+        
+        # CRITICAL: Verify sentiment is in the data before saving
+        if 'sentiment' not in flat_analytics_data or 'sentiment_score' not in flat_analytics_data:
+            logger.error(f"❌ [ANALYTICS] CRITICAL ERROR: Sentiment missing from flat_analytics_data before saving!")
+            logger.error(f"❌ [ANALYTICS] Missing keys: sentiment={('sentiment' not in flat_analytics_data)}, sentiment_score={('sentiment_score' not in flat_analytics_data)}")
+            logger.error(f"❌ [ANALYTICS] All keys: {list(flat_analytics_data.keys())}")
+            # Add default sentiment if missing
+            if 'sentiment' not in flat_analytics_data:
+                flat_analytics_data['sentiment'] = 'neutral'
+                logger.warning(f"⚠️ [ANALYTICS] Added default sentiment: neutral")
+            if 'sentiment_score' not in flat_analytics_data:
+                flat_analytics_data['sentiment_score'] = 5.0
+                logger.warning(f"⚠️ [ANALYTICS] Added default sentiment_score: 5.0")
+        
+        # Update meeting with flat analytics data
+        meeting_update = MeetingRecordUpdate(
+            analytics_status=AnalyticsStatus.COMPLETED,
+            analytics_data=flat_analytics_data
+        )
+        
+        update_meeting_record(db=db, meeting_id=meeting_id, meeting=meeting_update)
+        
+        # Verify what was saved
+        updated_meeting = db.query(MeetingRecord).filter(MeetingRecord.id == meeting_id).first()
+        if updated_meeting and updated_meeting.analytics_data:
+            saved_sentiment = updated_meeting.analytics_data.get('sentiment', 'NOT_FOUND')
+            saved_score = updated_meeting.analytics_data.get('sentiment_score', 'NOT_FOUND')
+            logger.info(f"✅ [ANALYTICS] Verified saved - sentiment: {saved_sentiment}, score: {saved_score}")
+            logger.info(f"✅ [ANALYTICS] Saved analytics data keys: {list(updated_meeting.analytics_data.keys())[:10]}... (total: {len(updated_meeting.analytics_data)})")
+        else:
+            logger.error(f"❌ [ANALYTICS] Failed to verify saved analytics data!")
+        
+        logger.info(f"Successfully extracted flat analytics for meeting {meeting_id}")
+        logger.info(f"Analytics contains {len(flat_analytics_data)} fields")
+        
+        # Send analytics data to dashboard backend
+        try:
+            import asyncio
+            dashboard_success = asyncio.run(dashboard_service.send_analytics_data(flat_analytics_data, transcriptions=transcription))
+            if dashboard_success:
+                logger.info(f"Successfully sent analytics data to dashboard for meeting {meeting_id}")
+            else:
+                logger.warning(f"Failed to send analytics data to dashboard for meeting {meeting_id}")
+        except Exception as dashboard_error:
+            logger.error(f"Error sending analytics data to dashboard for meeting {meeting_id}: {str(dashboard_error)}")
+    
     def _is_mobile_meeting(self, meeting: MeetingRecord) -> bool:
         """
         Detect if a meeting is from mobile app or browser extension
@@ -648,6 +759,132 @@ class BackgroundTranscriptionService:
         finally:
             db.close()
             
+    def process_batch_analytics(self) -> dict:
+        """
+        Run mobile analytics for batch-mode meetings through the Gemini Batch API (run periodically by batch_analytics_service).
+        Picks up transcribed meetings with analytics_mode "batch" whose analytics are still pending.
+        """
+        try:
+            mobile_audio_analytics = get_mobile_audio_analytics()
+        except Exception as e:
+            logger.warning(f"⚠️ Mobile Audio Analytics not available: {e}")
+            return {"message": "Mobile audio analytics not available", "processed_count": 0, "total_pending": 0}
+        
+        self._requeue_stale_batch_analytics()
+        
+        # Claim the meetings in a short-lived session that is released before the (up to 24h)
+        # Gemini batch wait; results are saved through their own sessions
+        jobs = self._claim_batch_analytics_jobs()
+        if not jobs:
+            return {
+                "message": "No batch analytics pending",
+                "processed_count": 0,
+                "total_pending": 0
+            }
+        
+        jobs_by_id = {str(job["meeting_id"]): job for job in jobs}
+        saved = set()
+        
+        # Save each meeting as soon as its batch finishes rather than after the slowest batch
+        def save_result(meeting_id: str, flat_analytics_data: dict):
+            job = jobs_by_id[meeting_id]
+            try:
+                with SessionLocal() as save_db:
+                    self._save_flat_analytics(save_db, job["meeting_id"], flat_analytics_data, job["transcript"])
+                saved.add(meeting_id)
+            except Exception as e:
+                logger.error(f"Failed to save batch analytics for meeting {meeting_id}: {str(e)}")
+        
+        try:
+            mobile_audio_analytics.extract_analytics_batch(
+                jobs, timeout_seconds=BATCH_ANALYTICS_TIMEOUT_SECONDS, on_result=save_result
+            )
+        except Exception as e:
+            logger.error(f"❌ [ANALYTICS] Gemini batch failed: {str(e)}")
+        
+        failed_ids = [job["meeting_id"] for key, job in jobs_by_id.items() if key not in saved]
+        if failed_ids:
+            with SessionLocal() as db:
+                try:
+                    db.execute(
+                        update(MeetingRecord)
+                        .where(
+                            MeetingRecord.id.in_(failed_ids),
+                            MeetingRecord.analytics_status == AnalyticsStatus.PROCESSING
+                        )
+                        .values(analytics_status=AnalyticsStatus.FAILED)
+                        .execution_options(synchronize_session=False)
+                    )
+                    db.commit()
+                except Exception as e:
+                    logger.error(f"Failed to mark batch analytics as FAILED: {str(e)}")
+                    db.rollback()
+        
+        processed_count = len(saved)
+        failed_count = len(jobs) - processed_count
+        
+        return {
+            "message": f"Processed {processed_count} meetings, {failed_count} failed",
+            "processed_count": processed_count,
+            "failed_count": failed_count,
+            "total_pending": len(jobs)
+        }
+    
+    def _requeue_stale_batch_analytics(self):
+        """Put batch-mode meetings left in PROCESSING by a run that never finished back to PENDING"""
+        threshold = datetime.now(timezone.utc) - BATCH_ANALYTICS_STALE_AFTER
+        with SessionLocal() as db:
+            try:
+                requeued = db.execute(
+                    update(MeetingRecord)
+                    .where(
+                        MeetingRecord.analytics_mode == "batch",
+                        MeetingRecord.analytics_status == AnalyticsStatus.PROCESSING,
+                        MeetingRecord.updated_at < threshold
+                    )
+                    .values(analytics_status=AnalyticsStatus.PENDING)
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+                db.commit()
+                if requeued:
+                    logger.warning(f"📦 [ANALYTICS] Re-queued {requeued} batch meetings stuck in PROCESSING")
+            except Exception as e:
+                logger.error(f"Failed to re-queue stale batch analytics: {str(e)}")
+                db.rollback()
+    
+    def _claim_batch_analytics_jobs(self) -> List[dict]:
+        """Flip pending batch-mode meetings to PROCESSING and return their extraction jobs"""
+        with SessionLocal() as db:
+            meetings = db.query(MeetingRecord).filter(
+                MeetingRecord.analytics_mode == "batch",
+                MeetingRecord.status == TranscriptionStatus.COMPLETED,
+                MeetingRecord.analytics_status == AnalyticsStatus.PENDING,
+                MeetingRecord.transcription.isnot(None)
+            ).all()
+            
+            if not meetings:
+                return []
+            
+            logger.info(f"📦 [ANALYTICS] Submitting {len(meetings)} meetings for batch analytics")
+            
+            user_ids = {meeting.user_id for meeting in meetings}
+            emails = dict(db.query(User.id, User.email).filter(User.id.in_(user_ids)).all())
+            
+            jobs = []
+            for meeting in meetings:
+                jobs.append({
+                    "meeting_id": meeting.id,
+                    "user_email": emails.get(meeting.user_id, "unknown@example.com"),
+                    "meeting_title": meeting.title,
+                    "meeting_date": meeting.created_at.isoformat(),
+                    "transcript": meeting.transcription,
+                    "participants": meeting.participants,
+                    "duration_minutes": meeting.duration
+                })
+                meeting.analytics_status = AnalyticsStatus.PROCESSING
+            db.commit()
+            return jobs
+    
     def get_status(self) -> dict:
         """Get current status of the background service"""
         db = SessionLocal()
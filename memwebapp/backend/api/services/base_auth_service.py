@@ -9,7 +9,20 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+# Shared client for all OAuth provider calls (token exchanges and user-info lookups),
+# reusing pooled keep-alive connections instead of a fresh TLS handshake per login
+_http_client = httpx.AsyncClient(
+    timeout=httpx.Timeout(10.0),
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+)
+
+async def close_http_client():
+    """Close the shared OAuth HTTP client (called on application shutdown)"""
+    await _http_client.aclose()
+
 class BaseAuthService:
+    http_client = _http_client
+
     def __init__(self, client_id: str, client_secret: str, redirect_uri: str, token_url: str):
         self.client_id = client_id
         self.client_secret = client_secret
@@ -20,37 +33,36 @@ class BaseAuthService:
         """Exchange authorization code for access token (Common Logic)"""
         actual_redirect_uri = redirect_uri or self.redirect_uri
         
-        async with httpx.AsyncClient() as client:
-            data = {
-                "client_id": self.client_id,
-                "client_secret": self.client_secret,
-                "code": auth_code,
-                "redirect_uri": actual_redirect_uri,
-                "grant_type": "authorization_code"
-            }
-            
-            logger.info(f"📤 Sending token request to: {self.token_url}")
+        data = {
+            "client_id": self.client_id,
+            "client_secret": self.client_secret,
+            "code": auth_code,
+            "redirect_uri": actual_redirect_uri,
+            "grant_type": "authorization_code"
+        }
+        
+        logger.info(f"📤 Sending token request to: {self.token_url}")
+        
+        try:
+            response = await self.http_client.post(self.token_url, data=data)
             
-            try:
-                response = await client.post(self.token_url, data=data)
-                
-                if response.status_code != 200:
-                    logger.error(f"❌ Token exchange failed with status: {response.status_code}")
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail=f"Failed to get access token. Status: {response.status_code}, Response: {response.text}"
-                    )
-                
-                token_data = response.json()
-                logger.info("✅ Access token received successfully")
-                return token_data
-                
-            except httpx.HTTPError as e:
-                logger.error(f"❌ HTTP error during token exchange: {str(e)}")
+            if response.status_code != 200:
+                logger.error(f"❌ Token exchange failed with status: {response.status_code}")
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"HTTP error during token exchange: {str(e)}"
+                    detail=f"Failed to get access token. Status: {response.status_code}, Response: {response.text}"
                 )
+            
+            token_data = response.json()
+            logger.info("✅ Access token received successfully")
+            return token_data
+            
+        except httpx.HTTPError as e:
+            logger.error(f"❌ HTTP error during token exchange: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"HTTP error during token exchange: {str(e)}"
+            )
 
     async def get_user_info(self, access_token: str) -> Dict[str, Any]:
         """Abstract method to get user info from provider"""
@@ -61,12 +73,12 @@ class BaseAuthService:
         logger.info(f"🔍 Validating company email: {email}")
         logger.info(f"🔍 Allowed domains: {settings.COMPANY_DOMAINS}")
         
-        # Check if email ends with any of the allowed domains
-        is_valid = any(email.lower().endswith(f"@{domain}") for domain in settings.COMPANY_DOMAINS)
+        # Check the part after the last "@" against the allowed domains
+        domain = email.lower().rpartition("@")[2]
+        is_valid = "@" in email and domain in settings.COMPANY_DOMAINS
         
         if is_valid:
-            matched_domain = next((domain for domain in settings.COMPANY_DOMAINS if email.lower().endswith(f"@{domain}")), None)
-            logger.info(f"✅ Email {email} is valid for domain @{matched_domain}")
+            logger.info(f"✅ Email {email} is valid for domain @{domain}")
         else:
             logger.warning(f"⚠️  Email {email} is not valid for any allowed domains: {settings.COMPANY_DOMAINS}")
         
@@ -0,0 +1,46 @@
+import threading
+import logging
+from config.settings import settings
+from api.services.background_transcription_service import background_service
+
+logger = logging.getLogger(__name__)
+
+class BatchAnalyticsService:
+    """
+    Periodically submits batch-mode mobile meetings (analytics_mode "batch") to the
+    Gemini Batch API. Each run blocks until its batches finish, so runs never overlap.
+    """
+
+    def __init__(self, check_interval_seconds=settings.BATCH_ANALYTICS_INTERVAL_MINUTES * 60):
+        self.check_interval_seconds = check_interval_seconds
+        self.running = False
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run_loop, daemon=True)
+        self.thread.start()
+        logger.info("📦 Batch Analytics Service started")
+
+    def stop(self):
+        self.running = False
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join(timeout=5)
+            logger.info("📦 Batch Analytics Service stopped")
+
+    def _run_loop(self):
+        # First run after one interval, so startup is not slowed down
+        while not self.stop_event.wait(self.check_interval_seconds):
+            try:
+                result = background_service.process_batch_analytics()
+                logger.info(f"📦 Batch analytics run: {result['message']}")
+            except Exception as e:
+                logger.error(f"Error in Batch Analytics loop: {e}", exc_info=True)
+
+# Global instance
+batch_analytics_service = BatchAnalyticsService()
@@ -4,7 +4,7 @@ Dashboard service for sending analytics data to dashboard backend
 import asyncio
 import httpx
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from config.settings import settings
 
@@ -86,13 +86,14 @@ class DashboardService:
         # Need to login
         return await self._login()
     
-    async def send_analytics_data(self, analytics_data: Dict[str, Any], max_retries: int = 3) -> bool:
+    async def send_analytics_data(self, analytics_data: Dict[str, Any], max_retries: int = 3, transcriptions: Optional[List[dict]] = None) -> bool:
         """
         Send analytics data to dashboard backend with retry logic
         
         Args:
             analytics_data: Flat analytics data from FlatMeetingAnalytics
             max_retries: Maximum number of retry attempts
+            transcriptions: Transcript segments for the meeting (falls back to analytics_data["transcriptions"])
             
         Returns:
             bool: True if successful, False otherwise
@@ -107,7 +108,7 @@ class DashboardService:
         for attempt in range(max_retries + 1):
             try:
                 # Map analytics data to dashboard API format
-                dashboard_payload = self._map_to_dashboard_format(analytics_data)
+                dashboard_payload = self._map_to_dashboard_format(analytics_data, transcriptions)
                 
                 # Log the data being sent to dashboard
                 logger.info(f"Sending analytics data to dashboard for meeting {meeting_id}")
@@ -175,12 +176,13 @@ class DashboardService:
         
         return False
     
-    def _map_to_dashboard_format(self, analytics_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _map_to_dashboard_format(self, analytics_data: Dict[str, Any], transcriptions: Optional[List[dict]] = None) -> Dict[str, Any]:
         """
         Map flat analytics data to dashboard API format
         
         Args:
             analytics_data: Flat analytics data from FlatMeetingAnalytics
+            transcriptions: Transcript segments for the meeting (optional)
             
         Returns:
             dict: Mapped data in dashboard API format
@@ -264,7 +266,9 @@ class DashboardService:
             "model_used": analytics_data.get("model_used", "gemini-2.0-flash"),
             "participants": participants_dict,
             "duration_minutes": self._safe_int(analytics_data.get("duration_minutes", 0)),
-            "transcriptions": self._format_transcriptions(analytics_data.get("transcriptions", []))
+            "transcriptions": self._format_transcriptions(
+                transcriptions if transcriptions is not None else analytics_data.get("transcriptions", [])
+            )
         }
         
         logger.info(f"✅ Dashboard payload mapped successfully - {len(dashboard_data)} fields")
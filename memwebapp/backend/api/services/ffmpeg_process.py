@@ -0,0 +1,28 @@
+import subprocess
+import tempfile
+from typing import List, Tuple
+
+def open_ffmpeg_stream(command: List[str]) -> subprocess.Popen:
+    """
+    Start ffmpeg with its output on stdout.
+    stderr goes to a temp file rather than a pipe: a damaged input can log more than a
+    pipe buffer of errors, and ffmpeg would then block on stderr while the caller waits
+    on stdout. The file is exposed as process.stderr for finish_ffmpeg_stream.
+    """
+    stderr_file = tempfile.TemporaryFile()
+    try:
+        process = subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=stderr_file)
+    except Exception:
+        stderr_file.close()
+        raise
+    process.stderr = stderr_file
+    return process
+
+def finish_ffmpeg_stream(process: subprocess.Popen) -> Tuple[int, str]:
+    """Close stdout, wait for ffmpeg to exit and return (returncode, stderr text)"""
+    process.stdout.close()
+    returncode = process.wait()
+    process.stderr.seek(0)
+    stderr = process.stderr.read().decode(errors="replace").strip()
+    process.stderr.close()
+    return returncode, stderr
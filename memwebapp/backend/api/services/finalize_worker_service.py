@@ -0,0 +1,113 @@
+import logging
+import threading
+import time
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from uuid import UUID
+
+import httpx
+from sqlalchemy.exc import OperationalError
+
+from config.settings import settings
+from database.connection import SessionLocal
+from api.services.meeting_service import finalize_meeting_recording
+
+logger = logging.getLogger(__name__)
+
+# Transient failures worth retrying (DB connection drops, upstream HTTP errors)
+RETRYABLE_ERRORS = (OperationalError, httpx.HTTPError)
+
+class FinalizeWorkerService:
+    """
+    Dedicated, bounded worker pool for meeting finalization (stitching, S3 upload,
+    AI suggestions). Keeps this heavy work off the request threadpool, caps how many
+    finalizations run at once and retries transient failures.
+    
+    A meeting is only ever queued or running once: the finalize endpoint and the
+    watchdog both claim the meeting id first, so duplicate triggers do not repeat
+    the S3 upload and LLM calls.
+    """
+
+    def __init__(self, max_workers: int = settings.FINALIZE_MAX_WORKERS, max_retries: int = 3, retry_delay_seconds: float = 10.0):
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.retry_delay_seconds = retry_delay_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="finalize")
+        self._in_flight = set()
+        self._in_flight_lock = threading.Lock()
+
+    def submit(self, meeting_id: UUID) -> Optional[Future]:
+        """Queue a meeting for finalization and return immediately (None if it is already being finalized)"""
+        if not self._try_claim(meeting_id):
+            logger.info(f"⏭️ Meeting {meeting_id} is already being finalized, skipping duplicate request")
+            return None
+        logger.info(f"📥 Queued meeting {meeting_id} for finalization")
+        try:
+            return self._executor.submit(self._run_claimed, meeting_id)
+        except Exception:
+            self._release(meeting_id)
+            raise
+
+    @contextmanager
+    def claim(self, meeting_id: UUID) -> Iterator[bool]:
+        """Claim a meeting for finalization outside the pool; yields False if it is already claimed"""
+        acquired = self._try_claim(meeting_id)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                self._release(meeting_id)
+
+    def _try_claim(self, meeting_id: UUID) -> bool:
+        with self._in_flight_lock:
+            if meeting_id in self._in_flight:
+                return False
+            self._in_flight.add(meeting_id)
+            return True
+
+    def _release(self, meeting_id: UUID):
+        with self._in_flight_lock:
+            self._in_flight.discard(meeting_id)
+
+    def _run_claimed(self, meeting_id: UUID):
+        try:
+            self._run(meeting_id)
+        finally:
+            self._release(meeting_id)
+
+    def stop(self):
+        """Stop accepting work and drop queued (not yet started) finalizations"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.info("🛑 Finalize worker pool stopped")
+
+    def _run(self, meeting_id: UUID):
+        """Finalize a meeting with its own DB session, retrying transient failures"""
+        for attempt in range(1, self.max_retries + 1):
+            logger.info(f"🚀 Starting background finalization for meeting {meeting_id} (attempt {attempt}/{self.max_retries})")
+            db = SessionLocal()
+            try:
+                result = finalize_meeting_recording(db, meeting_id)
+                if result:
+                    logger.info(f"✅ Background finalization completed for meeting {meeting_id}")
+                else:
+                    logger.error(f"❌ Background finalization returned None for meeting {meeting_id}")
+                return
+            except RETRYABLE_ERRORS as e:
+                db.rollback()
+                if attempt == self.max_retries:
+                    logger.error(f"❌ Giving up finalization for meeting {meeting_id} after {attempt} attempts: {e}")
+                    return
+                delay = self.retry_delay_seconds * (2 ** (attempt - 1))
+                logger.warning(f"⚠️ Transient error finalizing meeting {meeting_id}: {e}. Retrying in {delay:.0f}s")
+                time.sleep(delay)
+            except Exception as e:
+                logger.error(f"❌ Error in background finalization for meeting {meeting_id}: {e}")
+                traceback.print_exc()
+                return
+            finally:
+                db.close()
+
+# Global instance
+finalize_worker_service = FinalizeWorkerService()
@@ -2,305 +2,148 @@
 Flat Meeting Analytics - Single JSON structure
 All analytics fields in one flat JSON object for easy dashboard integration
 """
-import json
+import functools
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
+import re
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import google.generativeai as genai
 from config.settings import settings
+from config.logging_config import setup_logging
 
-# Configure logging with timestamps (if not already configured)
-if not logging.getLogger().handlers:
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+# Configure queued logging with timestamps (no-op if already configured)
+setup_logging()
 logger = logging.getLogger(__name__)
 
-class FlatMeetingAnalytics:
-    def __init__(self):
-        """Initialize the analytics extractor with Gemini configuration"""
-        self.model = None
-        if not settings.GEMINI_KEY:
-            logger.warning("GEMINI_KEY not found. Analytics extraction will not be available.")
-            return
-        
-        genai.configure(api_key=settings.GEMINI_KEY)
-        self.model = genai.GenerativeModel('gemini-2.0-flash')
-        logger.info("Flat Meeting Analytics initialized with Gemini 2.0 Flash")
-    
-    def extract_analytics(
-        self,
-        meeting_id: int,
-        user_email: str,
-        meeting_title: str,
-        meeting_date: str,
-        transcript: List[Dict[str, Any]],
-        participants: Optional[List[str]] = None,
-        duration_minutes: Optional[int] = None
-    ) -> Dict[str, Any]:
-        """
-        Extract analytics and return as single flat JSON object
-        
-        Args:
-            meeting_id: ID of the meeting
-            user_email: Email of the user who owns the meeting
-            meeting_title: Title of the meeting
-            meeting_date: Date when the meeting occurred (ISO format string)
-            transcript: List of transcript segments
-            participants: List of participant names (optional)
-            duration_minutes: Meeting duration in minutes (optional)
-        
-        Returns:
-            Single flat JSON object with all analytics fields
-        """
-        start_time = datetime.now()
-        
-        try:
-            logger.info(f"Extracting flat analytics for meeting {meeting_id}: {meeting_title}")
-            
-            # Extract participants and duration from transcript if not provided
-            if not participants:
-                participants = self._extract_participants_from_transcript(transcript)
-            if not duration_minutes:
-                duration_minutes = self._calculate_duration_from_transcript(transcript)
-            
-            logger.info(f"Extracted {len(participants)} participants and {duration_minutes} minutes duration from transcript")
-            
-            # Prepare transcript text
-            transcript_text = self._prepare_transcript_text(transcript)
-            logger.info(f"Prepared transcript with {len(transcript)} segments")
-            
-            # Create prompt for Gemini
-            prompt = self._create_analytics_prompt(transcript_text, meeting_title, participants, duration_minutes)
-            
-            # Extract analytics using Gemini
-            logger.info("Sending request to Gemini for analytics extraction...")
-            logger.info(f"📤 [Sentiment] Prompt includes sentiment analysis: {'meeting_sentiment' in prompt}")
-            response = self.model.generate_content(prompt)
-            
-            if not response.text:
-                raise ValueError("No response generated from Gemini")
-            
-            # Log raw response for debugging (first 500 chars)
-            logger.info(f"📥 [Sentiment] Raw Gemini response (first 500 chars): {response.text[:500]}...")
-            
-            # Parse JSON response
-            analytics_data = self._parse_gemini_response(response.text)
-            
-            # Log what keys we got from Gemini
-            logger.info(f"📋 [Sentiment] Keys in parsed analytics_data: {list(analytics_data.keys())}")
-            
-            # Calculate processing duration
-            processing_duration = (datetime.now() - start_time).total_seconds()
-            
-            # Extract sentiment values with safe fallbacks
-            sentiment_value = "neutral"
-            sentiment_score_value = 5.0
-            
-            try:
-                if "meeting_sentiment" in analytics_data:
-                    sentiment_data = analytics_data["meeting_sentiment"]
-                    sentiment_value = sentiment_data.get("sentiment", "neutral")
-                    sentiment_score_value = sentiment_data.get("sentiment_score", 5.0)
-                    logger.info(f"✅ [Sentiment] Extracted sentiment from Gemini: {sentiment_value} (score: {sentiment_score_value})")
-                else:
-                    logger.warning("⚠️ [Sentiment] meeting_sentiment not found in Gemini response - using defaults (neutral, 5.0)")
-                    logger.warning(f"⚠️ [Sentiment] Available keys in analytics_data: {list(analytics_data.keys())}")
-            except Exception as e:
-                logger.error(f"❌ [Sentiment] Error extracting sentiment data: {e}")
-                logger.error(f"❌ [Sentiment] Using defaults: neutral, 5.0")
-            
-            logger.info(f"📝 [Sentiment] Final extracted values - sentiment: '{sentiment_value}', score: {sentiment_score_value}")
-            
-            # Create single flat JSON object
-            flat_analytics = {
-                # Meeting identification
-                "meeting_id": str(meeting_id),  # Convert UUID to string for JSON serialization
-                "user_email": user_email,
-                "meeting_title": meeting_title,
-                "meeting_date": meeting_date,
-                
-                # Technical Audio Visual Quality (6 fields)
-                "audio_clarity": analytics_data["technical_audio_visual_quality"]["audio_clarity"],
-                "video_quality": analytics_data["technical_audio_visual_quality"]["video_quality"],
-                "connectivity_stability": analytics_data["technical_audio_visual_quality"]["connectivity_stability"],
-                "latency_delay": analytics_data["technical_audio_visual_quality"]["latency_delay"],
-                "mute_unmute_usage": analytics_data["technical_audio_visual_quality"]["mute_unmute_usage"],
-                "screen_sharing_quality": analytics_data["technical_audio_visual_quality"]["screen_sharing_quality"],
-                
-                # Participation Engagement (7 fields)
-                "total_participants": analytics_data["participation_engagement"]["attendance"]["total_participants"],
-                "on_time_participants": analytics_data["participation_engagement"]["attendance"]["on_time"],
-                "late_participants": analytics_data["participation_engagement"]["attendance"]["late"],
-                "avg_duration_minutes": analytics_data["participation_engagement"]["attendance"]["avg_duration_minutes"],
-                "active_participation": analytics_data["participation_engagement"]["active_participation"],
-                "engagement_level": analytics_data["participation_engagement"]["engagement_level"],
-                "chat_contributions": analytics_data["participation_engagement"]["chat_contributions"],
-                "poll_responses": analytics_data["participation_engagement"]["poll_responses"],
-                
-                # Meeting Effectiveness (5 fields)
-                "agenda_coverage": analytics_data["meeting_effectiveness"]["agenda_coverage"],
-                "time_management": analytics_data["meeting_effectiveness"]["time_management"],
-                "action_items_defined": analytics_data["meeting_effectiveness"]["action_items_defined"],
-                "decision_making_efficiency": analytics_data["meeting_effectiveness"]["decision_making_efficiency"],
-                "discussion_relevance": analytics_data["meeting_effectiveness"]["discussion_relevance"],
-                
-                # Engagement & Participation (Specific to UI)
-                "speaking_distribution": analytics_data["participation_engagement"].get("speaking_distribution", 7.0),
-                "listening_quality": analytics_data["participation_engagement"].get("listening_quality", 7.0),
-                "participation_balance": analytics_data["participation_engagement"].get("participation_balance", 7.0),
-                
-                # Audio Insights & Voice Characteristics
-                "key_moments": analytics_data.get("audio_insights", {}).get("key_moments", []),
-                "notable_silences": analytics_data.get("audio_insights", {}).get("notable_silences_count", 0),
-                "energy_shifts": analytics_data.get("audio_insights", {}).get("energy_shifts_count", 0),
-                "speech_patterns": analytics_data.get("audio_insights", {}).get("notable_patterns", []),
-                
-                # Collaboration Communication (5 fields)
-                "clarity_of_communication": analytics_data["collaboration_communication"]["clarity_of_communication"],
-                "inclusiveness": analytics_data["collaboration_communication"]["inclusiveness"],
-                "team_collaboration": analytics_data["collaboration_communication"]["team_collaboration"],
-                "conflict_handling": analytics_data["collaboration_communication"]["conflict_handling"],
-                "cross_department_interactions": analytics_data["collaboration_communication"]["cross_department_interactions"],
-                
-                # Behavioral Professional Aspects (5 fields)
-                "professional_etiquette": analytics_data["behavioral_professional_aspects"]["professional_etiquette"],
-                "camera_discipline": analytics_data["behavioral_professional_aspects"]["camera_discipline"],
-                "non_verbal_cues": analytics_data["behavioral_professional_aspects"]["non_verbal_cues"],
-                "respectful_communication": analytics_data["behavioral_professional_aspects"]["respectful_communication"],
-                "follow_up_ownership": analytics_data["behavioral_professional_aspects"]["follow_up_ownership"],
-                
-                # Security Compliance (4 fields)
-                "meeting_access_control": analytics_data["security_compliance"]["meeting_access_control"],
-                "confidentiality_maintained": analytics_data["security_compliance"]["confidentiality_maintained"],
-                "recording_compliance": analytics_data["security_compliance"]["recording_compliance"],
-                "data_sharing_policies": analytics_data["security_compliance"]["data_sharing_policies"],
-                
-                # Post Meeting Outcomes (4 fields)
-                "meeting_minutes_shared": analytics_data["post_meeting_outcomes"]["meeting_minutes_shared"],
-                "action_items_tracked": analytics_data["post_meeting_outcomes"]["action_items_tracked"],
-                "feedback_collection": analytics_data["post_meeting_outcomes"]["feedback_collection"],
-                "meeting_roi": analytics_data["post_meeting_outcomes"]["meeting_roi"],
-                
-                # Meeting Sentiment (2 fields)
-                "sentiment": sentiment_value,
-                "sentiment_score": sentiment_score_value,
-                
-                # Metadata
-                "extraction_timestamp": datetime.now().isoformat(),
-                "transcript_length": len(transcript),
-                "processing_duration_seconds": processing_duration,
-                "model_used": "gemini-2.0-flash",
-                "participants": participants or [],
-                "duration_minutes": duration_minutes if duration_minutes is not None else 0.0,
-                "transcriptions": transcript  # Include full transcription data
-            }
-            
-            # Log final sentiment values in flat analytics
-            final_sentiment = flat_analytics.get("sentiment", "not_set")
-            final_sentiment_score = flat_analytics.get("sentiment_score", "not_set")
-            logger.info(f"📊 [Sentiment] Final sentiment in flat_analytics: {final_sentiment} (score: {final_sentiment_score})")
-            
-            logger.info(f"Successfully extracted flat analytics for meeting {meeting_id} in {processing_duration:.2f} seconds")
-            return flat_analytics
-            
-        except Exception as e:
-            logger.error(f"Error extracting flat analytics for meeting {meeting_id}: {str(e)}")
-            raise
-    
-    def _extract_participants_from_transcript(self, transcript: List[Dict[str, Any]]) -> List[str]:
-        """Extract unique participants from transcript segments"""
-        if not transcript:
-            return []
-        
-        participants = set()
-        for segment in transcript:
-            if isinstance(segment, dict) and 'speaker' in segment:
-                speaker = segment['speaker']
-                if speaker and speaker not in participants:
-                    participants.add(speaker)
-        
-        return list(participants)
-    
-    def _calculate_duration_from_transcript(self, transcript: List[Dict[str, Any]]) -> Optional[int]:
-        """Calculate meeting duration in minutes from transcript timestamps"""
-        if not transcript:
-            return None
-        
-        try:
-            # Find the maximum end time across all segments
-            max_end_time = 0
-            for segment in transcript:
-                if isinstance(segment, dict) and 'end' in segment:
-                    end_time = segment['end']
-                    if isinstance(end_time, (int, float)):
-                        max_end_time = max(max_end_time, end_time)
-                    elif isinstance(end_time, str):
-                        # Convert timestamp string to seconds
-                        if ':' in end_time:
-                            parts = end_time.split(':')
-                            if len(parts) == 3:  # HH:MM:SS.MS format
-                                hours, minutes, seconds = parts
-                                total_seconds = float(hours) * 3600 + float(minutes) * 60 + float(seconds)
-                            elif len(parts) == 2:  # MM:SS.MS format
-                                minutes, seconds = parts
-                                total_seconds = float(minutes) * 60 + float(seconds)
-                            else:
-                                continue
-                        else:
-                            total_seconds = float(end_time)
-                        
-                        max_end_time = max(max_end_time, total_seconds)
-            
-            # Convert seconds to minutes and round up
-            duration_minutes = int((max_end_time / 60) + 0.5)  # Round up
-            return duration_minutes if duration_minutes > 0 else None
-            
-        except Exception as e:
-            logger.warning(f"Error calculating duration from transcript: {e}")
-            return None
-    
-    def _prepare_transcript_text(self, transcript: List[Dict[str, Any]]) -> str:
-        """Convert transcript segments to readable text"""
-        if not transcript:
-            return ""
-        
-        text_parts = []
-        for segment in transcript:
-            if isinstance(segment, dict):
-                if 'text' in segment:
-                    text_parts.append(segment['text'])
-                elif 'transcript' in segment:
-                    text_parts.append(segment['transcript'])
-                elif 'content' in segment:
-                    text_parts.append(segment['content'])
-            elif isinstance(segment, str):
-                text_parts.append(segment)
-        
-        return " ".join(text_parts)
-    
-    def _create_analytics_prompt(self, transcript_text: str, meeting_title: str, participants: Optional[List[str]], duration_minutes: Optional[int]) -> str:
-        """Create comprehensive prompt for Gemini to extract analytics"""
-        
-        # Build context information
-        context_parts = [f"Meeting Title: {meeting_title}"]
-        if participants:
-            context_parts.append(f"Participants: {', '.join(participants)}")
-        if duration_minutes:
-            context_parts.append(f"Duration: {duration_minutes} minutes")
-        
-        context_info = "\n".join(context_parts)
-        
-        return f"""
+# Shared read-only defaults for optional response sections (avoids allocating per call)
+_EMPTY_DICT = MappingProxyType({})
+_EMPTY_LIST = ()
+
+# [[HH:]MM:]SS[.ms] transcript timestamps
+_TIMESTAMP_RE = re.compile(r'^(?:(?:(\d+):)?(\d+):)?(\d+(?:\.\d+)?)$')
+
+
+@functools.lru_cache(maxsize=4096)
+def _timestamp_to_seconds(timestamp: str) -> Optional[float]:
+    """Convert a transcript timestamp string to seconds, or None if it is malformed"""
+    match = _TIMESTAMP_RE.match(timestamp.strip())
+    if not match:
+        return None
+    hours, minutes, seconds = match.groups()
+    return int(hours or 0) * 3600 + int(minutes or 0) * 60 + float(seconds)
+
+
+def _object(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a response-schema object node where every property is required"""
+    return {"type": "object", "properties": properties, "required": list(properties)}
+
+
+_NUMBER = {"type": "number"}
+_INTEGER = {"type": "integer"}
+_BOOLEAN = {"type": "boolean"}
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+
+# Structured output schema mirroring the JSON layout described in the prompt
+ANALYTICS_RESPONSE_SCHEMA = _object({
+    "technical_audio_visual_quality": _object({
+        "audio_clarity": _NUMBER,
+        "video_quality": _NUMBER,
+        "connectivity_stability": _NUMBER,
+        "latency_delay": _NUMBER,
+        "mute_unmute_usage": _NUMBER,
+        "screen_sharing_quality": _NUMBER,
+    }),
+    "participation_engagement": _object({
+        "attendance": _object({
+            "total_participants": _INTEGER,
+            "on_time": _INTEGER,
+            "late": _INTEGER,
+            "avg_duration_minutes": _NUMBER,
+        }),
+        "active_participation": _NUMBER,
+        "engagement_level": _NUMBER,
+        "speaking_distribution": _NUMBER,
+        "listening_quality": _NUMBER,
+        "participation_balance": _NUMBER,
+        "chat_contributions": _INTEGER,
+        "poll_responses": _INTEGER,
+    }),
+    "meeting_effectiveness": _object({
+        "agenda_coverage": _NUMBER,
+        "time_management": _NUMBER,
+        "action_items_defined": _INTEGER,
+        "decision_making_efficiency": _NUMBER,
+        "discussion_relevance": _NUMBER,
+    }),
+    "collaboration_communication": _object({
+        "clarity_of_communication": _NUMBER,
+        "inclusiveness": _NUMBER,
+        "team_collaboration": _NUMBER,
+        "conflict_handling": _NUMBER,
+        "cross_department_interactions": _NUMBER,
+    }),
+    "behavioral_professional_aspects": _object({
+        "professional_etiquette": _NUMBER,
+        "camera_discipline": _NUMBER,
+        "non_verbal_cues": _NUMBER,
+        "respectful_communication": _NUMBER,
+        "follow_up_ownership": _NUMBER,
+    }),
+    "security_compliance": _object({
+        "meeting_access_control": _BOOLEAN,
+        "confidentiality_maintained": _BOOLEAN,
+        "recording_compliance": _BOOLEAN,
+        "data_sharing_policies": _BOOLEAN,
+    }),
+    "post_meeting_outcomes": _object({
+        "meeting_minutes_shared": _BOOLEAN,
+        "action_items_tracked": _BOOLEAN,
+        "feedback_collection": _INTEGER,
+        "meeting_roi": _NUMBER,
+    }),
+    "meeting_sentiment": _object({
+        "sentiment": {"type": "string"},
+        "sentiment_score": _NUMBER,
+    }),
+    "audio_insights": _object({
+        "key_moments": _STRING_LIST,
+        "notable_silences_count": _INTEGER,
+        "energy_shifts_count": _INTEGER,
+        "notable_patterns": _STRING_LIST,
+    }),
+})
+
+# Long-transcript handling: transcripts estimated above MAX_PROMPT_TOKENS are
+# summarised in CHUNK_TOKENS pieces before the analytics prompt is built
+CHARS_PER_TOKEN = 4
+MAX_PROMPT_TOKENS = 20000
+CHUNK_TOKENS = 8000
+SUMMARY_CACHE_SIZE = 256
+
+_CHUNK_SUMMARY_PROMPT = """
+Summarize the following portion of a meeting transcript. Keep speaker names, key points, decisions,
+action items, disagreements, technical problems mentioned, and the overall tone. Write plain text only.
+
+Transcript portion:
+{chunk}
+"""
+
+# Static analytics prompt, built once at import; only the context and transcript vary per call
+_ANALYTICS_PROMPT_TEMPLATE = """
 You are an expert meeting analyst. Analyze the following meeting transcript and extract comprehensive analytics in the exact JSON format specified below.
 
 Meeting Context:
-{context_info}
+{context}
 
 Meeting Transcript:
-{transcript_text}
+{transcript}
 
 Please analyze this meeting and provide analytics in the following JSON format. For numerical scores, use a 0-10 scale where 10 is excellent and 0 is poor. For percentages, use 0-100. For counts, provide actual numbers. For boolean values, use true/false.
 
@@ -388,24 +231,387 @@ Analysis Guidelines:
    - Score interpretation: 7-10 = positive, 4-6 = neutral, 0-3 = negative
    - The sentiment label should match the score: positive (7-10), neutral (4-6), negative (0-3)
 9. Audio Insights: Identify key moments, notable silences, energy shifts, and notable speech patterns (e.g., filler words, articulation, rhetorical questions)
-
-Provide only the JSON response, no additional text or explanations.
 """
+
+class FlatMeetingAnalytics:
+    def __init__(self):
+        """Initialize the analytics extractor with Gemini configuration"""
+        self.model = None
+        self.summary_model = None
+        self._summary_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._summary_cache_lock = threading.Lock()
+        if not settings.GEMINI_KEY:
+            logger.warning("GEMINI_KEY not found. Analytics extraction will not be available.")
+            return
+        
+        genai.configure(api_key=settings.GEMINI_KEY)
+        # Ask for schema-constrained JSON output so the response needs no bracket scanning
+        self.model = genai.GenerativeModel(
+            'gemini-2.0-flash',
+            generation_config={
+                "response_mime_type": "application/json",
+                "response_schema": ANALYTICS_RESPONSE_SCHEMA,
+            }
+        )
+        # Plain-text model used to condense very long transcripts
+        self.summary_model = genai.GenerativeModel('gemini-2.0-flash')
+        logger.info("Flat Meeting Analytics initialized with Gemini 2.0 Flash")
     
-    def _parse_gemini_response(self, response_text: str) -> Dict[str, Any]:
-        """Parse the JSON response from Gemini"""
+    def warm_up(self) -> None:
+        """Send a one-token request so the first real analytics call does not pay channel setup"""
+        if self.summary_model is None:
+            return
+        try:
+            self.summary_model.generate_content("ping", generation_config={"max_output_tokens": 1})
+            logger.info("Gemini channel warmed up for flat analytics")
+        except Exception as e:
+            logger.warning(f"Gemini warm-up request failed: {e}")
+    
+    def extract_analytics(
+        self,
+        meeting_id: int,
+        user_email: str,
+        meeting_title: str,
+        meeting_date: str,
+        transcript: List[Dict[str, Any]],
+        participants: Optional[List[str]] = None,
+        duration_minutes: Optional[int] = None,
+        include_transcriptions: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Extract analytics and return as single flat JSON object
+        
+        Args:
+            meeting_id: ID of the meeting
+            user_email: Email of the user who owns the meeting
+            meeting_title: Title of the meeting
+            meeting_date: Date when the meeting occurred (ISO format string)
+            transcript: List of transcript segments
+            participants: List of participant names (optional)
+            duration_minutes: Meeting duration in minutes (optional)
+            include_transcriptions: Embed the full transcript under "transcriptions"
+                (by default only a transcript_hash reference is returned)
+        
+        Returns:
+            Single flat JSON object with all analytics fields
+        """
+        start_time = time.perf_counter()
+        
+        try:
+            logger.info("Extracting flat analytics for meeting %s: %s", meeting_id, meeting_title)
+            
+            participants, duration_minutes, prompt = self._prepare_request(transcript, meeting_title, participants, duration_minutes)
+            
+            # Extract analytics using Gemini
+            logger.info("Sending request to Gemini for analytics extraction...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"📤 [Sentiment] Prompt includes sentiment analysis: {'meeting_sentiment' in prompt}")
+            # Stream the response so the transfer overlaps with buffering
+            response_text = "".join(chunk.text for chunk in self.model.generate_content(prompt, stream=True))
+            
+            return self._build_flat_analytics(
+                response_text, start_time, meeting_id, user_email, meeting_title,
+                meeting_date, transcript, participants, duration_minutes, include_transcriptions
+            )
+            
+        except Exception as e:
+            logger.error(f"Error extracting flat analytics for meeting {meeting_id}: {str(e)}")
+            raise
+    
+    def _prepare_request(
+        self,
+        transcript: List[Dict[str, Any]],
+        meeting_title: str,
+        participants: Optional[List[str]],
+        duration_minutes: Optional[int]
+    ) -> Tuple[List[str], Optional[int], str]:
+        """Fill in missing participants/duration from the transcript and build the Gemini prompt"""
+        # Extract participants and duration from transcript if not provided
+        if not participants or not duration_minutes:
+            found_participants, found_duration = self._extract_meta(transcript, need_duration=not duration_minutes)
+            participants = participants or found_participants
+            duration_minutes = duration_minutes or found_duration
+        
+        logger.info("Extracted %d participants and %s minutes duration from transcript", len(participants), duration_minutes)
+        
+        # Prepare transcript text
+        transcript_text = self._condense_transcript_text(self._prepare_transcript_text(transcript))
+        logger.info("Prepared transcript with %d segments", len(transcript))
+        
+        # Create prompt for Gemini
+        prompt = self._create_analytics_prompt(transcript_text, meeting_title, participants, duration_minutes)
+        
+        return participants, duration_minutes, prompt
+    
+    def _build_flat_analytics(
+        self,
+        response_text: str,
+        start_time: float,
+        meeting_id: int,
+        user_email: str,
+        meeting_title: str,
+        meeting_date: str,
+        transcript: List[Dict[str, Any]],
+        participants: List[str],
+        duration_minutes: Optional[int],
+        include_transcriptions: bool = False
+    ) -> Dict[str, Any]:
+        """Parse the Gemini response and flatten it into the single analytics object"""
+        if not response_text:
+            raise ValueError("No response generated from Gemini")
+        
+        # Log raw response for debugging (first 500 chars)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"📥 [Sentiment] Raw Gemini response (first 500 chars): {response_text[:500]}...")
+        
+        # Parse JSON response
+        analytics_data = self._parse_gemini_response(response_text)
+        
+        # Log what keys we got from Gemini
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"📋 [Sentiment] Keys in parsed analytics_data: {list(analytics_data.keys())}")
+        
+        # Calculate processing duration
+        processing_duration = time.perf_counter() - start_time
+        
+        # Extract sentiment values with safe fallbacks
+        sentiment_value = "neutral"
+        sentiment_score_value = 5.0
+        
         try:
-            response_text = response_text.strip()
-            start_idx = response_text.find('{')
-            end_idx = response_text.rfind('}') + 1
+            if "meeting_sentiment" in analytics_data:
+                sentiment_data = analytics_data["meeting_sentiment"]
+                sentiment_value = sentiment_data.get("sentiment", "neutral")
+                sentiment_score_value = sentiment_data.get("sentiment_score", 5.0)
+                logger.debug("✅ [Sentiment] Extracted sentiment from Gemini: %s (score: %s)", sentiment_value, sentiment_score_value)
+            else:
+                logger.warning("⚠️ [Sentiment] meeting_sentiment not found in Gemini response - using defaults (neutral, 5.0)")
+                logger.warning(f"⚠️ [Sentiment] Available keys in analytics_data: {list(analytics_data.keys())}")
+        except Exception as e:
+            logger.error(f"❌ [Sentiment] Error extracting sentiment data: {e}")
+            logger.error(f"❌ [Sentiment] Using defaults: neutral, 5.0")
+        
+        logger.debug("📝 [Sentiment] Final extracted values - sentiment: '%s', score: %s", sentiment_value, sentiment_score_value)
+        
+        audio_insights = analytics_data.get("audio_insights", _EMPTY_DICT)
+        
+        # Create single flat JSON object
+        flat_analytics = {
+            # Meeting identification
+            "meeting_id": str(meeting_id),  # Convert UUID to string for JSON serialization
+            "user_email": user_email,
+            "meeting_title": meeting_title,
+            "meeting_date": meeting_date,
+            
+            # Technical Audio Visual Quality (6 fields)
+            "audio_clarity": analytics_data["technical_audio_visual_quality"]["audio_clarity"],
+            "video_quality": analytics_data["technical_audio_visual_quality"]["video_quality"],
+            "connectivity_stability": analytics_data["technical_audio_visual_quality"]["connectivity_stability"],
+            "latency_delay": analytics_data["technical_audio_visual_quality"]["latency_delay"],
+            "mute_unmute_usage": analytics_data["technical_audio_visual_quality"]["mute_unmute_usage"],
+            "screen_sharing_quality": analytics_data["technical_audio_visual_quality"]["screen_sharing_quality"],
+            
+            # Participation Engagement (7 fields)
+            "total_participants": analytics_data["participation_engagement"]["attendance"]["total_participants"],
+            "on_time_participants": analytics_data["participation_engagement"]["attendance"]["on_time"],
+            "late_participants": analytics_data["participation_engagement"]["attendance"]["late"],
+            "avg_duration_minutes": analytics_data["participation_engagement"]["attendance"]["avg_duration_minutes"],
+            "active_participation": analytics_data["participation_engagement"]["active_participation"],
+            "engagement_level": analytics_data["participation_engagement"]["engagement_level"],
+            "chat_contributions": analytics_data["participation_engagement"]["chat_contributions"],
+            "poll_responses": analytics_data["participation_engagement"]["poll_responses"],
+            
+            # Meeting Effectiveness (5 fields)
+            "agenda_coverage": analytics_data["meeting_effectiveness"]["agenda_coverage"],
+            "time_management": analytics_data["meeting_effectiveness"]["time_management"],
+            "action_items_defined": analytics_data["meeting_effectiveness"]["action_items_defined"],
+            "decision_making_efficiency": analytics_data["meeting_effectiveness"]["decision_making_efficiency"],
+            "discussion_relevance": analytics_data["meeting_effectiveness"]["discussion_relevance"],
+            
+            # Engagement & Participation (Specific to UI)
+            "speaking_distribution": analytics_data["participation_engagement"].get("speaking_distribution", 7.0),
+            "listening_quality": analytics_data["participation_engagement"].get("listening_quality", 7.0),
+            "participation_balance": analytics_data["participation_engagement"].get("participation_balance", 7.0),
+            
+            # Audio Insights & Voice Characteristics
+            "key_moments": audio_insights.get("key_moments", _EMPTY_LIST),
+            "notable_silences": audio_insights.get("notable_silences_count", 0),
+            "energy_shifts": audio_insights.get("energy_shifts_count", 0),
+            "speech_patterns": audio_insights.get("notable_patterns", _EMPTY_LIST),
+            
+            # Collaboration Communication (5 fields)
+            "clarity_of_communication": analytics_data["collaboration_communication"]["clarity_of_communication"],
+            "inclusiveness": analytics_data["collaboration_communication"]["inclusiveness"],
+            "team_collaboration": analytics_data["collaboration_communication"]["team_collaboration"],
+            "conflict_handling": analytics_data["collaboration_communication"]["conflict_handling"],
+            "cross_department_interactions": analytics_data["collaboration_communication"]["cross_department_interactions"],
+            
+            # Behavioral Professional Aspects (5 fields)
+            "professional_etiquette": analytics_data["behavioral_professional_aspects"]["professional_etiquette"],
+            "camera_discipline": analytics_data["behavioral_professional_aspects"]["camera_discipline"],
+            "non_verbal_cues": analytics_data["behavioral_professional_aspects"]["non_verbal_cues"],
+            "respectful_communication": analytics_data["behavioral_professional_aspects"]["respectful_communication"],
+            "follow_up_ownership": analytics_data["behavioral_professional_aspects"]["follow_up_ownership"],
             
-            if start_idx == -1 or end_idx == 0:
-                raise ValueError("No JSON found in response")
+            # Security Compliance (4 fields)
+            "meeting_access_control": analytics_data["security_compliance"]["meeting_access_control"],
+            "confidentiality_maintained": analytics_data["security_compliance"]["confidentiality_maintained"],
+            "recording_compliance": analytics_data["security_compliance"]["recording_compliance"],
+            "data_sharing_policies": analytics_data["security_compliance"]["data_sharing_policies"],
             
-            json_text = response_text[start_idx:end_idx]
-            return json.loads(json_text)
+            # Post Meeting Outcomes (4 fields)
+            "meeting_minutes_shared": analytics_data["post_meeting_outcomes"]["meeting_minutes_shared"],
+            "action_items_tracked": analytics_data["post_meeting_outcomes"]["action_items_tracked"],
+            "feedback_collection": analytics_data["post_meeting_outcomes"]["feedback_collection"],
+            "meeting_roi": analytics_data["post_meeting_outcomes"]["meeting_roi"],
             
-        except json.JSONDecodeError as e:
+            # Meeting Sentiment (2 fields)
+            "sentiment": sentiment_value,
+            "sentiment_score": sentiment_score_value,
+            
+            # Metadata
+            "extraction_timestamp": datetime.now().isoformat(),
+            "transcript_length": len(transcript),
+            "processing_duration_seconds": processing_duration,
+            "model_used": "gemini-2.0-flash",
+            "participants": participants or [],
+            "duration_minutes": duration_minutes if duration_minutes is not None else 0.0,
+            # Reference the transcript instead of copying it; the meeting record already stores it
+            "transcript_hash": hashlib.blake2b(orjson.dumps(transcript), digest_size=16).hexdigest()
+        }
+        if include_transcriptions:
+            flat_analytics["transcriptions"] = transcript
+        
+        logger.info(
+            "Successfully extracted flat analytics for meeting %s in %.2f seconds (sentiment: %s, score: %s)",
+            meeting_id, processing_duration, sentiment_value, sentiment_score_value
+        )
+        return flat_analytics
+    
+    def _extract_meta(self, transcript: List[Dict[str, Any]], need_duration: bool = True) -> Tuple[List[str], Optional[int]]:
+        """
+        Extract unique participants and duration in minutes in a single pass over the transcript
+        
+        Timestamp parsing dominates the loop, so it is skipped entirely when the
+        caller already knows the duration (need_duration=False).
+        """
+        if not transcript:
+            return [], None
+        
+        # Ordered-unique speakers (dict keys keep first-appearance order)
+        participants = {}
+        max_end_time = 0.0
+        for segment in transcript:
+            if not isinstance(segment, dict):
+                continue
+            get = segment.get
+            speaker = get('speaker')
+            if speaker:
+                participants[speaker] = None
+            if not need_duration:
+                continue
+            end_time = get('end')
+            if isinstance(end_time, (int, float)):
+                seconds = end_time
+            elif isinstance(end_time, str):
+                seconds = _timestamp_to_seconds(end_time)
+                if seconds is None:
+                    continue
+            else:
+                continue
+            if seconds > max_end_time:
+                max_end_time = seconds
+        
+        if not need_duration:
+            return list(participants), None
+        
+        # Convert seconds to minutes and round to nearest
+        duration_minutes = int((max_end_time / 60) + 0.5)
+        return list(participants), (duration_minutes if duration_minutes > 0 else None)
+    
+    def _prepare_transcript_text(self, transcript: List[Dict[str, Any]]) -> str:
+        """Convert transcript segments to readable text"""
+        if not transcript:
+            return ""
+        
+        return " ".join(
+            (segment.get('text') or segment.get('transcript') or segment.get('content') or '')
+            if isinstance(segment, dict) else segment
+            for segment in transcript
+            if isinstance(segment, (dict, str))
+        )
+    
+    def _condense_transcript_text(self, transcript_text: str) -> str:
+        """
+        Map-reduce very long transcripts into chunk summaries so the analytics
+        prompt stays bounded regardless of meeting length
+        """
+        if len(transcript_text) // CHARS_PER_TOKEN <= MAX_PROMPT_TOKENS:
+            return transcript_text
+        
+        chunks = self._split_transcript_text(transcript_text, CHUNK_TOKENS * CHARS_PER_TOKEN)
+        logger.info(f"Transcript too long for a single prompt (~{len(transcript_text) // CHARS_PER_TOKEN} tokens); summarising {len(chunks)} chunks")
+        with ThreadPoolExecutor(max_workers=min(4, len(chunks))) as executor:
+            summaries = list(executor.map(self._summarize_chunk, chunks))
+        return "\n\n".join(summaries)
+    
+    def _split_transcript_text(self, text: str, chunk_chars: int) -> List[str]:
+        """Split text into chunks of at most chunk_chars, breaking on whitespace where possible"""
+        chunks = []
+        start = 0
+        length = len(text)
+        while start < length:
+            end = min(start + chunk_chars, length)
+            if end < length:
+                space = text.rfind(' ', start, end)
+                if space > start:
+                    end = space
+            chunks.append(text[start:end])
+            start = end
+        return chunks
+    
+    def _summarize_chunk(self, chunk: str) -> str:
+        """Summarise one transcript chunk, reusing cached summaries for identical chunks"""
+        key = hashlib.blake2b(chunk.encode(), digest_size=16).hexdigest()
+        # Shared by the chunk workers and concurrent analytics threads
+        with self._summary_cache_lock:
+            cached = self._summary_cache.get(key)
+            if cached is not None:
+                self._summary_cache.move_to_end(key)
+                return cached
+        
+        response = self.summary_model.generate_content(_CHUNK_SUMMARY_PROMPT.format(chunk=chunk))
+        summary = response.text.strip()
+        
+        with self._summary_cache_lock:
+            self._summary_cache[key] = summary
+            self._summary_cache.move_to_end(key)
+            if len(self._summary_cache) > SUMMARY_CACHE_SIZE:
+                self._summary_cache.popitem(last=False)
+        return summary
+    
+    def _create_analytics_prompt(self, transcript_text: str, meeting_title: str, participants: Optional[List[str]], duration_minutes: Optional[int]) -> str:
+        """Create comprehensive prompt for Gemini to extract analytics"""
+        
+        # Build context information
+        context_parts = [f"Meeting Title: {meeting_title}"]
+        if participants:
+            context_parts.append(f"Participants: {', '.join(participants)}")
+        if duration_minutes:
+            context_parts.append(f"Duration: {duration_minutes} minutes")
+        
+        context_info = "\n".join(context_parts)
+        
+        return _ANALYTICS_PROMPT_TEMPLATE.format(context=context_info, transcript=transcript_text)
+    
+    def _parse_gemini_response(self, response_text: str) -> Dict[str, Any]:
+        """Parse the JSON response from Gemini"""
+        try:
+            # The model is configured with a JSON response schema,
+            # so the text is already a bare JSON document
+            return orjson.loads(response_text.encode())
+            
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON from Gemini response: {e}")
             logger.error(f"Response text: {response_text}")
             raise ValueError(f"Invalid JSON response from Gemini: {e}")
@@ -413,9 +619,18 @@ Provide only the JSON response, no additional text or explanations.
             logger.error(f"Error parsing Gemini response: {e}")
             raise ValueError(f"Failed to parse Gemini response: {e}")
 
-# Global instance - ready to use
-try:
-    flat_analytics = FlatMeetingAnalytics()
-except Exception as e:
-    logger.warning(f"Flat Meeting Analytics not available: {e}")
-    flat_analytics = None
\ No newline at end of file
+_flat_analytics: Optional[FlatMeetingAnalytics] = None
+_flat_analytics_lock = threading.Lock()
+
+def get_flat_analytics() -> FlatMeetingAnalytics:
+    """
+    Return the shared FlatMeetingAnalytics, created on first use so importing this
+    module does not configure Gemini. Construction errors propagate to the caller.
+    """
+    global _flat_analytics
+    # Double-checked so the warm-up thread and the analytics pool share one instance
+    if _flat_analytics is None:
+        with _flat_analytics_lock:
+            if _flat_analytics is None:
+                _flat_analytics = FlatMeetingAnalytics()
+    return _flat_analytics
@@ -1,21 +1,82 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, String
-from typing import List, Optional, Tuple
-from uuid import UUID
+from sqlalchemy.orm import Session, defer
+from sqlalchemy import and_, or_, Text, insert, update, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from typing import BinaryIO, List, Optional, Tuple
+from uuid import UUID, uuid4
 from datetime import datetime
 from api.models.meeting import MeetingRecord, TranscriptionStatus, AnalyticsStatus
+from api.models.speaker_profile import SpeakerProfile
 from api.schemas.meeting import MeetingRecordCreate, MeetingRecordUpdate
 from api.services.audio_service import AudioProcessor
 from api.services.s3_service import s3_service
+from api.services.ffmpeg_process import finish_ffmpeg_stream
+import asyncio
 import os
-import uuid
+import re
+import shutil
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import aiofiles
 from fastapi import HTTPException, UploadFile
 from api.services.ai_suggestion_service import ai_suggestion_service
 from api.services.template_service import get_template
+from database.connection import SessionLocal
 
 logger = logging.getLogger(__name__)
 
+# Shared audio processor (stateless between calls, like s3_service / ai_suggestion_service)
+audio_processor = AudioProcessor()
+
+UPLOADS_DIR = "uploads"
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Titles the browser extension generates from the call window ("Google Meet: ...", "Zoom: ...")
+_AUTO_TITLE_RE = re.compile(r'(?:google meet|microsoft teams|teams|zoom):')
+
+def _unlink(path: Optional[str]) -> None:
+    """Remove a temp file if it exists; None paths and already-removed files are ignored"""
+    try:
+        os.remove(path)
+    except (FileNotFoundError, TypeError):
+        pass
+
+def _temp_upload_path(filename: str) -> str:
+    """Per-request temp path, so concurrent uploads with the same file name do not collide"""
+    return os.path.join("temp_audio", f"{uuid4().hex}_{os.path.basename(filename)}")
+
+async def _stream_to_disk(upload: UploadFile, path: str, chunk_size: int = UPLOAD_CHUNK_SIZE) -> None:
+    """Copy an uploaded file to disk chunk by chunk so memory stays bounded"""
+    async with aiofiles.open(path, "wb") as buffer:
+        while chunk := await upload.read(chunk_size):
+            await buffer.write(chunk)
+
+def _merge_and_upload_audio(
+    audio_processor: AudioProcessor,
+    primary_file_path: str,
+    secondary_file_path: str,
+    meeting_uuid: str,
+    filename: str
+) -> Optional[str]:
+    """Mix both recordings with ffmpeg and stream the MP3 output to S3 without a local merged file"""
+    process = audio_processor.open_merged_audio_stream(primary_file_path, secondary_file_path)
+    s3_audio_path = None
+    try:
+        s3_audio_path = s3_service.upload_audio_stream(process.stdout, meeting_uuid, filename)
+    finally:
+        returncode, stderr = finish_ffmpeg_stream(process)
+    
+    if returncode != 0:
+        logger.error(f"❌ ffmpeg merge failed (exit {returncode}): {stderr}")
+        if s3_audio_path:
+            s3_service.delete_audio_file(s3_audio_path)
+        raise Exception(f"Failed to merge audio files: {stderr or f'ffmpeg exited with {returncode}'}")
+    
+    logger.info(f"✅ Audio files merged and streamed to S3: {s3_audio_path}")
+    return s3_audio_path
+
 async def create_meeting_with_audio(
     db: Session,
     title: str,
@@ -28,29 +89,25 @@ async def create_meeting_with_audio(
     user_id: int
 ) -> MeetingRecord:
     """
-    Create a new meeting record with audio processing (validation, merging, upload)
+    Create a new meeting record with audio processing (validation, merging, upload).
+    The merge/S3 upload and the meeting INSERT are independent round-trips, so they run
+    concurrently; the audio path is then set with a single UPDATE.
     """
-    audio_processor = AudioProcessor()
-    uploads_dir = "uploads"
-    os.makedirs(uploads_dir, exist_ok=True)
+    os.makedirs(UPLOADS_DIR, exist_ok=True)
     
-    # Generate unique meeting UUID
-    meeting_uuid = str(uuid.uuid4())
-    
-    transcription = None
-    summary = None
-    key_points = None
+    # The meeting id is generated up front so the S3 key does not wait for the INSERT
+    meeting_id = uuid4()
+    meeting_id_str = str(meeting_id)
     
     # Save primary audio file temporarily
-    primary_file_path = f"temp_audio/{audio_file.filename}"
+    primary_file_path = _temp_upload_path(audio_file.filename)
     os.makedirs("temp_audio", exist_ok=True)
     
     logger.info(f"💾 Saving primary audio file temporarily to: {primary_file_path}")
-    with open(primary_file_path, "wb") as buffer:
-        content = await audio_file.read()
-        buffer.write(content)
+    await _stream_to_disk(audio_file, primary_file_path)
     
     primary_file_extension = audio_file.filename.split(".")[-1].lower() if "." in audio_file.filename else "unknown"
+    audio_filename = f"meeting_{meeting_id_str}.{primary_file_extension}"
     
     # Validate primary audio file validation
     logger.info("🔍 Validating primary audio file...")
@@ -58,22 +115,59 @@ async def create_meeting_with_audio(
         audio_processor.validate_audio_file(primary_file_path)
     except Exception as e:
         logger.error(f"❌ Primary audio file validation failed: {e}")
-        if os.path.exists(primary_file_path):
-            os.remove(primary_file_path)
+        _unlink(primary_file_path)
         raise HTTPException(status_code=400, detail=f"Invalid primary audio file: {str(e)}")
     
     # Handle secondary audio file if provided
     secondary_file_path = None
     final_audio_path = None
     
+    def upload_audio() -> Optional[str]:
+        nonlocal final_audio_path
+        if secondary_file_path:
+            # Merge audio files, streaming ffmpeg output straight into a multipart S3 upload
+            logger.info("🎵 Merging primary and secondary audio files into S3...")
+            return _merge_and_upload_audio(
+                audio_processor,
+                primary_file_path,
+                secondary_file_path,
+                meeting_id_str,
+                audio_filename
+            )
+        
+        # No secondary audio, just move primary audio to final location
+        final_audio_path = os.path.join(UPLOADS_DIR, audio_filename)
+        os.replace(primary_file_path, final_audio_path)
+        logger.info(f"📁 Primary audio file moved to: {final_audio_path}")
+        
+        # Upload audio file to S3
+        logger.info("☁️ Uploading audio file to S3...")
+        return s3_service.upload_audio_file(
+            file_path=final_audio_path,
+            meeting_uuid=meeting_id_str,
+            filename=audio_filename
+        )
+    
+    # Inserted without audio; the transcription worker only picks up rows with an S3 path
+    meeting_data = MeetingRecordCreate(
+        title=title,
+        description=description,
+        participants=participants or [],
+        templateid=templateid,
+        custom_template_points=custom_template_points,
+        transcription=None,
+        summary=None,
+        key_points=None,
+        audio_filename=None,
+        s3_audio_path=None
+    )
+    
     try:
         if second_audio_file and second_audio_file.filename:
-            secondary_file_path = f"temp_audio/{second_audio_file.filename}"
+            secondary_file_path = _temp_upload_path(second_audio_file.filename)
             
             logger.info(f"💾 Saving secondary audio file temporarily to: {secondary_file_path}")
-            with open(secondary_file_path, "wb") as buffer:
-                content = await second_audio_file.read()
-                buffer.write(content)
+            await _stream_to_disk(second_audio_file, secondary_file_path)
             
             # Validate secondary audio file
             logger.info("🔍 Validating secondary audio file...")
@@ -83,66 +177,52 @@ async def create_meeting_with_audio(
             except Exception as e:
                 logger.error(f"❌ Secondary audio file validation failed: {e}")
                 raise HTTPException(status_code=400, detail=f"Invalid secondary audio file: {str(e)}")
-            
-            # Merge audio files
-            logger.info("🎵 Merging primary and secondary audio files...")
-            merged_filename = f"meeting_{meeting_uuid}.{primary_file_extension}"
-            final_audio_path = os.path.join(uploads_dir, merged_filename)
-            
-            audio_processor.merge_audio_files(primary_file_path, secondary_file_path, final_audio_path)
-            logger.info(f"✅ Audio files merged successfully: {final_audio_path}")
-            
-        else:
-            # No secondary audio, just move primary audio to final location
-            final_audio_path = os.path.join(uploads_dir, f"meeting_{meeting_uuid}.{primary_file_extension}")
-            os.rename(primary_file_path, final_audio_path)
-            logger.info(f"📁 Primary audio file moved to: {final_audio_path}")
         
-        # Upload audio file to S3
-        logger.info("☁️ Uploading audio file to S3...")
-        s3_audio_path = s3_service.upload_audio_file(
-            file_path=final_audio_path,
-            meeting_uuid=meeting_uuid,
-            filename=os.path.basename(final_audio_path)
+        upload_result, insert_result = await asyncio.gather(
+            asyncio.to_thread(upload_audio),
+            asyncio.to_thread(create_meeting_record, db=db, meeting=meeting_data, user_id=user_id, meeting_id=meeting_id),
+            return_exceptions=True
         )
         
+        s3_audio_path = upload_result if not isinstance(upload_result, BaseException) else None
+        db_meeting = insert_result if not isinstance(insert_result, BaseException) else None
+        
+        if isinstance(insert_result, BaseException):
+            # Nothing references the uploaded object without the row
+            db.rollback()
+            if s3_audio_path:
+                s3_service.delete_audio_file(s3_audio_path)
+            raise insert_result
+        
         if not s3_audio_path:
+            # The row must not outlive a failed upload, as if it had never been created
+            db.delete(db_meeting)
+            db.commit()
+            if isinstance(upload_result, HTTPException):
+                raise upload_result
+            if isinstance(upload_result, BaseException):
+                logger.error(f"❌ Audio upload failed for meeting {meeting_id}: {upload_result}")
             raise HTTPException(status_code=500, detail="Failed to upload audio file to S3")
         
         logger.info(f"✅ Audio file uploaded to S3: {s3_audio_path}")
         
-        # Cleanup final local file
-        if os.path.exists(final_audio_path):
-            os.remove(final_audio_path)
-            
-    except Exception as e:
-        # Cleanup on error
-        if os.path.exists(primary_file_path): os.remove(primary_file_path)
-        if secondary_file_path and os.path.exists(secondary_file_path): os.remove(secondary_file_path)
-        if final_audio_path and os.path.exists(final_audio_path): os.remove(final_audio_path)
-        raise e
-    
-    # Finally clean up temp source files if they still exist (e.g. if merge succeeded)
-    if os.path.exists(primary_file_path): os.remove(primary_file_path)
-    if secondary_file_path and os.path.exists(secondary_file_path): os.remove(secondary_file_path)
-
-    # Create meeting record
-    meeting_data = MeetingRecordCreate(
-        title=title,
-        description=description,
-        participants=participants or [],
-        templateid=templateid,
-        custom_template_points=custom_template_points,
-        transcription=None,
-        summary=None,
-        key_points=None,
-        audio_filename=os.path.basename(final_audio_path),
-        s3_audio_path=s3_audio_path
-    )
+        db.query(MeetingRecord).filter(MeetingRecord.id == meeting_id).update({
+            MeetingRecord.audio_filename: audio_filename,
+            MeetingRecord.s3_audio_path: s3_audio_path
+        }, synchronize_session=False)
+        db.commit()
+        db_meeting.audio_filename = audio_filename
+        db_meeting.s3_audio_path = s3_audio_path
+        
+    finally:
+        # Clean up temp source files and the local final file
+        _unlink(primary_file_path)
+        _unlink(secondary_file_path)
+        _unlink(final_audio_path)
     
-    return create_meeting_record(db=db, meeting=meeting_data, user_id=user_id)
+    return db_meeting
 
-def create_meeting_record(db: Session, meeting: MeetingRecordCreate, user_id: int, initial_status: Optional[TranscriptionStatus] = None) -> MeetingRecord:
+def create_meeting_record(db: Session, meeting: MeetingRecordCreate, user_id: int, initial_status: Optional[TranscriptionStatus] = None, meeting_id: Optional[UUID] = None) -> MeetingRecord:
     """Create a new meeting record"""
     # Determine initial status based on whether audio processing is complete
     has_audio = bool(meeting.audio_filename)
@@ -158,6 +238,7 @@ def create_meeting_record(db: Session, meeting: MeetingRecordCreate, user_id: in
         status = TranscriptionStatus.PENDING
     
     db_meeting = MeetingRecord(
+        id=meeting_id,
         title=meeting.title,
         description=meeting.description,
         participants=meeting.participants,
@@ -177,6 +258,29 @@ def create_meeting_record(db: Session, meeting: MeetingRecordCreate, user_id: in
     db.refresh(db_meeting)
     return db_meeting
 
+def bulk_create_meeting_records(db: Session, meetings: List[MeetingRecordCreate], user_id: int) -> int:
+    """
+    Create many meeting records in one batched INSERT (for import/seed paths).
+    Status and is_processed follow the same rules as create_meeting_record.
+    Returns the number of rows inserted.
+    """
+    if not meetings:
+        return 0
+    
+    rows = []
+    for meeting in meetings:
+        has_processing = bool(meeting.transcription or meeting.summary or meeting.key_points)
+        rows.append({
+            **meeting.dict(),
+            "user_id": user_id,
+            "is_processed": has_processing,
+            "status": TranscriptionStatus.COMPLETED if has_processing else TranscriptionStatus.PENDING
+        })
+    
+    db.execute(insert(MeetingRecord), rows)
+    db.commit()
+    return len(rows)
+
 def get_meeting_record(db: Session, meeting_id: UUID) -> Optional[MeetingRecord]:
     """Get a meeting record by ID"""
     return db.query(MeetingRecord).filter(MeetingRecord.id == meeting_id).first()
@@ -198,10 +302,6 @@ def get_meeting_record_by_user(db: Session, meeting_id: UUID, user_id: int) -> O
 
 def update_meeting_record(db: Session, meeting_id: UUID, meeting: MeetingRecordUpdate) -> Optional[MeetingRecord]:
     """Update a meeting record"""
-    db_meeting = get_meeting_record(db, meeting_id)
-    if not db_meeting:
-        return None
-    
     update_data = meeting.dict(exclude_unset=True)
     
     # Update is_processed flag and status if audio processing fields are updated
@@ -211,11 +311,17 @@ def update_meeting_record(db: Session, meeting_id: UUID, meeting: MeetingRecordU
         if 'status' not in update_data:
             update_data['status'] = TranscriptionStatus.COMPLETED
     
-    for field, value in update_data.items():
-        setattr(db_meeting, field, value)
+    if not update_data:
+        return get_meeting_record(db, meeting_id)
     
+    # Single UPDATE ... RETURNING instead of SELECT + UPDATE + refresh
+    db_meeting = db.execute(
+        update(MeetingRecord)
+        .where(MeetingRecord.id == meeting_id)
+        .values(**update_data)
+        .returning(MeetingRecord)
+    ).scalar_one_or_none()
     db.commit()
-    db.refresh(db_meeting)
     return db_meeting
 
 def delete_meeting_record(db: Session, meeting_id: UUID) -> bool:
@@ -228,27 +334,30 @@ def delete_meeting_record(db: Session, meeting_id: UUID) -> bool:
     db.commit()
     return True
 
+def _text_search_clause(query: str):
+    """
+    ILIKE match on title, participants and transcription.
+    JSON columns are cast to TEXT (not VARCHAR) so the expressions match the
+    pg_trgm GIN indexes on title, participants::text and transcription::text.
+    """
+    search_term = f"%{query}%"
+    return or_(
+        MeetingRecord.title.ilike(search_term),
+        MeetingRecord.participants.cast(Text).ilike(search_term),
+        MeetingRecord.transcription.cast(Text).ilike(search_term)
+    )
+
 def search_meeting_records(db: Session, query: str, skip: int = 0, limit: int = 100) -> List[MeetingRecord]:
     """Search meeting records by title, participants, and transcription speaker names"""
-    search_term = f"%{query}%"
     return db.query(MeetingRecord).filter(
-        or_(
-            MeetingRecord.title.ilike(search_term),
-            MeetingRecord.participants.cast(String).ilike(search_term),
-            MeetingRecord.transcription.cast(String).ilike(search_term)
-        )
+        _text_search_clause(query)
     ).offset(skip).limit(limit).all()
 
 def search_meeting_records_by_user(db: Session, user_id: int, query: str, skip: int = 0, limit: int = 100) -> List[MeetingRecord]:
     """Search meeting records by title, participants, and transcription speaker names for a specific user"""
-    search_term = f"%{query}%"
     return db.query(MeetingRecord).filter(
         MeetingRecord.user_id == user_id,
-        or_(
-            MeetingRecord.title.ilike(search_term),
-            MeetingRecord.participants.cast(String).ilike(search_term),
-            MeetingRecord.transcription.cast(String).ilike(search_term)
-        )
+        _text_search_clause(query)
     ).offset(skip).limit(limit).all()
 
 def get_meetings_by_date_range(db: Session, start_date: str, end_date: str, skip: int = 0, limit: int = 100) -> List[MeetingRecord]:
@@ -289,15 +398,19 @@ def get_pending_meetings_with_audio(db: Session) -> List[MeetingRecord]:
 
 def update_meeting_status(db: Session, meeting_id: UUID, status: TranscriptionStatus) -> Optional[MeetingRecord]:
     """Update meeting transcription status"""
-    db_meeting = get_meeting_record(db, meeting_id)
-    if not db_meeting:
-        return None
-    
-    db_meeting.status = status
+    db_meeting = db.execute(
+        update(MeetingRecord)
+        .where(MeetingRecord.id == meeting_id)
+        .values(status=status)
+        .returning(MeetingRecord)
+    ).scalar_one_or_none()
     db.commit()
-    db.refresh(db_meeting)
     return db_meeting
 
+# Filter values -> enum members (values equal names for both enums)
+_TRANSCRIPTION_STATUS_MAP = {s.value: s for s in TranscriptionStatus}
+_ANALYTICS_STATUS_MAP = {s.value: s for s in AnalyticsStatus}
+
 def get_meetings_with_filters(
     db: Session, 
     user_id: int, 
@@ -310,34 +423,30 @@ def get_meetings_with_filters(
     limit: int = 100
 ) -> Tuple[List[MeetingRecord], int]:
     """Get meetings with comprehensive filtering and return total count"""
-    query = db.query(MeetingRecord).filter(MeetingRecord.user_id == user_id)
+    # The list view is rendered with include_details=False, so skip loading the
+    # large transcript / analytics / summary columns entirely
+    query = db.query(MeetingRecord).options(
+        defer(MeetingRecord.transcription),
+        defer(MeetingRecord.analytics_data),
+        defer(MeetingRecord.summary),
+        defer(MeetingRecord.key_points)
+    ).filter(MeetingRecord.user_id == user_id)
     
     # Apply status filter
     if status:
-        try:
-            status_enum = TranscriptionStatus(status.upper())
+        status_enum = _TRANSCRIPTION_STATUS_MAP.get(status.upper())
+        if status_enum is not None:  # Invalid status, ignore filter
             query = query.filter(MeetingRecord.status == status_enum)
-        except ValueError:
-            pass  # Invalid status, ignore filter
     
     # Apply analytics status filter
     if analytics_status:
-        try:
-            analytics_status_enum = AnalyticsStatus(analytics_status.upper())
+        analytics_status_enum = _ANALYTICS_STATUS_MAP.get(analytics_status.upper())
+        if analytics_status_enum is not None:  # Invalid analytics status, ignore filter
             query = query.filter(MeetingRecord.analytics_status == analytics_status_enum)
-        except ValueError:
-            pass  # Invalid analytics status, ignore filter
     
     # Apply search filter
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            or_(
-                MeetingRecord.title.ilike(search_term),
-                MeetingRecord.participants.cast(String).ilike(search_term),
-                MeetingRecord.transcription.cast(String).ilike(search_term)
-            )
-        )
+        query = query.filter(_text_search_clause(search))
     
     # Apply date range filter
     if date_from:
@@ -354,46 +463,28 @@ def get_meetings_with_filters(
         except ValueError:
             pass  # Invalid date format, ignore filter
     
-    # Get total count before pagination
-    total = query.count()
+    # Fetch the page and the total match count in one round trip via a window function
+    rows = query.add_columns(func.count().over().label("total")).order_by(
+        MeetingRecord.created_at.desc()
+    ).offset(skip).limit(limit).all()
     
-    # Apply pagination
-    meetings = query.order_by(MeetingRecord.created_at.desc()).offset(skip).limit(limit).all()
+    meetings = [row[0] for row in rows]
+    if rows:
+        total = rows[0].total
+    elif skip:
+        # Page past the end: no row carries the window count, so count separately
+        total = query.count()
+    else:
+        total = 0
     
     return meetings, total
 
 
 def convert_meeting_to_response_format(meeting: MeetingRecord, include_details: bool = True) -> dict:
     """Convert MeetingRecord to the new Meeting response format"""
-    # Handle participants as list (now stored as JSON in database)
-    participants_list = []
-    if meeting.participants:
-        if isinstance(meeting.participants, list):
-            # Already a list (new format)
-            participants_list = meeting.participants
-        elif isinstance(meeting.participants, str):
-            # Legacy string format - parse it
-            try:
-                import json
-                participants_list = json.loads(meeting.participants)
-            except (json.JSONDecodeError, TypeError):
-                # If not JSON, split by comma
-                participants_list = [p.strip() for p in meeting.participants.split(',') if p.strip()]
-    # If participants is None or empty, ensure we return an empty list
-    if not participants_list:
-        participants_list = []
-    
-    # Parse action items if they exist
-    action_items_list = []
-    if meeting.action_items:
-        try:
-            import json
-            if isinstance(meeting.action_items, list):
-                action_items_list = meeting.action_items
-            elif isinstance(meeting.action_items, str):
-                action_items_list = json.loads(meeting.action_items)
-        except (json.JSONDecodeError, TypeError):
-            action_items_list = []
+    # JSONB columns come back from the driver as lists/dicts, no parsing needed
+    participants_list = meeting.participants or []
+    action_items_list = meeting.action_items or []
 
     response = {
         "id": meeting.id,  # Convert UUID to int-like ID
@@ -414,36 +505,8 @@ def convert_meeting_to_response_format(meeting: MeetingRecord, include_details:
     }
 
     if include_details:
-        # Parse transcription if it exists
-        transcription_segments = []
-        if meeting.transcription:
-            try:
-                import json
-                if isinstance(meeting.transcription, list):
-                    transcription_segments = meeting.transcription
-                elif isinstance(meeting.transcription, str):
-                    transcription_segments = json.loads(meeting.transcription)
-            except (json.JSONDecodeError, TypeError):
-                transcription_segments = []
-        
-        # Parse analytics data if it exists
-        import logging
-        logger = logging.getLogger(__name__)
-        analytics_data = None
-        if meeting.analytics_data:
-            try:
-                import json
-                
-                if isinstance(meeting.analytics_data, dict):
-                    analytics_data = meeting.analytics_data
-                elif isinstance(meeting.analytics_data, str):
-                    analytics_data = json.loads(meeting.analytics_data)
-                
-            except (json.JSONDecodeError, TypeError) as e:
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.error(f"❌ [Response] Error parsing analytics_data: {e}")
-                analytics_data = None
+        transcription_segments = meeting.transcription or []
+        analytics_data = meeting.analytics_data or None
         
         response.update({
             "transcription": transcription_segments,
@@ -467,97 +530,53 @@ def convert_meeting_to_response_format(meeting: MeetingRecord, include_details:
     return response
 
 
+# Speakers and the number of distinct meetings they appear in, aggregated in Postgres.
+# Non-array transcriptions are treated as empty so jsonb_array_elements never errors.
+_UNIQUE_SPEAKERS_SQL = text("""
+    SELECT seg->>'speaker' AS speaker, COUNT(DISTINCT m.id) AS meeting_count
+    FROM meeting_records m
+    CROSS JOIN LATERAL jsonb_array_elements(
+        CASE WHEN jsonb_typeof(m.transcription::jsonb) = 'array'
+             THEN m.transcription::jsonb ELSE '[]'::jsonb END
+    ) AS seg
+    WHERE m.user_id = :user_id
+      AND jsonb_typeof(seg) = 'object'
+      AND COALESCE(seg->>'speaker', '') <> ''
+    GROUP BY 1
+""")
+
 def get_unique_speakers(db: Session, user_id: int) -> List[dict]:
     """Get all unique speakers across user's meetings with meeting count"""
-    import logging
-    logger = logging.getLogger(__name__)
-    
     logger.info(f"🔍 [Speakers] Getting unique speakers for user_id: {user_id}")
-    meetings = db.query(MeetingRecord).filter(MeetingRecord.user_id == user_id).all()
-    logger.info(f"🔍 [Speakers] Found {len(meetings)} total meetings for user")
-    
-    speaker_counts = {}
-    meetings_with_transcription = 0
-    meetings_without_transcription = 0
-    meetings_with_speakers = 0
-    meetings_without_speakers = 0
+    rows = db.execute(_UNIQUE_SPEAKERS_SQL, {"user_id": user_id}).all()
+    speaker_counts = {row.speaker: row.meeting_count for row in rows}
     
-    for meeting in meetings:
-        if not meeting.transcription:
-            meetings_without_transcription += 1
-            logger.debug(f"🔍 [Speakers] Meeting {meeting.id} has no transcription")
-            continue
-        
-        meetings_with_transcription += 1
-        
-        # Parse transcription
-        transcription_segments = []
-        try:
-            import json
-            if isinstance(meeting.transcription, list):
-                transcription_segments = meeting.transcription
-                logger.debug(f"🔍 [Speakers] Meeting {meeting.id}: transcription is a list with {len(transcription_segments)} segments")
-            elif isinstance(meeting.transcription, str):
-                transcription_segments = json.loads(meeting.transcription)
-                logger.debug(f"🔍 [Speakers] Meeting {meeting.id}: transcription is a string, parsed to {len(transcription_segments)} segments")
-        except (json.JSONDecodeError, TypeError) as e:
-            logger.warning(f"⚠️ [Speakers] Meeting {meeting.id}: Failed to parse transcription: {e}")
-            continue
-        
-        if not transcription_segments:
-            logger.debug(f"🔍 [Speakers] Meeting {meeting.id}: No transcription segments after parsing")
-            continue
-        
-        # Extract unique speakers from transcription
-        speakers_in_meeting = set()
-        segments_with_speaker = 0
-        segments_without_speaker = 0
-        
-        for segment in transcription_segments:
-            if isinstance(segment, dict):
-                if 'speaker' in segment:
-                    speaker_name = segment['speaker']
-                    if speaker_name:
-                        speakers_in_meeting.add(speaker_name)
-                        segments_with_speaker += 1
-                    else:
-                        segments_without_speaker += 1
-                else:
-                    segments_without_speaker += 1
-                    logger.debug(f"🔍 [Speakers] Meeting {meeting.id}: Segment missing 'speaker' field: {segment}")
-            else:
-                logger.debug(f"🔍 [Speakers] Meeting {meeting.id}: Segment is not a dict: {type(segment)}")
-        
-        logger.info(f"🔍 [Speakers] Meeting {meeting.id}: Found {len(speakers_in_meeting)} unique speakers ({segments_with_speaker} segments with speaker, {segments_without_speaker} without)")
-        
-        if speakers_in_meeting:
-            meetings_with_speakers += 1
-            logger.info(f"✅ [Speakers] Meeting {meeting.id}: Speakers found: {list(speakers_in_meeting)}")
-        else:
-            meetings_without_speakers += 1
-            logger.warning(f"⚠️ [Speakers] Meeting {meeting.id}: No speakers found in transcription segments")
-            # Log first few segments for debugging
-            if transcription_segments:
-                logger.debug(f"🔍 [Speakers] Meeting {meeting.id}: First segment sample: {transcription_segments[0]}")
-        
-        # Count meetings per speaker
-        for speaker in speakers_in_meeting:
-            if speaker not in speaker_counts:
-                speaker_counts[speaker] = 0
-            speaker_counts[speaker] += 1
-    
-    logger.info(f"📊 [Speakers] Summary:")
-    logger.info(f"  - Total meetings: {len(meetings)}")
-    logger.info(f"  - Meetings with transcription: {meetings_with_transcription}")
-    logger.info(f"  - Meetings without transcription: {meetings_without_transcription}")
-    logger.info(f"  - Meetings with speakers: {meetings_with_speakers}")
-    logger.info(f"  - Meetings without speakers: {meetings_without_speakers}")
-    logger.info(f"  - Total unique speakers found: {len(speaker_counts)}")
-    logger.info(f"  - Speaker counts: {speaker_counts}")
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug(f"🔍 [Speakers] Speaker counts: {speaker_counts}")
     
     # Get speaker profiles for enrichment
-    from api.models.speaker_profile import SpeakerProfile
-    speaker_profiles = db.query(SpeakerProfile).filter(SpeakerProfile.user_id == user_id).all()
+    speaker_profiles = []
+    if speaker_counts:
+        # Only fetch profiles whose full name matches a transcript speaker, and only the
+        # columns needed for enrichment. Mirrors SpeakerProfile.full_name in SQL.
+        full_name = func.concat_ws(
+            ' ', SpeakerProfile.first_name, func.nullif(SpeakerProfile.middle_name, ''), SpeakerProfile.last_name
+        ).label('full_name')
+        speaker_profiles = db.query(
+            SpeakerProfile.id,
+            SpeakerProfile.first_name,
+            SpeakerProfile.middle_name,
+            SpeakerProfile.last_name,
+            full_name,
+            SpeakerProfile.email,
+            SpeakerProfile.phone,
+            SpeakerProfile.company,
+            SpeakerProfile.designation
+        ).filter(
+            SpeakerProfile.user_id == user_id,
+            full_name.in_(list(speaker_counts))
+        ).all()
     
     # Create a mapping of full names to profiles (use most recent if duplicates)
     profile_map = {}
@@ -565,11 +584,12 @@ def get_unique_speakers(db: Session, user_id: int) -> List[dict]:
         if profile.full_name in profile_map:
             logger.warning(f"⚠️ [Speakers] Duplicate profile name '{profile.full_name}' - using most recent (ID: {profile.id})")
         profile_map[profile.full_name] = profile
-        logger.info(f"🔍 [Speakers] Profile mapping: '{profile.full_name}' -> ID {profile.id}")
+        if debug:
+            logger.debug(f"🔍 [Speakers] Profile mapping: '{profile.full_name}' -> ID {profile.id}")
     
-    logger.info(f"🔍 [Speakers] Found {len(speaker_profiles)} speaker profiles for enrichment")
-    logger.info(f"🔍 [Speakers] Profile map keys: {list(profile_map.keys())}")
-    logger.info(f"🔍 [Speakers] Speaker names to match: {list(speaker_counts.keys())}")
+    if debug:
+        logger.debug(f"🔍 [Speakers] Profile map keys: {list(profile_map.keys())}")
+        logger.debug(f"🔍 [Speakers] Speaker names to match: {list(speaker_counts.keys())}")
     
     # Convert to list of dicts with profile information
     speakers_list = []
@@ -581,7 +601,6 @@ def get_unique_speakers(db: Session, user_id: int) -> List[dict]:
         }
         
         # Check if this speaker has a profile
-        logger.info(f"🔍 [Speakers] Checking speaker '{speaker}' against profile map...")
         if speaker in profile_map:
             profile = profile_map[speaker]
             speaker_data['profile'] = {
@@ -595,13 +614,17 @@ def get_unique_speakers(db: Session, user_id: int) -> List[dict]:
                 'company': profile.company,
                 'designation': profile.designation
             }
-            logger.info(f"✅ [Speakers] Enriched speaker '{speaker}' with profile data: {profile.email}, {profile.company}, {profile.designation}")
-        else:
-            logger.info(f"❌ [Speakers] No profile found for speaker '{speaker}'")
+            if debug:
+                logger.debug(f"✅ [Speakers] Enriched speaker '{speaker}' with profile data: {profile.email}, {profile.company}, {profile.designation}")
+        elif debug:
+            logger.debug(f"❌ [Speakers] No profile found for speaker '{speaker}'")
         
         speakers_list.append(speaker_data)
     
-    logger.info(f"✅ [Speakers] Returning {len(speakers_list)} speakers with profile enrichment")
+    logger.info(
+        f"✅ [Speakers] Returning {len(speakers_list)} speakers "
+        f"({len(profile_map)} enriched from {len(speaker_profiles)} matching profiles)"
+    )
     return speakers_list
 
 
@@ -613,47 +636,142 @@ def search_meetings_by_speaker(
     limit: int = 100
 ) -> Tuple[List[MeetingRecord], int]:
     """Search meetings by speaker name and return total count"""
-    meetings = db.query(MeetingRecord).filter(MeetingRecord.user_id == user_id).all()
-    
-    matching_meetings = []
-    
-    for meeting in meetings:
-        if not meeting.transcription:
-            continue
-        
-        # Parse transcription
-        transcription_segments = []
-        try:
-            import json
-            if isinstance(meeting.transcription, list):
-                transcription_segments = meeting.transcription
-            elif isinstance(meeting.transcription, str):
-                transcription_segments = json.loads(meeting.transcription)
-        except (json.JSONDecodeError, TypeError):
-            continue
-        
-        # Check if speaker appears in transcription
-        speaker_found = False
-        for segment in transcription_segments:
-            if isinstance(segment, dict) and 'speaker' in segment:
-                if segment['speaker'] == speaker_name:
-                    speaker_found = True
-                    break
-        
-        if speaker_found:
-            matching_meetings.append(meeting)
-    
-    # Sort by created_at descending
-    matching_meetings.sort(key=lambda m: m.created_at, reverse=True)
+    # JSONB containment on transcription::jsonb matches the GIN index and lets
+    # Postgres filter, sort and paginate instead of scanning every meeting in Python
+    query = db.query(MeetingRecord).filter(
+        MeetingRecord.user_id == user_id,
+        MeetingRecord.transcription.cast(JSONB).contains([{"speaker": speaker_name}])
+    )
     
     # Get total count
-    total = len(matching_meetings)
+    total = query.count()
     
     # Apply pagination
-    paginated_meetings = matching_meetings[skip:skip + limit]
+    paginated_meetings = query.order_by(MeetingRecord.created_at.desc()).offset(skip).limit(limit).all()
     
     return paginated_meetings, total
 
+class _TeeReader:
+    """Readable wrapper that copies every chunk read from a stream into a local file"""
+    
+    def __init__(self, stream: BinaryIO, sink: BinaryIO):
+        self._stream = stream
+        self._sink = sink
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self._stream.read(size)
+        if data:
+            self._sink.write(data)
+        return data
+
+def _stream_stitched_audio(meeting_id_str: str, local_path: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Stitch the appended recordings with ffmpeg and stream the MP3 into a multipart
+    S3 upload, teeing a local copy to local_path for AI suggestions / local fallback.
+    Returns (local_path, s3_key), or (None, None) if ffmpeg is unavailable or
+    fails or the upload errors.
+    """
+    try:
+        process = audio_processor.open_stitched_audio_stream(meeting_id_str)
+    except OSError as e:
+        logger.warning(f"⚠️ Could not start ffmpeg for streamed stitch: {e}")
+        return None, None
+    
+    if process is None:
+        return None, None
+    
+    s3_audio_path = None
+    stream_error = None
+    try:
+        with open(local_path, "wb") as sink:
+            s3_audio_path = s3_service.upload_audio_stream(
+                _TeeReader(process.stdout, sink), meeting_id_str, os.path.basename(local_path)
+            )
+    except Exception as e:
+        stream_error = e
+    finally:
+        returncode, stderr = finish_ffmpeg_stream(process)
+    
+    # A partial local file would pass the idempotency check in finalize_meeting_recording,
+    # so nothing may survive a failed stream; the caller falls back to the pydub stitch
+    if stream_error is not None:
+        logger.error(f"❌ Streamed stitch failed for {meeting_id_str}: {stream_error}", exc_info=stream_error)
+        if s3_audio_path:
+            s3_service.delete_audio_file(s3_audio_path)
+        _unlink(local_path)
+        return None, None
+    
+    if returncode != 0:
+        logger.error(f"❌ ffmpeg stitch failed for {meeting_id_str} (exit {returncode}): {stderr}")
+        if s3_audio_path:
+            s3_service.delete_audio_file(s3_audio_path)
+        _unlink(local_path)
+        return None, None
+    
+    # Recording files are no longer needed once the stitched audio exists
+    meeting_dir = os.path.join(os.path.dirname(local_path), meeting_id_str)
+    try:
+        shutil.rmtree(meeting_dir)
+        logger.info(f"PROCESS-STREAM: Cleaned up temp chunk directory: {meeting_dir}")
+    except Exception as e:
+        logger.warning(f"PROCESS-STREAM: Failed to cleanup temp dir {meeting_dir}: {e}")
+    
+    logger.info(f"✅ Stitched audio streamed for {meeting_id_str}: local={local_path}, s3={s3_audio_path}")
+    return local_path, s3_audio_path
+
+# Memoized AI suggestions keyed by (kind, sha256 of the audio). A re-run of finalize on
+# the same recording (worker retry, watchdog) only repeats the calls that did not succeed
+SUGGESTION_CACHE_SIZE = 1024
+_suggestion_cache: "OrderedDict[tuple, object]" = OrderedDict()
+_suggestion_cache_lock = threading.Lock()
+
+def _audio_sha256(path: str, chunk_size: int = UPLOAD_CHUNK_SIZE) -> str:
+    """Hash an audio file in fixed-size chunks so memory stays bounded"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _cached_suggestion(kind: str, audio_sha: Optional[str], suggest, *args, **kwargs):
+    """Return a cached suggestion for this audio, or call the LLM and cache a non-empty result"""
+    if audio_sha is None:
+        return suggest(*args, **kwargs)
+    
+    cache_key = (kind, audio_sha)
+    with _suggestion_cache_lock:
+        if cache_key in _suggestion_cache:
+            _suggestion_cache.move_to_end(cache_key)
+            logger.info(f"♻️ Reusing cached {kind} suggestion for audio {audio_sha[:12]}")
+            return _suggestion_cache[cache_key]
+    
+    result = suggest(*args, **kwargs)
+    if result:
+        with _suggestion_cache_lock:
+            _suggestion_cache[cache_key] = result
+            if len(_suggestion_cache) > SUGGESTION_CACHE_SIZE:
+                _suggestion_cache.popitem(last=False)
+    return result
+
+def _suggest_template_with_own_session(audio_path: str) -> Optional[dict]:
+    """Template suggestion on a dedicated session, for use from a worker thread"""
+    with SessionLocal() as db:
+        return ai_suggestion_service.suggest_template_with_db(audio_path, db)
+
+def has_recorded_audio(meeting_id: UUID) -> bool:
+    """
+    Cheap filesystem check for anything finalize_meeting_recording could stitch:
+    a previously stitched final file or the meeting's recording directory
+    """
+    meeting_id_str = str(meeting_id)
+    base_dir = os.path.abspath("temp_audio")
+    if os.path.isdir(os.path.join(base_dir, meeting_id_str)):
+        return True
+    return any(
+        os.path.exists(os.path.join(base_dir, f"meeting_{meeting_id_str}.{extension}"))
+        for extension in ("mp3", "wav", "webm")
+    )
+
 def finalize_meeting_recording(db: Session, meeting_id: UUID) -> Optional[MeetingRecord]:
     """
     Finalize a meeting recording:
@@ -668,8 +786,6 @@ def finalize_meeting_recording(db: Session, meeting_id: UUID) -> Optional[Meetin
     if not meeting:
         logger.error(f"Meeting {meeting_id} not found")
         return None
-        
-    audio_processor = AudioProcessor()
     
     # 1. Stitch chunks
     # Note: meeting.id is UUID, but file system uses string representation
@@ -677,18 +793,26 @@ def finalize_meeting_recording(db: Session, meeting_id: UUID) -> Optional[Meetin
     
     # Check if final file already exists (Idempotency)
     base_dir = os.path.abspath("temp_audio")
+    existing_mp3 = os.path.join(base_dir, f"meeting_{meeting_id_str}.mp3")
     existing_wav = os.path.join(base_dir, f"meeting_{meeting_id_str}.wav")
     existing_webm = os.path.join(base_dir, f"meeting_{meeting_id_str}.webm")
     
     final_audio_path = None
-    if os.path.exists(existing_wav):
+    s3_audio_path = None
+    if os.path.exists(existing_mp3):
+        final_audio_path = existing_mp3
+        logger.info(f"🎬 Found existing final audio (skipping stitch): {final_audio_path}")
+    elif os.path.exists(existing_wav):
         final_audio_path = existing_wav
         logger.info(f"🎬 Found existing final audio (skipping stitch): {final_audio_path}")
     elif os.path.exists(existing_webm):
         final_audio_path = existing_webm
         logger.info(f"🎬 Found existing final audio (skipping stitch): {final_audio_path}")
     else:
-        final_audio_path = audio_processor.stitch_audio_chunks_v3(meeting_id_str)
+        # Stitch with ffmpeg straight into S3; fall back to the pydub stitch if that fails
+        final_audio_path, s3_audio_path = _stream_stitched_audio(meeting_id_str, existing_mp3)
+        if not final_audio_path:
+            final_audio_path = audio_processor.stitch_audio_chunks_v3(meeting_id_str)
     
     if not final_audio_path:
         logger.warning(f"No audio chunks found for {meeting_id}")
@@ -697,101 +821,132 @@ def finalize_meeting_recording(db: Session, meeting_id: UUID) -> Optional[Meetin
         # If we return None, the caller can decide.
         return None
 
-    # 2. Upload to S3
-    logger.info(f"☁️ Uploading audio to S3...")
-    s3_audio_path = s3_service.upload_audio_file(
-        file_path=final_audio_path,
-        meeting_uuid=meeting_id_str, # Use meeting ID for S3 folder
-        filename=os.path.basename(final_audio_path)
-    )
-    
-    if not s3_audio_path:
-        logger.warning("Failed to upload to S3 - Fallback to local storage")
-        # Fallback: Use local file path since S3 failed
-        # We'll recognize it's local because it will be an absolute path
-        s3_audio_path = final_audio_path
-    
-    # EARLY STATUS UPDATE: Set to PENDING so watchdog can pick it up even if AI suggestions fail/hang
-    meeting.s3_audio_path = s3_audio_path
-    meeting.audio_filename = os.path.basename(final_audio_path)
-    meeting.status = TranscriptionStatus.PENDING
-    meeting.analytics_status = AnalyticsStatus.PENDING
-    try:
-        db.commit()
-        logger.info(f"✅ Updated meeting {meeting_id} status to PENDING (Ready for processing)")
-    except Exception as e:
-        logger.error(f"Failed to update meeting status: {e}")
-        # Continue if possible, though strict consistency might require return
+    # Decide which suggestions are needed before the commits below expire the loaded row
+    title_lower = meeting.title.strip().lower() if meeting.title else ""
+    needs_title = not title_lower or title_lower == "untitled meeting" or _AUTO_TITLE_RE.search(title_lower) is not None
+    needs_template = not meeting.templateid
+    needs_description = not meeting.description
     
-    # 3. AI Suggestions (Template/Description)
     update_data = {}
+    suggestion_futures = {}
     
-    # Suggest template if missing
-    if not meeting.templateid:
-        try:
+    # The S3 upload and the AI suggestion calls are independent I/O-bound round-trips,
+    # so they share one pool: the upload is hidden behind the LLM latency
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # 2. Upload to S3 (already done if the stitched audio was streamed)
+        upload_future = None
+        if not s3_audio_path:
+            logger.info(f"☁️ Uploading audio to S3...")
+            upload_future = executor.submit(
+                s3_service.upload_audio_file,
+                file_path=final_audio_path,
+                meeting_uuid=meeting_id_str, # Use meeting ID for S3 folder
+                filename=os.path.basename(final_audio_path)
+            )
+        
+        # 3. AI Suggestions (Template/Description/Title)
+        audio_sha = None
+        if needs_template or needs_description or needs_title:
+            try:
+                audio_sha = _audio_sha256(final_audio_path)
+            except OSError as e:
+                logger.warning(f"Could not hash audio for suggestion cache: {e}")
+        
+        # Suggest template if missing (own DB session; this thread keeps using db meanwhile)
+        if needs_template:
             logger.info("🤖 Attempting AI template suggestion...")
-            suggestion = ai_suggestion_service.suggest_template_with_db(final_audio_path, db=db)
+            suggestion_futures["template"] = executor.submit(
+                _cached_suggestion, "template", audio_sha,
+                _suggest_template_with_own_session, final_audio_path
+            )
+        
+        # Suggest description if missing
+        if needs_description:
+            logger.info("🤖 Attempting AI description suggestion...")
+            suggestion_futures["description"] = executor.submit(
+                _cached_suggestion, "description", audio_sha,
+                ai_suggestion_service.suggest_meeting_description, final_audio_path
+            )
+        
+        # Suggest title if missing, default, or automated by extension
+        if needs_title:
+            logger.info("🤖 Attempting AI title suggestion...")
+            suggestion_futures["title"] = executor.submit(
+                _cached_suggestion, "title", audio_sha,
+                ai_suggestion_service.suggest_meeting_title, final_audio_path
+            )
+        
+        if upload_future:
+            try:
+                s3_audio_path = upload_future.result()
+            except Exception as e:
+                logger.error(f"S3 upload failed: {e}")
+        
+        if not s3_audio_path:
+            logger.warning("Failed to upload to S3 - Fallback to local storage")
+            # Fallback: Use local file path since S3 failed
+            # We'll recognize it's local because it will be an absolute path
+            s3_audio_path = final_audio_path
+        
+        # EARLY STATUS UPDATE: Set to PENDING so watchdog can pick it up even if AI suggestions fail/hang
+        try:
+            db.execute(
+                update(MeetingRecord)
+                .where(MeetingRecord.id == meeting_id)
+                .values(
+                    s3_audio_path=s3_audio_path,
+                    audio_filename=os.path.basename(final_audio_path),
+                    status=TranscriptionStatus.PENDING,
+                    analytics_status=AnalyticsStatus.PENDING
+                )
+            )
+            db.commit()
+            logger.info(f"✅ Updated meeting {meeting_id} status to PENDING (Ready for processing)")
+        except Exception as e:
+            logger.error(f"Failed to update meeting status: {e}")
+            db.rollback()
+            # Continue if possible, though strict consistency might require return
+    
+    if "template" in suggestion_futures:
+        try:
+            suggestion = suggestion_futures["template"].result()
             if suggestion and suggestion.get("suggested_template_id"):
                 update_data["templateid"] = suggestion["suggested_template_id"]
                 logger.info(f"✅ AI suggested template: {update_data['templateid']}")
         except Exception as e:
             logger.warning(f"Failed to suggest template: {e}") 
 
-    # Suggest description if missing
-    if not meeting.description:
+    if "description" in suggestion_futures:
         try:
-            logger.info("🤖 Attempting AI description suggestion...")
-            suggested_desc = ai_suggestion_service.suggest_meeting_description(final_audio_path)
+            suggested_desc = suggestion_futures["description"].result()
             if suggested_desc:
                 update_data["description"] = suggested_desc
                 logger.info("✅ AI suggested description")
         except Exception as e:
             logger.warning(f"Failed to suggest description: {e}")
 
-    # Suggest title if missing, default, or automated by extension
-    title_lower = meeting.title.lower() if meeting.title else ""
-    if not meeting.title or title_lower.strip() == "" or title_lower == "untitled meeting" or "google meet:" in title_lower or "microsoft teams:" in title_lower or "teams:" in title_lower or "zoom:" in title_lower:
+    if "title" in suggestion_futures:
         try:
-            logger.info("🤖 Attempting AI title suggestion...")
-            suggested_title = ai_suggestion_service.suggest_meeting_title(final_audio_path)
+            suggested_title = suggestion_futures["title"].result()
             if suggested_title:
                 update_data["title"] = suggested_title
                 logger.info(f"✅ AI suggested title: {suggested_title}")
         except Exception as e:
             logger.warning(f"Failed to suggest title: {e}")
 
-    # 4. Update Meeting Record (AI Suggestions only)
+    # 4. Update Meeting Record (AI Suggestions only) in one UPDATE, without re-reading the row
     if update_data:
         logger.info(f"🔄 Updating meeting {meeting_id} with AI suggestions...")
         
-        for field, value in update_data.items():
-            setattr(meeting, field, value)
-            
         try:
+            db.execute(
+                update(MeetingRecord)
+                .where(MeetingRecord.id == meeting_id)
+                .values(**update_data)
+            )
             db.commit()
-            db.refresh(meeting)
         except Exception as e:
             logger.error(f"Failed to save AI suggestions: {e}")
+            db.rollback()
             
-    return meeting 
-
-def finalize_meeting_background_execution(meeting_id: UUID):
-    """
-    Wrapper for finalizing meeting in a background task with its own DB session.
-    """
-    from database.connection import SessionLocal
-    import traceback
-    
-    logger.info(f"🚀 Starting background finalization for meeting {meeting_id}")
-    db = SessionLocal()
-    try:
-        result = finalize_meeting_recording(db, meeting_id)
-        if result:
-            logger.info(f"✅ Background finalization completed for meeting {meeting_id}")
-        else:
-            logger.error(f"❌ Background finalization returned None for meeting {meeting_id}")
-    except Exception as e:
-        logger.error(f"❌ Error in background finalization for meeting {meeting_id}: {e}")
-        traceback.print_exc()
-    finally:
-        db.close()
\ No newline at end of file
+    return meeting
@@ -2,12 +2,20 @@
 Mobile Audio Analytics - Audio and Voice-Focused Analytics
 Specialized analytics for mobile app recordings focusing on audio/voice characteristics
 """
-import json
+import bisect
+import hashlib
+import io
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime
+import httpx
+import orjson
 import google.generativeai as genai
 from config.settings import settings
+from api.services.flat_meeting_analytics import _EMPTY_DICT, _EMPTY_LIST, _timestamp_to_seconds
 
 # Configure logging with timestamps (if not already configured)
 if not logging.getLogger().handlers:
@@ -18,16 +26,224 @@ if not logging.getLogger().handlers:
     )
 logger = logging.getLogger(__name__)
 
+GEMINI_API_BASE_URL = "https://generativelanguage.googleapis.com/v1beta"
+BATCH_TERMINAL_STATES = {"BATCH_STATE_SUCCEEDED", "BATCH_STATE_FAILED", "BATCH_STATE_CANCELLED", "BATCH_STATE_EXPIRED"}
+
+# Batch grouping: prompts are bucketed by estimated token count and packed into
+# batches of at most MAX_BATCH_TOKENS, so short jobs finish in their own batches
+CHARS_PER_TOKEN = 4
+BATCH_TOKEN_BUCKETS = (2_000, 8_000, 32_000)
+MAX_BATCH_TOKENS = 256_000
+
+# Flat analytics field -> (Gemini response section, key, default), walked once per extraction
+_FLAT_FIELD_MAP = (
+    # Audio Quality Metrics (5 fields)
+    ("audio_clarity", "audio_quality", "clarity_score", 7.0),
+    ("background_noise_level", "audio_quality", "background_noise_level", 5.0),
+    ("audio_consistency", "audio_quality", "consistency_score", 7.0),
+    ("volume_stability", "audio_quality", "volume_stability", 7.0),
+    ("speech_intelligibility", "audio_quality", "speech_intelligibility", 7.0),
+    
+    # Voice Characteristics (6 fields)
+    ("speaking_pace", "voice_characteristics", "average_speaking_pace", 5.0),
+    ("pauses_and_silences", "voice_characteristics", "pause_frequency", 5.0),
+    ("voice_energy_level", "voice_characteristics", "energy_level", 5.0),
+    ("articulation_quality", "voice_characteristics", "articulation_quality", 7.0),
+    ("vocal_clarity", "voice_characteristics", "vocal_clarity", 7.0),
+    ("speaking_rate_variation", "voice_characteristics", "rate_variation", 5.0),
+    
+    # Communication Patterns (7 fields)
+    ("filler_words_count", "communication_patterns", "filler_words_count", 0),
+    ("filler_words_frequency", "communication_patterns", "filler_words_frequency", 5.0),
+    ("interruptions_count", "communication_patterns", "interruptions_count", 0),
+    ("turn_taking_quality", "communication_patterns", "turn_taking_quality", 7.0),
+    ("overlapping_speech", "communication_patterns", "overlapping_speech_frequency", 5.0),
+    ("question_frequency", "communication_patterns", "question_count", 0),
+    ("response_time_average", "communication_patterns", "average_response_time", 5.0),
+    
+    # Sentiment & Emotion Analysis (sentiment/sentiment_score are resolved separately)
+    ("emotional_tone", "sentiment_analysis", "emotional_tone", "neutral"),
+    ("tension_level", "sentiment_analysis", "tension_level", 5.0),
+    ("enthusiasm_level", "sentiment_analysis", "enthusiasm_level", 5.0),
+    
+    # Conflicts & Disagreements (5 fields)
+    ("conflicts_detected", "conflict_analysis", "conflicts_detected", 0),
+    ("disagreement_frequency", "conflict_analysis", "disagreement_frequency", 5.0),
+    ("conflict_resolution_quality", "conflict_analysis", "resolution_quality", 7.0),
+    ("constructive_discussion_score", "conflict_analysis", "constructive_score", 7.0),
+    ("tension_indicators", "conflict_analysis", "tension_indicators", _EMPTY_LIST),
+    
+    # Engagement & Participation (total_participants prefers the known participant list)
+    ("active_participation", "participation", "active_participation_score", 7.0),
+    ("engagement_level", "participation", "engagement_level_score", 7.0),
+    ("speaking_distribution", "participation", "speaking_distribution_score", 7.0),
+    ("listening_quality", "participation", "listening_quality_score", 7.0),
+    ("participation_balance", "participation", "participation_balance", 7.0),
+    ("silent_participants", "participation", "silent_participants_count", 0),
+    
+    # Meeting Effectiveness (5 fields)
+    ("agenda_coverage", "effectiveness", "agenda_coverage", 70.0),
+    ("time_management", "effectiveness", "time_management_score", 7.0),
+    ("action_items_defined", "effectiveness", "action_items_count", 0),
+    ("decision_making_efficiency", "effectiveness", "decision_making_score", 7.0),
+    ("discussion_relevance", "effectiveness", "relevance_score", 7.0),
+    
+    # Communication Quality (5 fields)
+    ("clarity_of_communication", "communication_quality", "clarity_score", 7.0),
+    ("professionalism", "communication_quality", "professionalism_score", 7.0),
+    ("respectful_communication", "communication_quality", "respect_score", 7.0),
+    ("active_listening", "communication_quality", "active_listening_score", 7.0),
+    ("conversation_flow", "communication_quality", "conversation_flow_score", 7.0),
+    
+    # Additional Audio Insights (4 fields)
+    ("key_moments", "audio_insights", "key_moments", _EMPTY_LIST),
+    ("notable_silences", "audio_insights", "notable_silences_count", 0),
+    ("energy_shifts", "audio_insights", "energy_shifts_count", 0),
+    ("speech_patterns", "audio_insights", "notable_patterns", _EMPTY_LIST),
+)
+
+# Transcripts with fewer words than this (silent recordings, failed STT) skip the Gemini call
+# and get a scoreless result carrying skipped_reason instead of default-valued analytics
+MIN_TRANSCRIPT_WORDS = 20
+SKIPPED_TRANSCRIPT_TOO_SHORT = "transcript_too_short"
+
+# Transcripts longer than this are uploaded once through the Gemini File API and attached
+# to the request instead of being inlined, so retries do not resend the text. Uploads are
+# reused for a day (Gemini keeps uploaded files for 48 hours)
+MAX_INLINE_TRANSCRIPT_CHARS = 50_000
+TRANSCRIPT_UPLOAD_CACHE_SIZE = 64
+TRANSCRIPT_UPLOAD_TTL_SECONDS = 24 * 3600
+_ATTACHED_TRANSCRIPT = "(The full transcript is attached as a text file.)"
+
+# Static analytics prompt, built once at import; only the context and transcript vary per call
+_AUDIO_ANALYTICS_PROMPT_TEMPLATE = """
+You are an expert audio and voice analyst specializing in analyzing meeting recordings from mobile devices. Analyze the following meeting transcript and extract comprehensive audio/voice-focused analytics in the exact JSON format specified below.
+
+Meeting Context:
+{context}
+
+Meeting Transcript:
+{transcript}
+
+Please analyze this audio recording and provide analytics focused on audio characteristics, voice patterns, speech quality, and communication dynamics. For numerical scores, use a 0-10 scale where 10 is excellent and 0 is poor. For percentages, use 0-100. For counts, provide actual numbers.
+
+{{
+  "audio_quality": {{
+    "clarity_score": 0-10,
+    "background_noise_level": 0-10,
+    "consistency_score": 0-10,
+    "volume_stability": 0-10,
+    "speech_intelligibility": 0-10
+  }},
+  "voice_characteristics": {{
+    "average_speaking_pace": 0-10,
+    "pause_frequency": 0-10,
+    "energy_level": 0-10,
+    "articulation_quality": 0-10,
+    "vocal_clarity": 0-10,
+    "rate_variation": 0-10
+  }},
+  "communication_patterns": {{
+    "filler_words_count": number,
+    "filler_words_frequency": 0-10,
+    "interruptions_count": number,
+    "turn_taking_quality": 0-10,
+    "overlapping_speech_frequency": 0-10,
+    "question_count": number,
+    "average_response_time": 0-10
+  }},
+  "sentiment_analysis": {{
+    "overall_sentiment": "positive|negative|neutral",
+    "sentiment_score": 0-10,
+    "emotional_tone": "positive|neutral|negative|mixed",
+    "tension_level": 0-10,
+    "enthusiasm_level": 0-10
+  }},
+  "conflict_analysis": {{
+    "conflicts_detected": number,
+    "disagreement_frequency": 0-10,
+    "resolution_quality": 0-10,
+    "constructive_score": 0-10,
+    "tension_indicators": ["list", "of", "specific", "indicators"]
+  }},
+  "participation": {{
+    "total_participants": number,
+    "active_participation_score": 0-10,
+    "engagement_level_score": 0-10,
+    "speaking_distribution_score": 0-10,
+    "listening_quality_score": 0-10,
+    "participation_balance": 0-10,
+    "silent_participants_count": number
+  }},
+  "effectiveness": {{
+    "agenda_coverage": 0-100,
+    "time_management_score": 0-10,
+    "action_items_count": number,
+    "decision_making_score": 0-10,
+    "relevance_score": 0-10
+  }},
+  "communication_quality": {{
+    "clarity_score": 0-10,
+    "professionalism_score": 0-10,
+    "respect_score": 0-10,
+    "active_listening_score": 0-10,
+    "conversation_flow_score": 0-10
+  }},
+  "audio_insights": {{
+    "key_moments": ["list", "of", "notable", "moments"],
+    "notable_silences_count": number,
+    "energy_shifts_count": number,
+    "notable_patterns": ["list", "of", "speech", "patterns"]
+  }}
+}}
+
+Analysis Guidelines:
+1. Audio Quality: Assess clarity, background noise, consistency, volume stability, and speech intelligibility based on the transcript quality and speaking patterns
+2. Voice Characteristics: Analyze speaking pace, pauses, energy levels, articulation, vocal clarity, and variations in speaking rate
+3. Communication Patterns: Count filler words (um, uh, like, you know), interruptions, assess turn-taking quality, overlapping speech, question frequency, and response times
+4. Sentiment & Emotion: Analyze overall sentiment (positive/negative/neutral), emotional tone, tension levels, and enthusiasm. Score 7-10 = positive, 4-6 = neutral, 0-3 = negative
+5. Conflicts & Disagreements: Detect conflicts, measure disagreement frequency, assess resolution quality, constructive discussion score, and identify tension indicators
+6. Participation: Analyze speaking distribution, active engagement, listening quality, participation balance, and silent participants
+7. Effectiveness: Evaluate agenda coverage, time management, action items, decision-making, and discussion relevance
+8. Communication Quality: Assess clarity, professionalism, respect, active listening, and conversation flow
+9. Audio Insights: Identify key moments, notable silences, energy shifts, and notable speech patterns
+
+Filler Words to Detect: "um", "uh", "like", "you know", "so", "well", "actually", "basically", "literally", "I mean"
+
+Conflict Indicators: Disagreement phrases, raised concerns, contrasting opinions, defensive responses, argumentative language
+
+Provide only the JSON response, no additional text or explanations.
+"""
+
+def _group_batch_requests(batch_requests: List[Tuple[int, Dict[str, Any]]]) -> List[List[Dict[str, Any]]]:
+    """Sort (token_estimate, request) pairs by length and pack them into per-bucket batches within the token budget"""
+    groups = []
+    current, current_tokens, current_bucket = [], 0, None
+    for tokens, request in sorted(batch_requests, key=lambda item: item[0]):
+        bucket = bisect.bisect_right(BATCH_TOKEN_BUCKETS, tokens)
+        if current and (bucket != current_bucket or current_tokens + tokens > MAX_BATCH_TOKENS):
+            groups.append(current)
+            current, current_tokens = [], 0
+        current.append(request)
+        current_tokens += tokens
+        current_bucket = bucket
+    if current:
+        groups.append(current)
+    return groups
+
 class MobileAudioAnalytics:
     def __init__(self):
         """Initialize the mobile audio analytics extractor with Gemini configuration"""
         self.model = None
+        self.MODEL_ID = "gemini-2.0-flash"
+        self._transcript_uploads: "OrderedDict[str, tuple]" = OrderedDict()
+        self._transcript_uploads_lock = threading.Lock()
         if not settings.GEMINI_KEY:
             logger.warning("GEMINI_KEY not found. Mobile audio analytics will not be available.")
             return
         
         genai.configure(api_key=settings.GEMINI_KEY)
-        self.model = genai.GenerativeModel('gemini-2.0-flash')
+        self.model = genai.GenerativeModel(self.MODEL_ID)
         logger.info("Mobile Audio Analytics initialized with Gemini 2.0 Flash")
     
     def extract_analytics(
@@ -55,25 +271,22 @@ class MobileAudioAnalytics:
         Returns:
             Single flat JSON object with audio/voice-focused analytics fields
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             logger.info(f"Extracting mobile audio analytics for meeting {meeting_id}: {meeting_title}")
             
-            # Extract participants and duration from transcript if not provided
-            if not participants:
-                participants = self._extract_participants_from_transcript(transcript)
-            if not duration_minutes:
-                duration_minutes = self._calculate_duration_from_transcript(transcript)
-            
-            logger.info(f"Extracted {len(participants)} participants and {duration_minutes} minutes duration from transcript")
+            prompt, participants, duration_minutes = self._build_request(
+                transcript, meeting_title, participants, duration_minutes, upload_long_transcript=True
+            )
             
-            # Prepare transcript text
-            transcript_text = self._prepare_transcript_text(transcript)
-            logger.info(f"Prepared transcript with {len(transcript)} segments")
-            
-            # Create prompt for Gemini focused on audio/voice characteristics
-            prompt = self._create_audio_analytics_prompt(transcript_text, meeting_title, participants, duration_minutes)
+            if prompt is None:
+                # Nothing to analyze: no LLM round-trip and no scores
+                processing_duration = time.perf_counter() - start_time
+                return self._build_skipped_analytics(
+                    meeting_id, user_email, meeting_title, meeting_date,
+                    transcript, participants, duration_minutes, processing_duration
+                )
             
             # Extract analytics using Gemini
             logger.info("Sending request to Gemini for mobile audio analytics extraction...")
@@ -88,112 +301,13 @@ class MobileAudioAnalytics:
             # Parse JSON response
             analytics_data = self._parse_gemini_response(response.text)
             
-            # Log what keys we got from Gemini
-            logger.info(f"Keys in parsed analytics_data: {list(analytics_data.keys())}")
-            
             # Calculate processing duration
-            processing_duration = (datetime.now() - start_time).total_seconds()
+            processing_duration = time.perf_counter() - start_time
             
-            # Extract sentiment values with safe fallbacks
-            sentiment_value = "neutral"
-            sentiment_score_value = 5.0
-            
-            try:
-                if "sentiment_analysis" in analytics_data:
-                    sentiment_data = analytics_data["sentiment_analysis"]
-                    sentiment_value = sentiment_data.get("overall_sentiment", "neutral")
-                    sentiment_score_value = sentiment_data.get("sentiment_score", 5.0)
-                    logger.info(f"✅ Extracted sentiment from Gemini: {sentiment_value} (score: {sentiment_score_value})")
-                else:
-                    logger.warning("⚠️ sentiment_analysis not found in Gemini response - using defaults (neutral, 5.0)")
-            except Exception as e:
-                logger.error(f"❌ Error extracting sentiment data: {e}")
-            
-            # Create single flat JSON object with audio/voice-focused analytics
-            flat_analytics = {
-                # Meeting identification
-                "meeting_id": str(meeting_id),
-                "user_email": user_email,
-                "meeting_title": meeting_title,
-                "meeting_date": meeting_date,
-                
-                # Audio Quality Metrics (5 fields)
-                "audio_clarity": analytics_data.get("audio_quality", {}).get("clarity_score", 7.0),
-                "background_noise_level": analytics_data.get("audio_quality", {}).get("background_noise_level", 5.0),
-                "audio_consistency": analytics_data.get("audio_quality", {}).get("consistency_score", 7.0),
-                "volume_stability": analytics_data.get("audio_quality", {}).get("volume_stability", 7.0),
-                "speech_intelligibility": analytics_data.get("audio_quality", {}).get("speech_intelligibility", 7.0),
-                
-                # Voice Characteristics (6 fields)
-                "speaking_pace": analytics_data.get("voice_characteristics", {}).get("average_speaking_pace", 5.0),
-                "pauses_and_silences": analytics_data.get("voice_characteristics", {}).get("pause_frequency", 5.0),
-                "voice_energy_level": analytics_data.get("voice_characteristics", {}).get("energy_level", 5.0),
-                "articulation_quality": analytics_data.get("voice_characteristics", {}).get("articulation_quality", 7.0),
-                "vocal_clarity": analytics_data.get("voice_characteristics", {}).get("vocal_clarity", 7.0),
-                "speaking_rate_variation": analytics_data.get("voice_characteristics", {}).get("rate_variation", 5.0),
-                
-                # Communication Patterns (7 fields)
-                "filler_words_count": analytics_data.get("communication_patterns", {}).get("filler_words_count", 0),
-                "filler_words_frequency": analytics_data.get("communication_patterns", {}).get("filler_words_frequency", 5.0),
-                "interruptions_count": analytics_data.get("communication_patterns", {}).get("interruptions_count", 0),
-                "turn_taking_quality": analytics_data.get("communication_patterns", {}).get("turn_taking_quality", 7.0),
-                "overlapping_speech": analytics_data.get("communication_patterns", {}).get("overlapping_speech_frequency", 5.0),
-                "question_frequency": analytics_data.get("communication_patterns", {}).get("question_count", 0),
-                "response_time_average": analytics_data.get("communication_patterns", {}).get("average_response_time", 5.0),
-                
-                # Sentiment & Emotion Analysis (5 fields)
-                "sentiment": sentiment_value,
-                "sentiment_score": sentiment_score_value,
-                "emotional_tone": analytics_data.get("sentiment_analysis", {}).get("emotional_tone", "neutral"),
-                "tension_level": analytics_data.get("sentiment_analysis", {}).get("tension_level", 5.0),
-                "enthusiasm_level": analytics_data.get("sentiment_analysis", {}).get("enthusiasm_level", 5.0),
-                
-                # Conflicts & Disagreements (5 fields)
-                "conflicts_detected": analytics_data.get("conflict_analysis", {}).get("conflicts_detected", 0),
-                "disagreement_frequency": analytics_data.get("conflict_analysis", {}).get("disagreement_frequency", 5.0),
-                "conflict_resolution_quality": analytics_data.get("conflict_analysis", {}).get("resolution_quality", 7.0),
-                "constructive_discussion_score": analytics_data.get("conflict_analysis", {}).get("constructive_score", 7.0),
-                "tension_indicators": analytics_data.get("conflict_analysis", {}).get("tension_indicators", []),
-                
-                # Engagement & Participation (6 fields)
-                "total_participants": len(participants) if participants else analytics_data.get("participation", {}).get("total_participants", 1),
-                "active_participation": analytics_data.get("participation", {}).get("active_participation_score", 7.0),
-                "engagement_level": analytics_data.get("participation", {}).get("engagement_level_score", 7.0),
-                "speaking_distribution": analytics_data.get("participation", {}).get("speaking_distribution_score", 7.0),
-                "listening_quality": analytics_data.get("participation", {}).get("listening_quality_score", 7.0),
-                "participation_balance": analytics_data.get("participation", {}).get("participation_balance", 7.0),
-                "silent_participants": analytics_data.get("participation", {}).get("silent_participants_count", 0),
-                
-                # Meeting Effectiveness (5 fields)
-                "agenda_coverage": analytics_data.get("effectiveness", {}).get("agenda_coverage", 70.0),
-                "time_management": analytics_data.get("effectiveness", {}).get("time_management_score", 7.0),
-                "action_items_defined": analytics_data.get("effectiveness", {}).get("action_items_count", 0),
-                "decision_making_efficiency": analytics_data.get("effectiveness", {}).get("decision_making_score", 7.0),
-                "discussion_relevance": analytics_data.get("effectiveness", {}).get("relevance_score", 7.0),
-                
-                # Communication Quality (5 fields)
-                "clarity_of_communication": analytics_data.get("communication_quality", {}).get("clarity_score", 7.0),
-                "professionalism": analytics_data.get("communication_quality", {}).get("professionalism_score", 7.0),
-                "respectful_communication": analytics_data.get("communication_quality", {}).get("respect_score", 7.0),
-                "active_listening": analytics_data.get("communication_quality", {}).get("active_listening_score", 7.0),
-                "conversation_flow": analytics_data.get("communication_quality", {}).get("conversation_flow_score", 7.0),
-                
-                # Additional Audio Insights (4 fields)
-                "key_moments": analytics_data.get("audio_insights", {}).get("key_moments", []),
-                "notable_silences": analytics_data.get("audio_insights", {}).get("notable_silences_count", 0),
-                "energy_shifts": analytics_data.get("audio_insights", {}).get("energy_shifts_count", 0),
-                "speech_patterns": analytics_data.get("audio_insights", {}).get("notable_patterns", []),
-                
-                # Metadata
-                "extraction_timestamp": datetime.now().isoformat(),
-                "transcript_length": len(transcript),
-                "processing_duration_seconds": processing_duration,
-                "model_used": "gemini-2.0-flash",
-                "analytics_type": "mobile_audio",
-                "participants": participants or [],
-                "duration_minutes": duration_minutes if duration_minutes is not None else 0.0,
-                "transcriptions": transcript  # Include full transcription data
-            }
+            flat_analytics = self._build_flat_analytics(
+                analytics_data, meeting_id, user_email, meeting_title, meeting_date,
+                transcript, participants, duration_minutes, processing_duration
+            )
             
             logger.info(f"Successfully extracted mobile audio analytics for meeting {meeting_id} in {processing_duration:.2f} seconds")
             logger.info(f"Final sentiment: {flat_analytics.get('sentiment')} (score: {flat_analytics.get('sentiment_score')})")
@@ -204,19 +318,303 @@ class MobileAudioAnalytics:
             logger.error(f"Error extracting mobile audio analytics for meeting {meeting_id}: {str(e)}")
             raise
     
+    def extract_analytics_batch(
+        self,
+        jobs: List[Dict[str, Any]],
+        poll_interval_seconds: float = 60.0,
+        timeout_seconds: float = 24 * 3600,
+        on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Extract analytics for many meetings through the Gemini Batch API (non-interactive jobs only)
+        
+        Batch requests are billed at a discount but may take up to 24 hours to complete,
+        so this is meant for low-priority/back-office processing, not on-demand UI calls.
+        Jobs are grouped by prompt length into separate batches, so short transcripts
+        are not held back by hour-long recordings.
+        
+        Args:
+            jobs: List of dicts with the same keyword arguments as extract_analytics
+            poll_interval_seconds: Delay between batch status checks
+            timeout_seconds: Give up waiting after this long
+            on_result: Optional callback(meeting_id, flat_analytics) invoked as soon as each batch finishes
+        
+        Returns:
+            Flat analytics keyed by str(meeting_id); meetings whose request failed are omitted
+        """
+        if not jobs:
+            return {}
+        
+        start_time = time.perf_counter()
+        prepared = {}
+        batch_requests = []
+        results = {}
+        for job in jobs:
+            key = str(job["meeting_id"])
+            prompt, participants, duration_minutes = self._build_request(
+                job["transcript"], job["meeting_title"], job.get("participants"), job.get("duration_minutes")
+            )
+            if prompt is None:
+                # Trivially short transcript: skipped result, no batch entry
+                results[key] = self._build_skipped_analytics(
+                    job["meeting_id"], job["user_email"], job["meeting_title"], job["meeting_date"],
+                    job["transcript"], participants, duration_minutes, 0.0
+                )
+                if on_result:
+                    on_result(key, results[key])
+                continue
+            prepared[key] = (job, participants, duration_minutes)
+            batch_requests.append((len(prompt) // CHARS_PER_TOKEN, {
+                "request": {"contents": [{"role": "user", "parts": [{"text": prompt}]}]},
+                "metadata": {"key": key}
+            }))
+        
+        if not batch_requests:
+            return results
+        
+        groups = _group_batch_requests(batch_requests)
+        logger.info(f"📦 Submitting {len(batch_requests)} mobile analytics requests as {len(groups)} Gemini batches...")
+        headers = {"x-goog-api-key": settings.GEMINI_KEY}
+        with httpx.Client(base_url=GEMINI_API_BASE_URL, headers=headers, timeout=60.0) as client:
+            pending = set()
+            for index, group in enumerate(groups):
+                try:
+                    response = client.post(
+                        f"/models/{self.MODEL_ID}:batchGenerateContent",
+                        json={"batch": {
+                            "display_name": f"mobile-analytics-{datetime.now():%Y%m%d%H%M%S}-{index}",
+                            "input_config": {"requests": {"requests": group}}
+                        }}
+                    )
+                    response.raise_for_status()
+                    batch_name = response.json()["name"]
+                    pending.add(batch_name)
+                    logger.info(f"✅ Gemini batch created: {batch_name} ({len(group)} requests)")
+                except httpx.HTTPError as e:
+                    logger.error(f"❌ Failed to create Gemini batch {index}: {e}")
+            
+            deadline = time.monotonic() + timeout_seconds
+            while pending:
+                for batch_name in sorted(pending):
+                    try:
+                        response = client.get(f"/{batch_name}")
+                        response.raise_for_status()
+                        operation = response.json()
+                    except (httpx.HTTPError, ValueError) as e:
+                        # Transient poll failure: the batch is still running on Gemini, check again next tick
+                        logger.warning(f"⚠️ Failed to poll Gemini batch {batch_name}, retrying next tick: {e}")
+                        continue
+                    state = operation.get("metadata", {}).get("state")
+                    if not (operation.get("done") or state in BATCH_TERMINAL_STATES):
+                        continue
+                    pending.discard(batch_name)
+                    if "error" in operation or state not in (None, "BATCH_STATE_SUCCEEDED"):
+                        logger.error(f"❌ Gemini batch {batch_name} failed (state: {state}): {operation.get('error')}")
+                        continue
+                    self._collect_batch_results(operation, prepared, results, time.perf_counter() - start_time, on_result)
+                    logger.info(f"✅ Gemini batch {batch_name} finished")
+                
+                if not pending:
+                    break
+                if time.monotonic() > deadline:
+                    logger.error(f"❌ Gemini batches {sorted(pending)} did not finish within {timeout_seconds}s")
+                    break
+                logger.info(f"⏳ Waiting on {len(pending)} Gemini batches...")
+                time.sleep(poll_interval_seconds)
+        
+        processing_duration = time.perf_counter() - start_time
+        logger.info(f"Gemini batches finished: {len(results)}/{len(jobs)} meetings succeeded in {processing_duration:.2f} seconds")
+        return results
+    
+    def _collect_batch_results(
+        self,
+        operation: Dict[str, Any],
+        prepared: Dict[str, tuple],
+        results: Dict[str, Dict[str, Any]],
+        processing_duration: float,
+        on_result: Optional[Callable[[str, Dict[str, Any]], None]]
+    ):
+        """Parse and flatten the inlined responses of a finished Gemini batch into results"""
+        inlined = operation.get("response", {}).get("inlinedResponses", {}).get("inlinedResponses", [])
+        for item in inlined:
+            key = item.get("metadata", {}).get("key")
+            if key not in prepared:
+                continue
+            job, participants, duration_minutes = prepared[key]
+            try:
+                if "error" in item:
+                    raise ValueError(item["error"])
+                parts = item["response"]["candidates"][0]["content"]["parts"]
+                response_text = "".join(part.get("text", "") for part in parts)
+                analytics_data = self._parse_gemini_response(response_text)
+                results[key] = self._build_flat_analytics(
+                    analytics_data, job["meeting_id"], job["user_email"], job["meeting_title"], job["meeting_date"],
+                    job["transcript"], participants, duration_minutes, processing_duration
+                )
+            except Exception as e:
+                logger.error(f"Error extracting batched mobile audio analytics for meeting {key}: {str(e)}")
+                continue
+            if on_result:
+                on_result(key, results[key])
+    
+    def _build_request(
+        self,
+        transcript: List[Dict[str, Any]],
+        meeting_title: str,
+        participants: Optional[List[str]],
+        duration_minutes: Optional[int],
+        upload_long_transcript: bool = False
+    ) -> Tuple[Optional[Union[str, List[Any]]], List[str], Optional[int]]:
+        """
+        Fill in participants/duration from the transcript and build the Gemini prompt.
+        The prompt is None when the transcript is too short to be worth analyzing.
+        With upload_long_transcript, long transcripts are attached as an uploaded file
+        and the returned contents are [file, prompt].
+        """
+        # Extract participants and duration from transcript if not provided
+        if not participants:
+            participants = self._extract_participants_from_transcript(transcript)
+        if not duration_minutes:
+            duration_minutes = self._calculate_duration_from_transcript(transcript)
+        
+        logger.info(f"Extracted {len(participants)} participants and {duration_minutes} minutes duration from transcript")
+        
+        # Prepare transcript text
+        transcript_text = self._prepare_transcript_text(transcript)
+        logger.info(f"Prepared transcript with {len(transcript)} segments")
+        
+        if len(transcript_text.split(maxsplit=MIN_TRANSCRIPT_WORDS)) < MIN_TRANSCRIPT_WORDS:
+            logger.info(f"⏭️ Transcript has fewer than {MIN_TRANSCRIPT_WORDS} words - skipping Gemini analysis")
+            return None, participants, duration_minutes
+        
+        if upload_long_transcript and len(transcript_text) > MAX_INLINE_TRANSCRIPT_CHARS:
+            transcript_file = self._upload_transcript(transcript_text)
+            prompt = self._create_audio_analytics_prompt(_ATTACHED_TRANSCRIPT, meeting_title, participants, duration_minutes)
+            return [transcript_file, prompt], participants, duration_minutes
+        
+        # Create prompt for Gemini focused on audio/voice characteristics
+        prompt = self._create_audio_analytics_prompt(transcript_text, meeting_title, participants, duration_minutes)
+        return prompt, participants, duration_minutes
+    
+    def _upload_transcript(self, transcript_text: str):
+        """Upload a transcript to the Gemini File API, reusing a recent upload of the same text"""
+        transcript_bytes = transcript_text.encode()
+        key = hashlib.blake2b(transcript_bytes, digest_size=16).hexdigest()
+        
+        with self._transcript_uploads_lock:
+            cached = self._transcript_uploads.get(key)
+            if cached and time.monotonic() - cached[1] < TRANSCRIPT_UPLOAD_TTL_SECONDS:
+                self._transcript_uploads.move_to_end(key)
+                logger.info(f"♻️ Reusing uploaded transcript {cached[0].name}")
+                return cached[0]
+        
+        logger.info(f"📤 Uploading {len(transcript_bytes)} byte transcript to Gemini File API...")
+        transcript_file = genai.upload_file(
+            io.BytesIO(transcript_bytes),
+            mime_type="text/plain",
+            display_name=f"transcript-{key}"
+        )
+        logger.info(f"✅ Uploaded transcript: {transcript_file.name}")
+        
+        with self._transcript_uploads_lock:
+            self._transcript_uploads[key] = (transcript_file, time.monotonic())
+            if len(self._transcript_uploads) > TRANSCRIPT_UPLOAD_CACHE_SIZE:
+                self._transcript_uploads.popitem(last=False)
+        return transcript_file
+    
+    def _build_flat_analytics(
+        self,
+        analytics_data: Dict[str, Any],
+        meeting_id: Any,
+        user_email: str,
+        meeting_title: str,
+        meeting_date: str,
+        transcript: List[Dict[str, Any]],
+        participants: List[str],
+        duration_minutes: Optional[int],
+        processing_duration: float
+    ) -> Dict[str, Any]:
+        """Flatten the parsed Gemini response into the single analytics object stored on the meeting"""
+        # Log what keys we got from Gemini
+        logger.info(f"Keys in parsed analytics_data: {list(analytics_data.keys())}")
+        
+        # Extract sentiment values with safe fallbacks
+        sentiment_value = "neutral"
+        sentiment_score_value = 5.0
+        
+        try:
+            if "sentiment_analysis" in analytics_data:
+                sentiment_data = analytics_data["sentiment_analysis"]
+                sentiment_value = sentiment_data.get("overall_sentiment", "neutral")
+                sentiment_score_value = sentiment_data.get("sentiment_score", 5.0)
+                logger.info(f"✅ Extracted sentiment from Gemini: {sentiment_value} (score: {sentiment_score_value})")
+            else:
+                logger.warning("⚠️ sentiment_analysis not found in Gemini response - using defaults (neutral, 5.0)")
+        except Exception as e:
+            logger.error(f"❌ Error extracting sentiment data: {e}")
+        
+        flat_analytics = {
+            # Meeting identification
+            "meeting_id": str(meeting_id),
+            "user_email": user_email,
+            "meeting_title": meeting_title,
+            "meeting_date": meeting_date,
+            
+            "sentiment": sentiment_value,
+            "sentiment_score": sentiment_score_value,
+            "total_participants": len(participants) if participants else (analytics_data.get("participation") or _EMPTY_DICT).get("total_participants", 1)
+        }
+        
+        # Section/key lookups from the response, with defaults for anything Gemini left out
+        for field, section, key, default in _FLAT_FIELD_MAP:
+            flat_analytics[field] = (analytics_data.get(section) or _EMPTY_DICT).get(key, default)
+        
+        # Metadata
+        flat_analytics.update({
+            "extraction_timestamp": datetime.now().isoformat(),
+            "transcript_length": len(transcript),
+            "processing_duration_seconds": processing_duration,
+            "model_used": "gemini-2.0-flash",
+            "analytics_type": "mobile_audio",
+            "participants": participants or [],
+            "duration_minutes": duration_minutes if duration_minutes is not None else 0.0,
+            "transcriptions": transcript  # Include full transcription data
+        })
+        return flat_analytics
+    
+    def _build_skipped_analytics(
+        self,
+        meeting_id: Any,
+        user_email: str,
+        meeting_title: str,
+        meeting_date: str,
+        transcript: List[Dict[str, Any]],
+        participants: List[str],
+        duration_minutes: Optional[int],
+        processing_duration: float
+    ) -> Dict[str, Any]:
+        """Analytics for a transcript too short to analyze: identification and metadata only, no scores"""
+        return {
+            "meeting_id": str(meeting_id),
+            "user_email": user_email,
+            "meeting_title": meeting_title,
+            "meeting_date": meeting_date,
+            "skipped_reason": SKIPPED_TRANSCRIPT_TOO_SHORT,
+            "extraction_timestamp": datetime.now().isoformat(),
+            "transcript_length": len(transcript),
+            "processing_duration_seconds": processing_duration,
+            "analytics_type": "mobile_audio",
+            "participants": participants or [],
+            "duration_minutes": duration_minutes if duration_minutes is not None else 0.0
+        }
+    
     def _extract_participants_from_transcript(self, transcript: List[Dict[str, Any]]) -> List[str]:
         """Extract unique participants from transcript segments"""
         if not transcript:
             return []
         
-        participants = set()
-        for segment in transcript:
-            if isinstance(segment, dict) and 'speaker' in segment:
-                speaker = segment['speaker']
-                if speaker and speaker not in participants:
-                    participants.add(speaker)
-        
-        return list(participants)
+        # dict.fromkeys dedupes while keeping first-appearance order, so the list is deterministic
+        return list(dict.fromkeys(segment['speaker'] for segment in transcript if isinstance(segment, dict) and segment.get('speaker')))
     
     def _calculate_duration_from_transcript(self, transcript: List[Dict[str, Any]]) -> Optional[int]:
         """Calculate meeting duration in minutes from transcript timestamps"""
@@ -224,25 +622,20 @@ class MobileAudioAnalytics:
             return None
         
         try:
-            max_end_time = 0
-            for segment in transcript:
-                if isinstance(segment, dict) and 'end' in segment:
-                    end_time = segment['end']
-                    if isinstance(end_time, (int, float)):
-                        max_end_time = max(max_end_time, end_time)
-                    elif isinstance(end_time, str):
-                        if ':' in end_time:
-                            parts = end_time.split(':')
-                            if len(parts) == 3:
-                                hours, minutes, seconds = parts
-                                total_seconds = float(hours) * 3600 + float(minutes) * 60 + float(seconds)
-                            elif len(parts) == 2:
-                                minutes, seconds = parts
-                                total_seconds = float(minutes) * 60 + float(seconds)
-                            else:
-                                continue
-                        else:
-                            total_seconds = float(end_time)
+            # Fast path: numeric end times (the common case)
+            numeric_ends = [
+                segment['end'] for segment in transcript
+                if isinstance(segment, dict) and isinstance(segment.get('end'), (int, float))
+            ]
+            max_end_time = max(numeric_ends, default=0)
+            
+            # Only walk the transcript again if some segments carry string timestamps
+            if len(numeric_ends) < len(transcript):
+                for segment in transcript:
+                    if not isinstance(segment, dict) or not isinstance(segment.get('end'), str):
+                        continue
+                    total_seconds = _timestamp_to_seconds(segment['end'])
+                    if total_seconds is not None:
                         max_end_time = max(max_end_time, total_seconds)
             
             duration_minutes = int((max_end_time / 60) + 0.5)
@@ -257,19 +650,12 @@ class MobileAudioAnalytics:
         if not transcript:
             return ""
         
-        text_parts = []
-        for segment in transcript:
-            if isinstance(segment, dict):
-                if 'text' in segment:
-                    text_parts.append(segment['text'])
-                elif 'transcript' in segment:
-                    text_parts.append(segment['transcript'])
-                elif 'content' in segment:
-                    text_parts.append(segment['content'])
-            elif isinstance(segment, str):
-                text_parts.append(segment)
-        
-        return " ".join(text_parts)
+        return " ".join(
+            (segment.get('text') or segment.get('transcript') or segment.get('content') or '')
+            if isinstance(segment, dict) else segment
+            for segment in transcript
+            if isinstance(segment, (dict, str))
+        )
     
     def _create_audio_analytics_prompt(self, transcript_text: str, meeting_title: str, participants: Optional[List[str]], duration_minutes: Optional[int]) -> str:
         """Create comprehensive prompt for Gemini to extract audio/voice-focused analytics"""
@@ -282,119 +668,21 @@ class MobileAudioAnalytics:
         
         context_info = "\n".join(context_parts)
         
-        return f"""
-You are an expert audio and voice analyst specializing in analyzing meeting recordings from mobile devices. Analyze the following meeting transcript and extract comprehensive audio/voice-focused analytics in the exact JSON format specified below.
-
-Meeting Context:
-{context_info}
-
-Meeting Transcript:
-{transcript_text}
-
-Please analyze this audio recording and provide analytics focused on audio characteristics, voice patterns, speech quality, and communication dynamics. For numerical scores, use a 0-10 scale where 10 is excellent and 0 is poor. For percentages, use 0-100. For counts, provide actual numbers.
-
-{{
-  "audio_quality": {{
-    "clarity_score": 0-10,
-    "background_noise_level": 0-10,
-    "consistency_score": 0-10,
-    "volume_stability": 0-10,
-    "speech_intelligibility": 0-10
-  }},
-  "voice_characteristics": {{
-    "average_speaking_pace": 0-10,
-    "pause_frequency": 0-10,
-    "energy_level": 0-10,
-    "articulation_quality": 0-10,
-    "vocal_clarity": 0-10,
-    "rate_variation": 0-10
-  }},
-  "communication_patterns": {{
-    "filler_words_count": number,
-    "filler_words_frequency": 0-10,
-    "interruptions_count": number,
-    "turn_taking_quality": 0-10,
-    "overlapping_speech_frequency": 0-10,
-    "question_count": number,
-    "average_response_time": 0-10
-  }},
-  "sentiment_analysis": {{
-    "overall_sentiment": "positive|negative|neutral",
-    "sentiment_score": 0-10,
-    "emotional_tone": "positive|neutral|negative|mixed",
-    "tension_level": 0-10,
-    "enthusiasm_level": 0-10
-  }},
-  "conflict_analysis": {{
-    "conflicts_detected": number,
-    "disagreement_frequency": 0-10,
-    "resolution_quality": 0-10,
-    "constructive_score": 0-10,
-    "tension_indicators": ["list", "of", "specific", "indicators"]
-  }},
-  "participation": {{
-    "total_participants": number,
-    "active_participation_score": 0-10,
-    "engagement_level_score": 0-10,
-    "speaking_distribution_score": 0-10,
-    "listening_quality_score": 0-10,
-    "participation_balance": 0-10,
-    "silent_participants_count": number
-  }},
-  "effectiveness": {{
-    "agenda_coverage": 0-100,
-    "time_management_score": 0-10,
-    "action_items_count": number,
-    "decision_making_score": 0-10,
-    "relevance_score": 0-10
-  }},
-  "communication_quality": {{
-    "clarity_score": 0-10,
-    "professionalism_score": 0-10,
-    "respect_score": 0-10,
-    "active_listening_score": 0-10,
-    "conversation_flow_score": 0-10
-  }},
-  "audio_insights": {{
-    "key_moments": ["list", "of", "notable", "moments"],
-    "notable_silences_count": number,
-    "energy_shifts_count": number,
-    "notable_patterns": ["list", "of", "speech", "patterns"]
-  }}
-}}
-
-Analysis Guidelines:
-1. Audio Quality: Assess clarity, background noise, consistency, volume stability, and speech intelligibility based on the transcript quality and speaking patterns
-2. Voice Characteristics: Analyze speaking pace, pauses, energy levels, articulation, vocal clarity, and variations in speaking rate
-3. Communication Patterns: Count filler words (um, uh, like, you know), interruptions, assess turn-taking quality, overlapping speech, question frequency, and response times
-4. Sentiment & Emotion: Analyze overall sentiment (positive/negative/neutral), emotional tone, tension levels, and enthusiasm. Score 7-10 = positive, 4-6 = neutral, 0-3 = negative
-5. Conflicts & Disagreements: Detect conflicts, measure disagreement frequency, assess resolution quality, constructive discussion score, and identify tension indicators
-6. Participation: Analyze speaking distribution, active engagement, listening quality, participation balance, and silent participants
-7. Effectiveness: Evaluate agenda coverage, time management, action items, decision-making, and discussion relevance
-8. Communication Quality: Assess clarity, professionalism, respect, active listening, and conversation flow
-9. Audio Insights: Identify key moments, notable silences, energy shifts, and notable speech patterns
-
-Filler Words to Detect: "um", "uh", "like", "you know", "so", "well", "actually", "basically", "literally", "I mean"
-
-Conflict Indicators: Disagreement phrases, raised concerns, contrasting opinions, defensive responses, argumentative language
-
-Provide only the JSON response, no additional text or explanations.
-"""
+        return _AUDIO_ANALYTICS_PROMPT_TEMPLATE.format(context=context_info, transcript=transcript_text)
     
     def _parse_gemini_response(self, response_text: str) -> Dict[str, Any]:
         """Parse the JSON response from Gemini"""
         try:
-            response_text = response_text.strip()
-            start_idx = response_text.find('{')
-            end_idx = response_text.rfind('}') + 1
+            response_bytes = response_text.encode()
+            start_idx = response_bytes.find(b'{')
+            end_idx = response_bytes.rfind(b'}') + 1
             
             if start_idx == -1 or end_idx == 0:
                 raise ValueError("No JSON found in response")
             
-            json_text = response_text[start_idx:end_idx]
-            return json.loads(json_text)
+            return orjson.loads(response_bytes[start_idx:end_idx])
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON from Gemini response: {e}")
             logger.error(f"Response text: {response_text}")
             raise ValueError(f"Invalid JSON response from Gemini: {e}")
@@ -402,10 +690,18 @@ Provide only the JSON response, no additional text or explanations.
             logger.error(f"Error parsing Gemini response: {e}")
             raise ValueError(f"Failed to parse Gemini response: {e}")
 
-# Global instance - ready to use
-try:
-    mobile_audio_analytics = MobileAudioAnalytics()
-except Exception as e:
-    logger.warning(f"Mobile Audio Analytics not available: {e}")
-    mobile_audio_analytics = None
+_mobile_audio_analytics: Optional[MobileAudioAnalytics] = None
+_mobile_audio_analytics_lock = threading.Lock()
 
+def get_mobile_audio_analytics() -> MobileAudioAnalytics:
+    """
+    Return the shared MobileAudioAnalytics, created on first use so importing this
+    module does not configure Gemini. Construction errors propagate to the caller.
+    """
+    global _mobile_audio_analytics
+    # Double-checked so the analytics pool starting cold builds (and configures Gemini) only once
+    if _mobile_audio_analytics is None:
+        with _mobile_audio_analytics_lock:
+            if _mobile_audio_analytics is None:
+                _mobile_audio_analytics = MobileAudioAnalytics()
+    return _mobile_audio_analytics
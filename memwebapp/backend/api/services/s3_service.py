@@ -1,11 +1,17 @@
+import atexit
 import boto3
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
 import os
 import logging
-import tempfile
-from typing import Optional, BinaryIO
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterator, Optional, BinaryIO
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
-from pydub import AudioSegment
 from config.settings import settings
+from api.services.ffmpeg_process import open_ffmpeg_stream, finish_ffmpeg_stream
 
 # Configure logging with timestamps (if not already configured)
 if not logging.getLogger().handlers:
@@ -16,6 +22,35 @@ if not logging.getLogger().handlers:
     )
 logger = logging.getLogger(__name__)
 
+# Multipart settings for meeting recordings: 8 MiB parts uploaded on
+# S3_UPLOAD_CONCURRENCY threads, so even a few-MB MP3 is sent in parallel
+MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+MULTIPART_MAX_CONCURRENCY = settings.S3_UPLOAD_CONCURRENCY
+
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_CHUNK_SIZE,
+    multipart_chunksize=MULTIPART_CHUNK_SIZE,
+    max_concurrency=MULTIPART_MAX_CONCURRENCY,
+    use_threads=True
+)
+
+# One pooled client is shared by all uploads; keep enough connections for
+# several concurrent multipart uploads and retry S3 throttling adaptively.
+# S3_USE_ACCELERATE_ENDPOINT routes requests through the Transfer Acceleration
+# edge endpoint, which helps long-RTT / cross-region uploads.
+S3_MAX_POOL_CONNECTIONS = 50
+CLIENT_CONFIG = Config(
+    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+    retries={"mode": "adaptive", "max_attempts": 5},
+    tcp_keepalive=True,
+    s3={"use_accelerate_endpoint": settings.S3_USE_ACCELERATE_ENDPOINT}
+)
+
+# Presigned URLs are reused while at least this fraction of their lifetime
+# remains, so callers still get (almost) the full expiration they asked for
+PRESIGNED_URL_CACHE_SIZE = 1024
+PRESIGNED_URL_MIN_REMAINING = 0.9
+
 class S3Service:
     def __init__(self):
         """Initialize S3 service with AWS credentials"""
@@ -24,11 +59,34 @@ class S3Service:
                 's3',
                 aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                region_name=settings.AWS_REGION
+                region_name=settings.AWS_REGION,
+                config=CLIENT_CONFIG
             )
             self.bucket_name = settings.S3_BUCKET_NAME
             self.audio_prefix = settings.S3_AUDIO_PREFIX
-            logger.info(f"✅ S3 service initialized - Bucket: {self.bucket_name}, Region: {settings.AWS_REGION}")
+            self.transfer_config = TRANSFER_CONFIG
+            
+            # One transfer manager (and its part-upload thread pool) for every upload
+            self.transfer_manager = create_transfer_manager(self.s3_client, self.transfer_config)
+            atexit.register(self.transfer_manager.shutdown)
+            
+            # Sign presigned URLs with dedicated long-lived keys when configured
+            self.presign_client = self.s3_client
+            if settings.S3_PRESIGN_ACCESS_KEY_ID and settings.S3_PRESIGN_SECRET_ACCESS_KEY:
+                self.presign_client = boto3.client(
+                    's3',
+                    aws_access_key_id=settings.S3_PRESIGN_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.S3_PRESIGN_SECRET_ACCESS_KEY,
+                    region_name=settings.AWS_REGION,
+                    config=CLIENT_CONFIG
+                )
+                logger.info("🔑 Using dedicated credentials for presigned URLs")
+            self._url_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+            self._url_cache_lock = threading.Lock()
+            logger.info(
+                f"✅ S3 service initialized - Bucket: {self.bucket_name}, Region: {settings.AWS_REGION}, "
+                f"Accelerate: {settings.S3_USE_ACCELERATE_ENDPOINT}"
+            )
         except NoCredentialsError:
             logger.error("❌ AWS credentials not found")
             raise Exception("AWS credentials not configured")
@@ -49,23 +107,23 @@ class S3Service:
         Returns:
             S3 key/path if successful, None if failed
         """
-        temp_mp3_path = None
         try:
-            # Convert audio file to MP3
-            temp_mp3_path = self._convert_to_mp3(file_path)
+            if not os.path.exists(file_path):
+                raise FileNotFoundError(file_path)
             
             # Generate S3 key with MP3 extension
             s3_key = f"{self.audio_prefix}{meeting_uuid}/{meeting_uuid}.mp3"
             
-            logger.info(f"📤 Uploading MP3 audio file to S3: {s3_key}")
+            logger.info(f"📤 Streaming MP3 audio file to S3: {s3_key}")
             
-            # Upload MP3 file to S3
-            with open(temp_mp3_path, 'rb') as file_data:
-                self.s3_client.upload_fileobj(
-                    file_data,
+            # Transcode with ffmpeg and upload its stdout directly, no temp MP3 on disk
+            process = self._open_mp3_stream(file_path)
+            try:
+                self.transfer_manager.upload(
+                    process.stdout,
                     self.bucket_name,
                     s3_key,
-                    ExtraArgs={
+                    extra_args={
                         'ContentType': 'audio/mpeg',
                         'Metadata': {
                             'meeting_uuid': meeting_uuid,
@@ -73,7 +131,14 @@ class S3Service:
                             'converted_to_mp3': 'true'
                         }
                     }
-                )
+                ).result()
+            finally:
+                returncode, stderr = finish_ffmpeg_stream(process)
+            
+            if returncode != 0:
+                logger.error(f"❌ ffmpeg MP3 conversion failed (exit {returncode}): {stderr}")
+                self.delete_audio_file(s3_key)
+                return None
             
             logger.info(f"✅ MP3 audio file uploaded successfully to S3: {s3_key}")
             return s3_key
@@ -87,42 +152,90 @@ class S3Service:
         except Exception as e:
             logger.error(f"❌ Unexpected error during S3 upload: {e}")
             return None
-        finally:
-            # Clean up temporary MP3 file
-            if temp_mp3_path and os.path.exists(temp_mp3_path):
-                try:
-                    os.remove(temp_mp3_path)
-                    logger.debug(f"🧹 Cleaned up temporary MP3 file: {temp_mp3_path}")
-                except Exception as e:
-                    logger.warning(f"⚠️ Failed to clean up temporary MP3 file {temp_mp3_path}: {e}")
 
-    def download_audio_file(self, s3_key: str) -> Optional[bytes]:
+    def upload_audio_stream(self, stream: BinaryIO, meeting_uuid: str, filename: str) -> str:
         """
-        Download audio file from S3
+        Upload an MP3 byte stream (e.g. ffmpeg stdout) to S3 through the shared transfer
+        manager, which sends multipart parts concurrently as they are read and aborts
+        the multipart upload if any part fails.
         
         Args:
-            s3_key: S3 key/path of the file
+            stream: Readable binary stream of MP3 data
+            meeting_uuid: UUID of the meeting
+            filename: Original filename
             
         Returns:
-            File content as bytes if successful, None if failed
+            S3 key/path of the uploaded file; upload errors are logged and re-raised
         """
+        s3_key = f"{self.audio_prefix}{meeting_uuid}/{meeting_uuid}.mp3"
+        logger.info(f"📤 Streaming MP3 audio to S3 (multipart): {s3_key}")
         try:
-            logger.info(f"📥 Downloading audio file from S3: {s3_key}")
+            self.transfer_manager.upload(
+                stream,
+                self.bucket_name,
+                s3_key,
+                extra_args={
+                    'ContentType': 'audio/mpeg',
+                    'Metadata': {
+                        'meeting_uuid': meeting_uuid,
+                        'original_filename': filename,
+                        'converted_to_mp3': 'true'
+                    }
+                }
+            ).result()
+        except Exception as e:
+            logger.error(f"❌ S3 multipart upload failed for {s3_key}: {e}", exc_info=True)
+            raise
+        
+        logger.info(f"✅ MP3 audio streamed successfully to S3: {s3_key}")
+        return s3_key
+
+    def stream_audio_file(self, s3_key: str, chunk_size: int = 1 << 20) -> Iterator[bytes]:
+        """
+        Stream an audio file from S3 in chunks instead of buffering the whole object
+        
+        Args:
+            s3_key: S3 key/path of the file
+            chunk_size: Bytes per yielded chunk (default: 1 MiB)
             
+        Yields:
+            Chunks of the file content; S3 errors are logged and re-raised
+        """
+        logger.info(f"📥 Streaming audio file from S3: {s3_key}")
+        try:
             response = self.s3_client.get_object(
                 Bucket=self.bucket_name,
                 Key=s3_key
             )
-            
-            file_content = response['Body'].read()
-            logger.info(f"✅ Audio file downloaded successfully from S3: {s3_key}")
-            return file_content
-            
         except ClientError as e:
             if e.response['Error']['Code'] == 'NoSuchKey':
                 logger.error(f"❌ File not found in S3: {s3_key}")
             else:
                 logger.error(f"❌ S3 download failed: {e}")
+            raise
+        
+        body = response['Body']
+        try:
+            yield from body.iter_chunks(chunk_size)
+        finally:
+            body.close()
+        
+        logger.info(f"✅ Audio file streamed successfully from S3: {s3_key}")
+
+    def download_audio_file(self, s3_key: str) -> Optional[bytes]:
+        """
+        Download audio file from S3
+        Prefer stream_audio_file when the content can be consumed in chunks.
+        
+        Args:
+            s3_key: S3 key/path of the file
+            
+        Returns:
+            File content as bytes if successful, None if failed
+        """
+        try:
+            return b"".join(self.stream_audio_file(s3_key))
+        except ClientError:
             return None
         except Exception as e:
             logger.error(f"❌ Unexpected error during S3 download: {e}")
@@ -146,6 +259,10 @@ class S3Service:
                 Key=s3_key
             )
             
+            with self._url_cache_lock:
+                for cache_key in [key for key in self._url_cache if key[0] == s3_key]:
+                    del self._url_cache[cache_key]
+            
             logger.info(f"✅ Audio file deleted successfully from S3: {s3_key}")
             return True
             
@@ -159,6 +276,7 @@ class S3Service:
     def get_audio_file_url(self, s3_key: str, expiration: int = 3600) -> Optional[str]:
         """
         Generate a presigned URL for audio file access
+        Recently generated URLs are reused while most of their lifetime remains.
         
         Args:
             s3_key: S3 key/path of the file
@@ -167,15 +285,31 @@ class S3Service:
         Returns:
             Presigned URL if successful, None if failed
         """
+        cache_key = (s3_key, expiration)
+        now = time.monotonic()
+        with self._url_cache_lock:
+            cached = self._url_cache.get(cache_key)
+            if cached:
+                url, expires_at = cached
+                if expires_at - now >= PRESIGNED_URL_MIN_REMAINING * expiration:
+                    self._url_cache.move_to_end(cache_key)
+                    return url
+                del self._url_cache[cache_key]
+        
         try:
             logger.info(f"🔗 Generating presigned URL for S3 file: {s3_key}")
             
-            url = self.s3_client.generate_presigned_url(
+            url = self.presign_client.generate_presigned_url(
                 'get_object',
                 Params={'Bucket': self.bucket_name, 'Key': s3_key},
                 ExpiresIn=expiration
             )
             
+            with self._url_cache_lock:
+                self._url_cache[cache_key] = (url, now + expiration)
+                if len(self._url_cache) > PRESIGNED_URL_CACHE_SIZE:
+                    self._url_cache.popitem(last=False)
+            
             logger.info(f"✅ Presigned URL generated successfully for: {s3_key}")
             return url
             
@@ -186,40 +320,27 @@ class S3Service:
             logger.error(f"❌ Unexpected error generating presigned URL: {e}")
             return None
 
-    def _convert_to_mp3(self, input_file_path: str) -> str:
+    def _open_mp3_stream(self, input_file_path: str) -> subprocess.Popen:
         """
-        Convert audio file to MP3 format
+        Start an ffmpeg process that transcodes the audio file to MP3 on stdout
         
         Args:
             input_file_path: Path to the input audio file
             
         Returns:
-            Path to the converted MP3 file
+            The running ffmpeg process; read the MP3 from its stdout
         """
-        try:
-            logger.info(f"🔄 Converting audio file to MP3: {input_file_path}")
-            
-            # Create temporary file for MP3 output
-            temp_fd, temp_mp3_path = tempfile.mkstemp(suffix='.mp3')
-            os.close(temp_fd)  # Close the file descriptor, we only need the path
-            
-            # Load the audio file
-            audio = AudioSegment.from_file(input_file_path)
-            
-            # Export as MP3 with good quality settings
-            audio.export(
-                temp_mp3_path,
-                format="mp3",
-                bitrate="192k",  # Good quality bitrate
-                parameters=["-q:a", "2"]  # High quality encoding
-            )
-            
-            logger.info(f"✅ Audio file converted to MP3: {temp_mp3_path}")
-            return temp_mp3_path
-            
-        except Exception as e:
-            logger.error(f"❌ Error converting audio to MP3: {e}")
-            raise Exception(f"Failed to convert audio file to MP3: {str(e)}")
+        logger.info(f"🔄 Converting audio file to MP3: {input_file_path}")
+        
+        command = [
+            "ffmpeg", "-nostdin", "-loglevel", "error",
+            "-i", input_file_path,
+            "-codec:a", "libmp3lame",
+            "-b:a", "192k",  # Good quality bitrate
+            "-q:a", "2",  # High quality encoding
+            "-f", "mp3", "pipe:1"
+        ]
+        return open_ffmpeg_stream(command)
 
     def _get_content_type(self, file_extension: str) -> str:
         """Get appropriate content type based on file extension"""
@@ -2,13 +2,14 @@
 Service layer for Speaker Profile operations
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import or_, text, update, delete
+from sqlalchemy.exc import IntegrityError
 from typing import List, Optional
+import json
 import uuid
 import logging
 
 from api.models.speaker_profile import SpeakerProfile
-from api.models.meeting import MeetingRecord
 from api.schemas.speaker_profile import SpeakerProfileCreate, SpeakerProfileUpdate
 
 logger = logging.getLogger(__name__)
@@ -20,16 +21,6 @@ def create_speaker_profile(
 ) -> SpeakerProfile:
     """Create a new speaker profile for a user"""
     try:
-        # Check if email already exists for this user (if email is provided)
-        if profile_data.email:
-            existing = db.query(SpeakerProfile).filter(
-                SpeakerProfile.user_id == user_id,
-                SpeakerProfile.email == profile_data.email
-            ).first()
-            
-            if existing:
-                raise ValueError(f"A speaker profile with email {profile_data.email} already exists")
-        
         # Create new profile
         profile = SpeakerProfile(
             id=uuid.uuid4(),
@@ -50,6 +41,10 @@ def create_speaker_profile(
         logger.info(f"✅ Created speaker profile {profile.id} for user {user_id}")
         return profile
         
+    except IntegrityError:
+        # Unique (user_id, email) constraint
+        db.rollback()
+        raise ValueError(f"A speaker profile with email {profile_data.email} already exists")
     except Exception as e:
         db.rollback()
         logger.error(f"❌ Error creating speaker profile: {e}")
@@ -100,33 +95,34 @@ def update_speaker_profile(
 ) -> Optional[SpeakerProfile]:
     """Update an existing speaker profile"""
     try:
-        profile = get_speaker_profile_by_id(db, profile_id, user_id)
+        update_data = profile_data.model_dump(exclude_unset=True)
+        if not update_data:
+            return get_speaker_profile_by_id(db, profile_id, user_id)
+        
+        # Ownership check and update in one statement; RETURNING loads the updated row
+        profile = db.execute(
+            update(SpeakerProfile)
+            .where(SpeakerProfile.id == profile_id, SpeakerProfile.user_id == user_id)
+            .values(**update_data)
+            .returning(SpeakerProfile)
+        ).scalar_one_or_none()
         
         if not profile:
+            db.rollback()
+            logger.warning(f"⚠️  Speaker profile {profile_id} not found for user {user_id}")
             return None
         
-        # Check if email is being changed and if it conflicts
-        if profile_data.email and profile_data.email != profile.email:
-            existing = db.query(SpeakerProfile).filter(
-                SpeakerProfile.user_id == user_id,
-                SpeakerProfile.email == profile_data.email,
-                SpeakerProfile.id != profile_id
-            ).first()
-            
-            if existing:
-                raise ValueError(f"A speaker profile with email {profile_data.email} already exists")
-        
-        # Update fields if provided
-        update_data = profile_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(profile, field, value)
-        
+        # Detach so the committed row stays loaded instead of being re-selected
+        db.expunge(profile)
         db.commit()
-        db.refresh(profile)
         
         logger.info(f"✅ Updated speaker profile {profile_id}")
         return profile
         
+    except IntegrityError:
+        # Unique (user_id, email) constraint
+        db.rollback()
+        raise ValueError(f"A speaker profile with email {profile_data.email} already exists")
     except Exception as e:
         db.rollback()
         logger.error(f"❌ Error updating speaker profile: {e}")
@@ -139,12 +135,17 @@ def delete_speaker_profile(
 ) -> bool:
     """Delete a speaker profile"""
     try:
-        profile = get_speaker_profile_by_id(db, profile_id, user_id)
-        
-        if not profile:
+        deleted_id = db.execute(
+            delete(SpeakerProfile)
+            .where(SpeakerProfile.id == profile_id, SpeakerProfile.user_id == user_id)
+            .returning(SpeakerProfile.id)
+        ).scalar_one_or_none()
+        
+        if deleted_id is None:
+            db.rollback()
+            logger.warning(f"⚠️  Speaker profile {profile_id} not found for user {user_id}")
             return False
         
-        db.delete(profile)
         db.commit()
         
         logger.info(f"✅ Deleted speaker profile {profile_id}")
@@ -178,41 +179,39 @@ def map_speaker_to_profile(
         
         logger.info(f"🔄 Mapping speaker '{speaker_name}' to '{new_speaker_name}' for user {user_id}")
         
-        # Get all meetings for this user
-        meetings = db.query(MeetingRecord).filter(
-            MeetingRecord.user_id == user_id
-        ).all()
-        
-        logger.info(f"🔍 Found {len(meetings)} total meetings for user {user_id}")
-        
-        meetings_updated = 0
-        
-        for meeting in meetings:
-            if not meeting.transcription:
-                logger.debug(f"⚠️  Meeting {meeting.id} has no transcription, skipping")
-                continue
-            
-            # Parse transcription
-            transcription_segments = meeting.transcription
-            updated = False
-            segments_updated = 0
-            
-            # Update speaker names in transcription segments
-            for segment in transcription_segments:
-                if isinstance(segment, dict) and segment.get('speaker') == speaker_name:
-                    old_speaker = segment['speaker']
-                    segment['speaker'] = new_speaker_name
-                    segments_updated += 1
-                    updated = True
-            
-            if updated:
-                # Mark the transcription as modified so SQLAlchemy knows to update it
-                from sqlalchemy.orm.attributes import flag_modified
-                meeting.transcription = transcription_segments
-                flag_modified(meeting, 'transcription')
-                meetings_updated += 1
-                logger.info(f"✅ Updated meeting {meeting.id}: {segments_updated} segments changed from '{speaker_name}' to '{new_speaker_name}'")
-        
+        if new_speaker_name == speaker_name:
+            # Nothing to rewrite; skip scanning and rewriting the user's transcripts
+            logger.info(f"⏭️ Speaker '{speaker_name}' already matches the profile name, nothing to update")
+            return 0
+        
+        # Rewrite matching segments in a single UPDATE; the containment filter uses the
+        # transcription GIN index so only meetings that mention the speaker are touched
+        result = db.execute(
+            text("""
+                UPDATE meeting_records
+                SET transcription = (
+                    SELECT jsonb_agg(
+                        CASE WHEN seg->>'speaker' = :old_speaker
+                            THEN jsonb_set(seg, '{speaker}', to_jsonb(CAST(:new_speaker AS TEXT)))
+                            ELSE seg
+                        END
+                        ORDER BY ord
+                    )
+                    FROM jsonb_array_elements(transcription::jsonb) WITH ORDINALITY AS t(seg, ord)
+                ),
+                updated_at = now()
+                WHERE user_id = :user_id
+                  AND transcription::jsonb @> CAST(:probe AS JSONB)
+                RETURNING id
+            """),
+            {
+                "old_speaker": speaker_name,
+                "new_speaker": new_speaker_name,
+                "user_id": user_id,
+                "probe": json.dumps([{"speaker": speaker_name}])
+            }
+        )
+        meetings_updated = len(result.fetchall())
         db.commit()
         
         logger.info(f"✅ Updated {meetings_updated} meetings with new speaker name '{new_speaker_name}'")
@@ -232,6 +231,7 @@ def search_speaker_profiles(
     try:
         search_term = f"%{query}%"
         
+        # Each ILIKE column has a pg_trgm GIN index, so the OR becomes a bitmap index scan
         profiles = db.query(SpeakerProfile).filter(
             SpeakerProfile.user_id == user_id,
             or_(
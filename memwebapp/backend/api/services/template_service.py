@@ -1,23 +1,50 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, update, delete, func, select
 from typing import List, Optional, Tuple
 from uuid import UUID
 from api.models.template import Template
 from api.schemas.template import TemplateCreate, TemplateUpdate
 
+def _count_templates(db: Session, filters: list) -> int:
+    """Plain SELECT count(*) FROM templates WHERE ... (Query.count() wraps the query in a subquery)"""
+    return db.scalar(select(func.count()).select_from(Template).where(*filters))
+
+def _paginate_with_total(db: Session, filters: list, skip: int, limit: int, order_by=None) -> Tuple[List[Template], int]:
+    """Fetch one page and the total match count in one round trip via a window function"""
+    query = db.query(Template, func.count().over().label("total")).filter(*filters)
+    if order_by is not None:
+        query = query.order_by(order_by)
+    rows = query.offset(skip).limit(limit).all()
+    
+    templates = [row[0] for row in rows]
+    if rows:
+        total = rows[0].total
+    elif skip:
+        # Page past the end: no row carries the window count, so count separately
+        total = _count_templates(db, filters)
+    else:
+        total = 0
+    
+    return templates, total
+
+def _active_filters(active_only: bool) -> list:
+    """Filters shared by template list and count queries"""
+    return [Template.is_active == True] if active_only else []
+
+def _search_filters(query: str, active_only: bool) -> list:
+    """Filters for the title/description search, shared by list and count"""
+    return [
+        or_(
+            Template.title.contains(query),
+            Template.description.contains(query)
+        ),
+        *_active_filters(active_only)
+    ]
+
 def template_to_response_with_key_points(template: Template) -> dict:
     """Convert template to response format with key points"""
-    import json
-    
-    # Parse key_points_prompt from JSON string to list
-    key_points_prompt = template.key_points_prompt
-    if isinstance(key_points_prompt, str):
-        try:
-            key_points_prompt = json.loads(key_points_prompt)
-        except (json.JSONDecodeError, TypeError):
-            key_points_prompt = []
-    elif key_points_prompt is None:
-        key_points_prompt = []
+    # JSONB column: the driver already returns the list
+    key_points_prompt = template.key_points_prompt or []
     
     return {
         "id": template.id,
@@ -26,7 +53,6 @@ def template_to_response_with_key_points(template: Template) -> dict:
         "transcription_prompt": template.transcription_prompt,
         "summary_prompt": template.summary_prompt,
         "key_points_prompt": key_points_prompt,
-        "key_points": key_points_prompt,  # Same as key_points_prompt for backward compatibility
         "created_by": template.created_by,
         "created_at": template.created_at,
         "updated_at": template.updated_at,
@@ -61,17 +87,11 @@ def get_template_by_title(db: Session, title: str) -> Optional[Template]:
 
 def get_templates(db: Session, skip: int = 0, limit: int = 100, active_only: bool = True) -> List[Template]:
     """Get all templates with pagination"""
-    query = db.query(Template)
-    if active_only:
-        query = query.filter(Template.is_active == True)
-    return query.offset(skip).limit(limit).all()
+    return db.query(Template).filter(*_active_filters(active_only)).offset(skip).limit(limit).all()
 
 def get_templates_count(db: Session, active_only: bool = True) -> int:
     """Get total count of templates"""
-    query = db.query(Template)
-    if active_only:
-        query = query.filter(Template.is_active == True)
-    return query.count()
+    return _count_templates(db, _active_filters(active_only))
 
 def update_template(db: Session, template_id: UUID, template: TemplateUpdate) -> Optional[Template]:
     """Update a template"""
@@ -90,47 +110,29 @@ def update_template(db: Session, template_id: UUID, template: TemplateUpdate) ->
 
 def delete_template(db: Session, template_id: UUID) -> bool:
     """Soft delete a template by setting is_active to False"""
-    db_template = get_template(db, template_id)
-    if not db_template:
-        return False
-    
-    db_template.is_active = False
+    result = db.execute(
+        update(Template).where(Template.id == template_id).values(is_active=False)
+    )
     db.commit()
-    return True
+    return result.rowcount > 0
 
 def hard_delete_template(db: Session, template_id: UUID) -> bool:
     """Permanently delete a template from database"""
-    db_template = get_template(db, template_id)
-    if not db_template:
-        return False
-    
-    db.delete(db_template)
+    result = db.execute(delete(Template).where(Template.id == template_id))
     db.commit()
-    return True
+    return result.rowcount > 0
 
 def search_templates(db: Session, query: str, skip: int = 0, limit: int = 100, active_only: bool = True) -> List[Template]:
     """Search templates by title or description"""
-    search_query = db.query(Template).filter(
-        or_(
-            Template.title.contains(query),
-            Template.description.contains(query)
-        )
-    )
-    if active_only:
-        search_query = search_query.filter(Template.is_active == True)
-    return search_query.offset(skip).limit(limit).all()
+    return db.query(Template).filter(*_search_filters(query, active_only)).offset(skip).limit(limit).all()
 
 def search_templates_count(db: Session, query: str, active_only: bool = True) -> int:
     """Get count of search results"""
-    search_query = db.query(Template).filter(
-        or_(
-            Template.title.contains(query),
-            Template.description.contains(query)
-        )
-    )
-    if active_only:
-        search_query = search_query.filter(Template.is_active == True)
-    return search_query.count()
+    return _count_templates(db, _search_filters(query, active_only))
+
+def search_templates_with_count(db: Session, query: str, skip: int = 0, limit: int = 100, active_only: bool = True) -> Tuple[List[Template], int]:
+    """Search templates by title or description and return the page with the total count"""
+    return _paginate_with_total(db, _search_filters(query, active_only), skip, limit)
 
 def get_templates_with_filters(
     db: Session, 
@@ -142,17 +144,14 @@ def get_templates_with_filters(
     limit: int = 100
 ) -> Tuple[List[Template], int]:
     """Get templates with comprehensive filtering and return total count"""
-    query = db.query(Template)
-    
     # Apply active filter
-    if active_only:
-        query = query.filter(Template.is_active == True)
+    filters = _active_filters(active_only)
     
     # Apply created_by filter
     if created_by is not None:
         if include_default:
             # Include both user templates and default templates (created_by is NULL)
-            query = query.filter(
+            filters.append(
                 or_(
                     Template.created_by == created_by,
                     Template.created_by.is_(None)
@@ -160,28 +159,23 @@ def get_templates_with_filters(
             )
         else:
             # Only user templates
-            query = query.filter(Template.created_by == created_by)
+            filters.append(Template.created_by == created_by)
     elif not include_default:
         # Only user-created templates (exclude default templates)
-        query = query.filter(Template.created_by.isnot(None))
+        filters.append(Template.created_by.isnot(None))
     
     # Apply search filter
     if search:
         search_term = f"%{search}%"
-        query = query.filter(
+        filters.append(
             or_(
                 Template.title.ilike(search_term),
                 Template.description.ilike(search_term)
             )
         )
     
-    # Get total count before pagination
-    total = query.count()
-    
-    # Apply pagination
-    templates = query.order_by(Template.created_at.desc()).offset(skip).limit(limit).all()
-    
-    return templates, total
+    # Page and total count in a single query
+    return _paginate_with_total(db, filters, skip, limit, order_by=Template.created_at.desc())
 
 def get_default_templates(db: Session, skip: int = 0, limit: int = 100, active_only: bool = True) -> List[Template]:
     """Get default templates (created_by is NULL)"""
@@ -1,11 +1,12 @@
 import threading
-import time
 import logging
 from datetime import datetime, timedelta, timezone
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from database.connection import SessionLocal
 from api.models.meeting import MeetingRecord, TranscriptionStatus
-from api.services.meeting_service import finalize_meeting_recording
+from api.services.meeting_service import finalize_meeting_recording, has_recorded_audio
+from api.services.finalize_worker_service import finalize_worker_service
 
 logger = logging.getLogger(__name__)
 
@@ -15,17 +16,20 @@ class WatchdogService:
         self.timeout_minutes = timeout_minutes
         self.running = False
         self.thread = None
+        self.stop_event = threading.Event()
 
     def start(self):
         if self.running:
             return
         self.running = True
+        self.stop_event.clear()
         self.thread = threading.Thread(target=self._run_loop, daemon=True)
         self.thread.start()
         logger.info("🐶 Watchdog Service started")
 
     def stop(self):
         self.running = False
+        self.stop_event.set()
         if self.thread:
             self.thread.join(timeout=5)
             logger.info("🐶 Watchdog Service stopped")
@@ -37,11 +41,8 @@ class WatchdogService:
             except Exception as e:
                 logger.error(f"Error in Watchdog loop: {e}", exc_info=True)
             
-            # Sleep with check for stop signal
-            for _ in range(self.check_interval_seconds):
-                if not self.running:
-                    break
-                time.sleep(1)
+            # Sleep until the next check, waking immediately on stop()
+            self.stop_event.wait(self.check_interval_seconds)
 
     def _check_stale_recordings(self):
         db = SessionLocal()
@@ -51,31 +52,60 @@ class WatchdogService:
             now = datetime.now(timezone.utc)
             threshold = now - timedelta(minutes=self.timeout_minutes)
             
-            stale_meetings = db.query(MeetingRecord).filter(
+            # Only the columns the loop needs; full rows would load transcription/analytics JSONB
+            stale_meetings = db.query(MeetingRecord.id, MeetingRecord.updated_at).filter(
                 MeetingRecord.status == TranscriptionStatus.RECORDING,
                 MeetingRecord.updated_at < threshold
             ).all()
             
             if stale_meetings:
                 logger.info(f"🐶 Found {len(stale_meetings)} stale recordings to finalize")
+            
+            # Meetings with nothing on disk to stitch cannot be finalized; they are
+            # marked FAILED together with any finalization that returns None
+            failed_ids = []
+            for meeting_id, updated_at in stale_meetings:
+                if not has_recorded_audio(meeting_id):
+                    logger.warning(f"⚠️ Stale meeting {meeting_id} has no recorded audio. Marking as FAILED.")
+                    failed_ids.append(meeting_id)
+                    continue
                 
-            for meeting in stale_meetings:
                 try:
-                    logger.info(f"🐶 Auto-finalizing stale meeting {meeting.id} (Last updated: {meeting.updated_at})")
-                    
-                    # Call finalization logic
-                    finalized_meeting = finalize_meeting_recording(db, meeting.id)
-                    
-                    if finalized_meeting:
-                         logger.info(f"✅ Auto-finalized meeting {meeting.id}")
-                    else:
-                         # If finalization returned None (e.g. no audio), mark as FAILED to prevent infinite retries
-                         logger.warning(f"⚠️ Could not finalize meeting {meeting.id} (likely no audio). Marking as FAILED.")
-                         meeting.status = TranscriptionStatus.FAILED
-                         db.commit()
+                    with finalize_worker_service.claim(meeting_id) as acquired:
+                        if not acquired:
+                            # Already queued or running on the finalize worker pool
+                            logger.info(f"🐶 Meeting {meeting_id} is already being finalized, skipping")
+                            continue
+                        
+                        logger.info(f"🐶 Auto-finalizing stale meeting {meeting_id} (Last updated: {updated_at})")
+                        
+                        # Call finalization logic
+                        finalized_meeting = finalize_meeting_recording(db, meeting_id)
+                        
+                        if finalized_meeting:
+                             logger.info(f"✅ Auto-finalized meeting {meeting_id}")
+                        else:
+                             # If finalization returned None (e.g. no audio), mark as FAILED to prevent infinite retries
+                             logger.warning(f"⚠️ Could not finalize meeting {meeting_id} (likely no audio). Marking as FAILED.")
+                             failed_ids.append(meeting_id)
 
                 except Exception as e:
-                    logger.error(f"Error auto-finalizing meeting {meeting.id}: {e}")
+                    logger.error(f"Error auto-finalizing meeting {meeting_id}: {e}")
+                    db.rollback()
+            
+            if failed_ids:
+                # One UPDATE/commit for the whole batch; only rows still RECORDING are touched
+                db.execute(
+                    update(MeetingRecord)
+                    .where(
+                        MeetingRecord.id.in_(failed_ids),
+                        MeetingRecord.status == TranscriptionStatus.RECORDING
+                    )
+                    .values(status=TranscriptionStatus.FAILED)
+                    .execution_options(synchronize_session=False)
+                )
+                db.commit()
+                logger.info(f"🐶 Marked {len(failed_ids)} stale meetings as FAILED")
                     
         finally:
             db.close()
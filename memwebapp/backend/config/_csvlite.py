@@ -0,0 +1,26 @@
+def split_csv(s: str) -> tuple:
+    """
+    Split a comma-separated config value in one pass.
+    Commas inside double quotes do not split, so 'a.com,"b,inc.com"' gives
+    ('a.com', 'b,inc.com'). Entries are stripped of whitespace and surrounding
+    quotes; empty entries are dropped.
+    """
+    items = []
+    start = 0
+    in_quotes = False
+    for i, ch in enumerate(s):
+        if ch == '"':
+            in_quotes = not in_quotes
+        elif ch == ',' and not in_quotes:
+            items.append(s[start:i])
+            start = i + 1
+    items.append(s[start:])
+
+    out = []
+    for item in items:
+        item = item.strip()
+        if len(item) >= 2 and item[0] == item[-1] == '"':
+            item = item[1:-1].strip()
+        if item:
+            out.append(item)
+    return tuple(out)
@@ -0,0 +1,13 @@
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+# Environment loading
+# Several modules need .env values at import time; going through this helper
+# parses the file once per process instead of once per importing module.
+
+
+@lru_cache(maxsize=1)
+def ensure_env_loaded() -> None:
+    """Load .env into os.environ (without overriding real env vars) the first time it is called"""
+    load_dotenv(override=False)
@@ -0,0 +1,47 @@
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+# Logging configuration
+# Records are handed to a queue on the calling thread and formatted/written
+# by a QueueListener thread, so request and worker threads never block on
+# stream I/O.
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging(level: Optional[int] = None) -> None:
+    """
+    Route root logging through a QueueHandler/QueueListener pair.
+
+    Safe to call from several modules: the queue and listener are installed
+    once (replacing any handlers set by earlier basicConfig calls), and later
+    calls only adjust the root level when one is given.
+    """
+    global _listener
+    root = logging.getLogger()
+
+    if _listener is None:
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
+
+        log_queue = queue.Queue(-1)
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+            handler.close()
+        root.addHandler(QueueHandler(log_queue))
+
+        _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+
+        if level is None:
+            level = logging.INFO
+
+    if level is not None:
+        root.setLevel(level)
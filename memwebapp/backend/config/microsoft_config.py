@@ -1,7 +1,7 @@
 import os
-from dotenv import load_dotenv
+from config.env_config import ensure_env_loaded
 
-load_dotenv()
+ensure_env_loaded()
 
 # Microsoft Azure AD Configuration
 # These values need to be configured in your Azure portal
@@ -1,140 +1,229 @@
 import os
-from dotenv import load_dotenv
+from dataclasses import dataclass
+from config.env_config import ensure_env_loaded
+from config._csvlite import split_csv
 
-load_dotenv()
+ensure_env_loaded()
 
+def _env_bool(env, name: str, default: str = "false") -> bool:
+    return env.get(name, default).lower() == "true"
+
+def _env_list(env, name: str, default: str) -> tuple:
+    """Comma-separated env var as lowercased entries, in order (quoted entries may contain commas)"""
+    return tuple(item.lower() for item in split_csv(env.get(name, default)))
+
+def _build_cors_origins(ngrok_enabled: bool, ngrok_url: str, node_env: str, frontend_url: str, dashboard_base_url: str) -> tuple:
+    """CORS origins - Dynamic based on environment and ngrok, de-duplicated in one pass"""
+    candidates = [
+        "http://localhost:3000",
+        "http://localhost:5173",
+        "http://localhost:8000",
+        "http://127.0.0.1:3000",
+        "http://127.0.0.1:5173",
+        "http://127.0.0.1:8000",
+        "https://ext.makememo.ai",
+        "http://ext.makememo.ai",
+        "http://192.168.88.15",
+        "http://43.205.135.78",
+        "memoapp://auth/callback",
+    ]
+
+    # Add ngrok URL if enabled
+    if ngrok_enabled and ngrok_url:
+        # Add both http and https versions of ngrok URL
+        ngrok_base = ngrok_url.rstrip('/')
+        candidates.extend([
+            ngrok_base,
+            ngrok_base.replace('https://', 'http://'),
+            ngrok_base.replace('http://', 'https://'),
+            # Add ngrok callback URLs for mobile apps
+            f"{ngrok_base}/auth/microsoft/callback",
+            f"{ngrok_base}/auth/google/callback",
+            f"{ngrok_base}/auth/callback"
+        ])
+
+    # Add local network IPs for mobile device testing
+    if node_env == "development":
+        # Common local network ranges
+        candidates.extend([
+            "http://192.168.1.0/24",
+            "http://192.168.0.0/24",
+            "http://10.0.0.0/24",
+            "http://172.16.0.0/24"
+        ])
+
+    # Production: allow FRONTEND_URL and DASHBOARD_BASE_URL so CORS works when served via nginx
+    candidates.extend(url for url in (frontend_url, dashboard_base_url) if url)
+
+    seen = set()
+    origins = []
+    for url in candidates:
+        origin = url.rstrip("/")
+        if origin not in seen:
+            seen.add(origin)
+            origins.append(origin)
+    return tuple(origins)
+
+def _build_base_url(ngrok_enabled: bool, ngrok_url: str, https_enabled: bool, host: str, port: int) -> str:
+    """Get the current base URL for the application"""
+    if ngrok_enabled and ngrok_url:
+        return ngrok_url.rstrip('/')
+    elif https_enabled:
+        return f"https://{host}:{port}"
+    else:
+        return f"http://{host}:{port}"
+
+@dataclass(frozen=True, slots=True)
 class Settings:
+    """
+    Immutable snapshot of the environment, read once at import.
+    Derived values (CORS origins, base URL, primary company domain) are computed
+    here instead of on every access.
+    """
     # Database settings
-    DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./meeting_records.db")
-    
+    DATABASE_URL: str
+
     # Server settings
-    HOST: str = os.getenv("HOST", "0.0.0.0")
-    PORT: int = int(os.getenv("PORT", 8000))
-    HTTPS_ENABLED: bool = os.getenv("HTTPS_ENABLED", "false").lower() == "true"
-    
+    HOST: str
+    PORT: int
+    HTTPS_ENABLED: bool
+
     # Google Generative AI settings
-    GEMINI_KEY: str = os.getenv("GEMINI_KEY", "")
-    
+    GEMINI_KEY: str
+
     # Audio processing settings
-    MAX_AUDIO_FILE_SIZE: str = os.getenv("MAX_AUDIO_FILE_SIZE", "50MB")
-    SUPPORTED_AUDIO_FORMATS: list = os.getenv("SUPPORTED_AUDIO_FORMATS", "mp3,wav,m4a,flac,webm,opus").split(",")
-    
+    MAX_AUDIO_FILE_SIZE: str
+    SUPPORTED_AUDIO_FORMATS: frozenset
+    FINALIZE_MAX_WORKERS: int
+    ANALYTICS_MAX_WORKERS: int
+    BATCH_ANALYTICS_INTERVAL_MINUTES: int  # How often batch-mode meetings are sent to the Gemini Batch API
+
     # Microsoft Authentication settings
-    MICROSOFT_CLIENT_ID: str = os.getenv("MICROSOFT_CLIENT_ID", "")
-    MICROSOFT_CLIENT_SECRET: str = os.getenv("MICROSOFT_CLIENT_SECRET", "")
-    MICROSOFT_TENANT_ID: str = os.getenv("MICROSOFT_TENANT_ID", "")
-    MICROSOFT_REDIRECT_URI: str = os.getenv("MICROSOFT_REDIRECT_URI", "")
-    
+    MICROSOFT_CLIENT_ID: str
+    MICROSOFT_CLIENT_SECRET: str
+    MICROSOFT_TENANT_ID: str
+    MICROSOFT_REDIRECT_URI: str
+
     # Google Authentication settings
-    GOOGLE_CLIENT_ID: str = os.getenv("GOOGLE_CLIENT_ID", "")
-    GOOGLE_CLIENT_SECRET: str = os.getenv("GOOGLE_CLIENT_SECRET", "")
-    GOOGLE_REDIRECT_URI: str = os.getenv("GOOGLE_REDIRECT_URI", "")
-    
+    GOOGLE_CLIENT_ID: str
+    GOOGLE_CLIENT_SECRET: str
+    GOOGLE_REDIRECT_URI: str
+
     # Ngrok settings
-    NGROK_URL: str = os.getenv("NGROK_URL", "")
-    NGROK_ENABLED: bool = os.getenv("NGROK_ENABLED", "false").lower() == "true"
-    
+    NGROK_URL: str
+    NGROK_ENABLED: bool
+
     # Application settings
-    APP_NAME: str = os.getenv("APP_NAME", "Memo App")
-    APP_VERSION: str = "1.0.0"
-    APP_DESCRIPTION: str = "API for managing meeting records with audio processing capabilities"
+    APP_NAME: str
+    APP_VERSION: str
+    APP_DESCRIPTION: str
     # Company domains - can be a single domain or comma-separated list
-    COMPANY_DOMAINS: list = os.getenv("COMPANY_DOMAINS", "panscience.ai").split(",")
-    
-    # Backward compatibility - keep COMPANY_DOMAIN for existing code
-    @property
-    def COMPANY_DOMAIN(self) -> str:
-        """Get the first company domain for backward compatibility"""
-        return self.COMPANY_DOMAINS[0] if self.COMPANY_DOMAINS else "panscience.ai"
-    
+    COMPANY_DOMAINS: frozenset
+    # Backward compatibility - first company domain for existing code
+    COMPANY_DOMAIN: str
+
     # Environment settings
-    NODE_ENV: str = os.getenv("NODE_ENV", "development")
-    
+    NODE_ENV: str
+
     # JWT settings
-    JWT_SECRET: str = os.getenv("JWT_SECRET", "your-super-secret-jwt-key-here")
-    JWT_ALGORITHM: str = os.getenv("JWT_ALGORITHM", "HS256")
-    JWT_ACCESS_TOKEN_EXPIRE_HOURS: int = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRE_HOURS", "6"))  # 6 hours
-    JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = int(os.getenv("JWT_REFRESH_TOKEN_EXPIRE_DAYS", "7"))  # 7 days
-    
+    JWT_SECRET: str
+    JWT_ALGORITHM: str
+    JWT_ACCESS_TOKEN_EXPIRE_HOURS: int
+    JWT_REFRESH_TOKEN_EXPIRE_DAYS: int
+
     # Dashboard settings
-    DASHBOARD_BASE_URL: str = os.getenv("DASHBOARD_BASE_URL", "http://localhost:5173")
-    DASHBOARD_USERNAME: str = os.getenv("USERNAME", "")
-    DASHBOARD_PASSWORD: str = os.getenv("PASSWORD", "")
-    
+    DASHBOARD_BASE_URL: str
+    DASHBOARD_USERNAME: str
+    DASHBOARD_PASSWORD: str
+
     # Frontend settings
-    FRONTEND_URL: str = os.getenv("FRONTEND_URL", "http://localhost:5173")
-    
+    FRONTEND_URL: str
+
     # AWS S3 settings
-    AWS_ACCESS_KEY_ID: str = os.getenv("AWS_ACCESS_KEY_ID", "")
-    AWS_SECRET_ACCESS_KEY: str = os.getenv("AWS_SECRET_ACCESS_KEY", "")
-    AWS_REGION: str = os.getenv("AWS_REGION", "us-east-1")
-    S3_BUCKET_NAME: str = os.getenv("S3_BUCKET_NAME", "memoapp-audio-files")
-    S3_AUDIO_PREFIX: str = os.getenv("S3_AUDIO_PREFIX", "meetings/audio/")
-    
-    # CORS settings - Dynamic based on environment and ngrok
-    @property
-    def CORS_ORIGINS(self) -> list:
-        origins = [
-            "http://localhost:3000",
-            "http://localhost:5173",
-            "http://localhost:8000",
-            "http://127.0.0.1:3000",
-            "http://127.0.0.1:5173",
-            "http://127.0.0.1:8000",
-            "https://ext.makememo.ai",
-            "http://ext.makememo.ai",
-            "http://192.168.88.15",
-            "http://43.205.135.78",
-            "memoapp://auth/callback",
-        ]
-        
-        # Add ngrok URL if enabled
-        if self.NGROK_ENABLED and self.NGROK_URL:
-            # Add both http and https versions of ngrok URL
-            ngrok_base = self.NGROK_URL.rstrip('/')
-            origins.extend([
-                f"{ngrok_base}",
-                f"{ngrok_base.replace('https://', 'http://')}",
-                f"{ngrok_base.replace('http://', 'https://')}"
-            ])
-            
-            # Add ngrok callback URLs for mobile apps
-            origins.extend([
-                f"{ngrok_base}/auth/microsoft/callback",
-                f"{ngrok_base}/auth/google/callback",
-                f"{ngrok_base}/auth/callback"
-            ])
-        
-        # Add local network IPs for mobile device testing
-        if self.NODE_ENV == "development":
-            # Common local network ranges
-            local_ips = [
-                "http://192.168.1.0/24",
-                "http://192.168.0.0/24", 
-                "http://10.0.0.0/24",
-                "http://172.16.0.0/24"
-            ]
-            origins.extend(local_ips)
-        
-        # Production: allow FRONTEND_URL and DASHBOARD_BASE_URL so CORS works when served via nginx
-        for url in (self.FRONTEND_URL, self.DASHBOARD_BASE_URL):
-            if url and url.rstrip("/") not in [o.rstrip("/") for o in origins]:
-                origins.append(url.rstrip("/"))
-        
-        return origins
-    
-    CORS_ALLOW_CREDENTIALS: bool = True
-    CORS_ALLOW_METHODS: list = ["*"]
-    CORS_ALLOW_HEADERS: list = ["*"]
-    
-    # Get the current base URL for the application
-    @property
-    def BASE_URL(self) -> str:
-        if self.NGROK_ENABLED and self.NGROK_URL:
-            return self.NGROK_URL.rstrip('/')
-        elif self.HTTPS_ENABLED:
-            return f"https://{self.HOST}:{self.PORT}"
-        else:
-            return f"http://{self.HOST}:{self.PORT}"
-
-settings = Settings() 
\ No newline at end of file
+    AWS_ACCESS_KEY_ID: str
+    AWS_SECRET_ACCESS_KEY: str
+    AWS_REGION: str
+    S3_BUCKET_NAME: str
+    S3_AUDIO_PREFIX: str
+    # Optional long-lived keys used only to sign presigned URLs, so URL lifetime is not
+    # capped by short-lived role credentials
+    S3_PRESIGN_ACCESS_KEY_ID: str
+    S3_PRESIGN_SECRET_ACCESS_KEY: str
+    S3_USE_ACCELERATE_ENDPOINT: bool  # Bucket must have Transfer Acceleration enabled
+    S3_UPLOAD_CONCURRENCY: int  # Multipart parts uploaded in parallel
+
+    # CORS settings
+    CORS_ORIGINS: tuple
+    CORS_ALLOW_CREDENTIALS: bool
+    CORS_ALLOW_METHODS: tuple
+    CORS_ALLOW_HEADERS: tuple
+
+    # Current base URL for the application
+    BASE_URL: str
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Build the settings snapshot from os.environ"""
+        env = os.environ
+
+        host = env.get("HOST", "0.0.0.0")
+        port = int(env.get("PORT", 8000))
+        https_enabled = _env_bool(env, "HTTPS_ENABLED")
+        ngrok_url = env.get("NGROK_URL", "")
+        ngrok_enabled = _env_bool(env, "NGROK_ENABLED")
+        node_env = env.get("NODE_ENV", "development")
+        dashboard_base_url = env.get("DASHBOARD_BASE_URL", "http://localhost:5173")
+        frontend_url = env.get("FRONTEND_URL", "http://localhost:5173")
+        company_domains = _env_list(env, "COMPANY_DOMAINS", "panscience.ai")
+
+        return cls(
+            DATABASE_URL=env.get("DATABASE_URL", "sqlite:///./meeting_records.db"),
+            HOST=host,
+            PORT=port,
+            HTTPS_ENABLED=https_enabled,
+            GEMINI_KEY=env.get("GEMINI_KEY", ""),
+            MAX_AUDIO_FILE_SIZE=env.get("MAX_AUDIO_FILE_SIZE", "50MB"),
+            SUPPORTED_AUDIO_FORMATS=frozenset(_env_list(env, "SUPPORTED_AUDIO_FORMATS", "mp3,wav,m4a,flac,webm,opus")),
+            FINALIZE_MAX_WORKERS=int(env.get("FINALIZE_MAX_WORKERS", "2")),
+            ANALYTICS_MAX_WORKERS=int(env.get("ANALYTICS_MAX_WORKERS", "4")),
+            BATCH_ANALYTICS_INTERVAL_MINUTES=int(env.get("BATCH_ANALYTICS_INTERVAL_MINUTES", "60")),
+            MICROSOFT_CLIENT_ID=env.get("MICROSOFT_CLIENT_ID", ""),
+            MICROSOFT_CLIENT_SECRET=env.get("MICROSOFT_CLIENT_SECRET", ""),
+            MICROSOFT_TENANT_ID=env.get("MICROSOFT_TENANT_ID", ""),
+            MICROSOFT_REDIRECT_URI=env.get("MICROSOFT_REDIRECT_URI", ""),
+            GOOGLE_CLIENT_ID=env.get("GOOGLE_CLIENT_ID", ""),
+            GOOGLE_CLIENT_SECRET=env.get("GOOGLE_CLIENT_SECRET", ""),
+            GOOGLE_REDIRECT_URI=env.get("GOOGLE_REDIRECT_URI", ""),
+            NGROK_URL=ngrok_url,
+            NGROK_ENABLED=ngrok_enabled,
+            APP_NAME=env.get("APP_NAME", "Memo App"),
+            APP_VERSION="1.0.0",
+            APP_DESCRIPTION="API for managing meeting records with audio processing capabilities",
+            COMPANY_DOMAINS=frozenset(company_domains),
+            COMPANY_DOMAIN=company_domains[0] if company_domains else "panscience.ai",
+            NODE_ENV=node_env,
+            JWT_SECRET=env.get("JWT_SECRET", "your-super-secret-jwt-key-here"),
+            JWT_ALGORITHM=env.get("JWT_ALGORITHM", "HS256"),
+            JWT_ACCESS_TOKEN_EXPIRE_HOURS=int(env.get("JWT_ACCESS_TOKEN_EXPIRE_HOURS", "6")),  # 6 hours
+            JWT_REFRESH_TOKEN_EXPIRE_DAYS=int(env.get("JWT_REFRESH_TOKEN_EXPIRE_DAYS", "7")),  # 7 days
+            DASHBOARD_BASE_URL=dashboard_base_url,
+            DASHBOARD_USERNAME=env.get("USERNAME", ""),
+            DASHBOARD_PASSWORD=env.get("PASSWORD", ""),
+            FRONTEND_URL=frontend_url,
+            AWS_ACCESS_KEY_ID=env.get("AWS_ACCESS_KEY_ID", ""),
+            AWS_SECRET_ACCESS_KEY=env.get("AWS_SECRET_ACCESS_KEY", ""),
+            AWS_REGION=env.get("AWS_REGION", "us-east-1"),
+            S3_BUCKET_NAME=env.get("S3_BUCKET_NAME", "memoapp-audio-files"),
+            S3_AUDIO_PREFIX=env.get("S3_AUDIO_PREFIX", "meetings/audio/"),
+            S3_PRESIGN_ACCESS_KEY_ID=env.get("S3_PRESIGN_ACCESS_KEY_ID", ""),
+            S3_PRESIGN_SECRET_ACCESS_KEY=env.get("S3_PRESIGN_SECRET_ACCESS_KEY", ""),
+            S3_USE_ACCELERATE_ENDPOINT=_env_bool(env, "S3_USE_ACCELERATE_ENDPOINT"),
+            S3_UPLOAD_CONCURRENCY=int(env.get("S3_UPLOAD_CONCURRENCY", "10")),
+            CORS_ORIGINS=_build_cors_origins(ngrok_enabled, ngrok_url, node_env, frontend_url, dashboard_base_url),
+            CORS_ALLOW_CREDENTIALS=True,
+            CORS_ALLOW_METHODS=("*",),
+            CORS_ALLOW_HEADERS=("*",),
+            BASE_URL=_build_base_url(ngrok_enabled, ngrok_url, https_enabled, host, port),
+        )
+
+settings = Settings.from_env()
@@ -9,39 +9,28 @@ import sys
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
-# Add parent directory to path to import config
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config.settings import settings
+from dotenv import load_dotenv
+
+# Only DATABASE_URL is needed, so read it straight from the environment (.env included)
+load_dotenv()
+DATABASE_URL = os.environ["DATABASE_URL"]
 
 def run_migration():
     """Add custom_template_points column to meeting_records table."""
     
     # Database connection
-    DATABASE_URL = settings.DATABASE_URL
     engine = create_engine(DATABASE_URL)
     
     try:
         with engine.connect() as connection:
-            # Check if column already exists
-            result = connection.execute(text("""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name='meeting_records' 
-                AND column_name='custom_template_points'
-            """))
-            
-            if result.fetchone():
-                print("✅ Column 'custom_template_points' already exists in meeting_records table.")
-                return
-            
-            # Add the new column
+            # Add the new column (no-op if it already exists) in a single round-trip
             connection.execute(text("""
                 ALTER TABLE meeting_records 
-                ADD COLUMN custom_template_points TEXT
+                ADD COLUMN IF NOT EXISTS custom_template_points TEXT
             """))
             
             connection.commit()
-            print("✅ Successfully added 'custom_template_points' column to meeting_records table.")
+            print("✅ Column 'custom_template_points' is present in meeting_records table.")
             
     except Exception as e:
         print(f"❌ Error running migration: {e}")
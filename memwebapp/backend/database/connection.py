@@ -1,27 +1,68 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 import os
-from dotenv import load_dotenv
+import orjson
+from config.env_config import ensure_env_loaded
 
-load_dotenv()
+ensure_env_loaded()
 
 # Database URL - using PostgreSQL
 # Database URL
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./meeting_records.db")
 
+def _with_psycopg_driver(url: str) -> str:
+    """Use psycopg (v3) for plain postgres:// / postgresql:// URLs; explicit drivers are kept"""
+    for prefix in ("postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+psycopg://" + url[len(prefix):]
+    return url
+
 connect_args = {}
 if "sqlite" in DATABASE_URL:
     connect_args = {"check_same_thread": False}
 
+if "sqlite" in DATABASE_URL and ":memory:" in DATABASE_URL:
+    # In-memory SQLite: every connection must share the one database
+    pool_args = {"poolclass": StaticPool}
+else:
+    # Sized for concurrent uploads/finalization; connections are recycled often enough
+    # that the per-checkout pre-ping SELECT 1 is off unless DB_PRE_PING=true
+    pool_args = {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+        "max_overflow": int(os.getenv("DB_POOL_OVERFLOW", "40")),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "10")),
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "300")),
+        "pool_pre_ping": os.getenv("DB_PRE_PING", "false").lower() == "true",
+    }
+
+def _json_serializer(value) -> str:
+    """Encode JSON/JSONB column values with orjson (str output, as the driver expects)"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
 engine = create_engine(
-    DATABASE_URL,
+    _with_psycopg_driver(DATABASE_URL),
     connect_args=connect_args,
-    # Pool settings are handled differently for SQLite
-    pool_pre_ping=True,
-    pool_recycle=300
+    **pool_args,
+    # Rows per multi-VALUES INSERT batch for executemany-style bulk inserts
+    insertmanyvalues_page_size=10000,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+if engine.dialect.driver == "psycopg":
+    # psycopg decodes json/jsonb columns itself, so hook orjson in at the driver level too
+    import psycopg.types.json
+    psycopg.types.json.set_json_loads(orjson.loads)
+elif engine.dialect.driver == "psycopg2":
+    # psycopg2 decodes json/jsonb columns itself, so hook orjson in at the driver level too
+    import psycopg2.extras
+    psycopg2.extras.register_default_json(loads=orjson.loads, globally=True)
+    psycopg2.extras.register_default_jsonb(loads=orjson.loads, globally=True)
+
+# expire_on_commit=False: objects stay loaded after commit, so endpoints that commit and
+# then serialize the row do not issue a SELECT per expired instance
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
 
 def get_db():
     db = SessionLocal()
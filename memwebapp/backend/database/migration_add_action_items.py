@@ -4,16 +4,16 @@ Migration script to add action_items column to meeting_records table
 This script adds a new JSON column to store action items extracted from transcriptions
 """
 
-import sys
 import os
 import logging
 from sqlalchemy import text, create_engine
 from sqlalchemy.orm import sessionmaker
 
-# Add the parent directory to Python path to import config
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dotenv import load_dotenv
 
-from config.settings import settings
+# Only DATABASE_URL is needed, so read it straight from the environment (.env included)
+load_dotenv()
+DATABASE_URL = os.environ["DATABASE_URL"]
 
 # Setup logging with timestamps
 logging.basicConfig(
@@ -27,34 +27,22 @@ def migrate_add_action_items():
     """Add action_items column to meeting_records table"""
     
     # Create engine and session
-    engine = create_engine(settings.DATABASE_URL)
+    engine = create_engine(DATABASE_URL)
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     
     with SessionLocal() as db:
         try:
             logger.info("Starting migration to add action_items column...")
             
-            # Check if column already exists
-            result = db.execute(text("""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name='meeting_records' AND column_name='action_items'
-            """))
-            exists = result.fetchone()
-            
-            if exists:
-                logger.info("action_items column already exists. Migration not needed.")
-                return
-            
-            # Add the column
-            logger.info("Adding action_items column to meeting_records table...")
+            # Add the column (no-op if it already exists) in a single round-trip
+            logger.info("Ensuring action_items column on meeting_records table...")
             db.execute(text("""
                 ALTER TABLE meeting_records 
-                ADD COLUMN action_items JSON
+                ADD COLUMN IF NOT EXISTS action_items JSON
             """))
             db.commit()
             
-            logger.info("Migration completed successfully! action_items column added.")
+            logger.info("Migration completed successfully! action_items column is present.")
             
         except Exception as e:
             logger.error(f"Migration failed: {str(e)}")
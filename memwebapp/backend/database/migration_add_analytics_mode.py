@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Migration script to add analytics_mode column to meeting_records table
+"sync" (default) runs analytics inline after transcription; "batch" defers mobile
+analytics to the discounted Gemini Batch API for low-priority meetings
+"""
+
+import sys
+import os
+import logging
+from sqlalchemy import text, create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the parent directory to Python path to import config
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+
+# Setup logging with timestamps
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+def migrate_add_analytics_mode():
+    """Add analytics_mode column to meeting_records table"""
+    
+    # Create engine and session
+    engine = create_engine(settings.DATABASE_URL)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    
+    with SessionLocal() as db:
+        try:
+            logger.info("Starting migration to add analytics_mode column...")
+            
+            # Check if column already exists
+            result = db.execute(text("""
+                SELECT attname AS column_name
+                FROM pg_attribute
+                WHERE attrelid = to_regclass('public.meeting_records') AND attname = 'analytics_mode' AND NOT attisdropped
+            """))
+            exists = result.fetchone()
+            
+            if exists:
+                logger.info("analytics_mode column already exists. Migration not needed.")
+                return
+            
+            # Add the column
+            logger.info("Adding analytics_mode column to meeting_records table...")
+            db.execute(text("""
+                ALTER TABLE meeting_records 
+                ADD COLUMN analytics_mode VARCHAR NOT NULL DEFAULT 'sync'
+            """))
+            db.commit()
+            
+            logger.info("Migration completed successfully! analytics_mode column added.")
+            
+        except Exception as e:
+            logger.error(f"Migration failed: {str(e)}")
+            db.rollback()
+            raise
+
+if __name__ == "__main__":
+    migrate_add_analytics_mode()
+
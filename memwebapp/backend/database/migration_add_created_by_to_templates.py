@@ -9,75 +9,43 @@ import os
 import sys
 from sqlalchemy import create_engine, text
 
-# Add parent directory to path to import config
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config.settings import settings
+from dotenv import load_dotenv
+
+# Only DATABASE_URL is needed, so read it straight from the environment (.env included)
+load_dotenv()
+DATABASE_URL = os.environ["DATABASE_URL"]
 
 def run_migration():
     """Add created_by field to templates table"""
     
     # Database connection
-    DATABASE_URL = settings.DATABASE_URL
     engine = create_engine(DATABASE_URL)
     
     try:
         with engine.connect() as connection:
-            # Check if templates table exists
-            result = connection.execute(text("""
-                SELECT EXISTS (
-                    SELECT FROM information_schema.tables 
-                    WHERE table_name = 'templates'
-                )
-            """))
-            
-            if not result.fetchone()[0]:
-                print("❌ Templates table does not exist. Please run the main migration first.")
-                return False
-            
-            # Check if created_by column already exists
-            column_check = connection.execute(text("""
-                SELECT EXISTS (
-                    SELECT FROM information_schema.columns 
-                    WHERE table_name = 'templates' AND column_name = 'created_by'
-                )
-            """))
-            
-            if column_check.fetchone()[0]:
-                print("⚠️  created_by column already exists in templates table.")
-                return True
-            
             print("🔄 Adding created_by column to templates table...")
             
-            # Add created_by column
+            # Table check and column in one DO block: one round-trip, one transaction
             connection.execute(text("""
-                ALTER TABLE templates 
-                ADD COLUMN created_by INTEGER REFERENCES users(id)
-            """))
-            
-            # Add index for better query performance
-            connection.execute(text("""
-                CREATE INDEX idx_templates_created_by ON templates(created_by)
+                DO $$
+                BEGIN
+                    IF to_regclass('public.templates') IS NULL THEN
+                        RAISE EXCEPTION 'Templates table does not exist. Please run the main migration first.';
+                    END IF;
+                    ALTER TABLE templates ADD COLUMN IF NOT EXISTS created_by INTEGER REFERENCES users(id);
+                END $$;
             """))
             
             connection.commit()
-            print("✅ Successfully added created_by column to templates table.")
-            print("✅ Added index on created_by column for better performance.")
-            
-            # Verify the column was added
-            verify_result = connection.execute(text("""
-                SELECT column_name, data_type, is_nullable 
-                FROM information_schema.columns 
-                WHERE table_name = 'templates' AND column_name = 'created_by'
+            print("✅ created_by column is present on templates table.")
+        
+        # CONCURRENTLY builds the index without blocking writes to templates; it cannot run
+        # inside a transaction block, hence the autocommit connection
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            connection.execute(text("""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_templates_created_by ON templates(created_by)
             """))
-            
-            column_info = verify_result.fetchone()
-            if column_info:
-                print(f"✅ Verification: created_by column added successfully")
-                print(f"   - Data type: {column_info[1]}")
-                print(f"   - Nullable: {column_info[2]}")
-            else:
-                print("❌ Verification failed: created_by column not found")
-                return False
+            print("✅ idx_templates_created_by index is present on templates table.")
             
             return True
             
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Migration script to add composite indexes on meeting_records
+Covers the (user_id, created_at DESC) list ordering, (user_id, status) filters and
+the watchdog's pending-with-audio lookup. Mirrors MeetingRecord.__table_args__
+"""
+
+import sys
+import os
+import logging
+from sqlalchemy import text, create_engine
+
+# Add the parent directory to Python path to import config
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+
+# Setup logging with timestamps
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+COMPOSITE_INDEXES = [
+    ("ix_meeting_records_user_created", "(user_id, created_at DESC)", ""),
+    ("ix_meeting_records_user_status", "(user_id, status)", ""),
+    ("ix_meeting_records_pending_with_audio", "(status)", "WHERE audio_filename IS NOT NULL AND audio_filename <> ''"),
+]
+
+def migrate_add_meeting_composite_indexes():
+    """Add composite indexes on meeting_records"""
+    
+    engine = create_engine(settings.DATABASE_URL)
+    
+    # CONCURRENTLY builds the indexes without blocking writes to meeting_records; it cannot
+    # run inside a transaction block, hence the autocommit connection
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        try:
+            logger.info("Starting migration to add meeting composite indexes...")
+            
+            for index_name, columns, where_clause in COMPOSITE_INDEXES:
+                logger.info(f"Creating index {index_name}...")
+                connection.execute(text(f"""
+                    CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name}
+                    ON meeting_records {columns} {where_clause}
+                """))
+            
+            logger.info("Migration completed successfully! Composite indexes created.")
+        
+        except Exception as e:
+            # An interrupted concurrent build leaves an INVALID index that IF NOT EXISTS skips;
+            # drop it before re-running
+            logger.error(f"Migration failed: {str(e)}")
+            raise
+
+if __name__ == "__main__":
+    migrate_add_meeting_composite_indexes()
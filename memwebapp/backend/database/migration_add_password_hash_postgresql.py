@@ -6,12 +6,13 @@ import os
 import sys
 from sqlalchemy import create_engine, text
 from sqlalchemy.exc import SQLAlchemyError
-from dotenv import load_dotenv
 
 # Add the parent directory to the path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-load_dotenv()
+from config.env_config import ensure_env_loaded
+
+ensure_env_loaded()
 
 def migrate():
     """Add password_hash column to users table"""
@@ -28,20 +29,11 @@ def migrate():
         engine = create_engine(DATABASE_URL)
         
         with engine.connect() as conn:
-            # Check if column exists
-            result = conn.execute(text("""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name='users' AND column_name='password_hash'
-            """))
-            
-            if result.fetchone():
-                print("⚠️  password_hash column already exists in users table")
-            else:
-                print("➕ Adding password_hash column to users table...")
-                conn.execute(text("ALTER TABLE users ADD COLUMN password_hash VARCHAR(255)"))
-                conn.commit()
-                print("✅ password_hash column added successfully")
+            # Add the column (no-op if it already exists) in a single round-trip
+            print("➕ Ensuring password_hash column on users table...")
+            conn.execute(text("ALTER TABLE users ADD COLUMN IF NOT EXISTS password_hash VARCHAR(255)"))
+            conn.commit()
+            print("✅ password_hash column is present")
                 
         return True
         
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Migration script to add pg_trgm GIN indexes for speaker profile and template search
+Indexes the columns OR'd together by search_speaker_profiles and the template
+searches so their LIKE/ILIKE '%term%' filters can use bitmap index scans
+instead of sequential scans
+"""
+
+import sys
+import os
+import logging
+from sqlalchemy import text, create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the parent directory to Python path to import config
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+
+# Setup logging with timestamps
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# Columns must match the ones filtered by speaker_profile_service.search_speaker_profiles
+# and template_service's search queries
+SEARCH_INDEXES = [
+    ("speaker_profiles", "ix_speaker_profiles_first_name_trgm", "first_name"),
+    ("speaker_profiles", "ix_speaker_profiles_last_name_trgm", "last_name"),
+    ("speaker_profiles", "ix_speaker_profiles_email_trgm", "email"),
+    ("speaker_profiles", "ix_speaker_profiles_company_trgm", "company"),
+    ("templates", "ix_templates_title_trgm", "title"),
+    ("templates", "ix_templates_description_trgm", "description"),
+]
+
+def migrate_add_profile_template_trgm_indexes():
+    """Enable pg_trgm and add trigram indexes on speaker profile and template search columns"""
+    
+    # Create engine and session
+    engine = create_engine(settings.DATABASE_URL)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    
+    with SessionLocal() as db:
+        try:
+            logger.info("Starting migration to add speaker profile / template trigram indexes...")
+            
+            db.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            
+            for table, index_name, column in SEARCH_INDEXES:
+                logger.info(f"Creating index {index_name}...")
+                db.execute(text(f"""
+                    CREATE INDEX IF NOT EXISTS {index_name}
+                    ON {table} USING gin ({column} gin_trgm_ops)
+                """))
+            db.commit()
+            
+            logger.info("Migration completed successfully! Speaker profile / template trigram indexes created.")
+        
+        except Exception as e:
+            logger.error(f"Migration failed: {str(e)}")
+            db.rollback()
+            raise
+
+if __name__ == "__main__":
+    migrate_add_profile_template_trgm_indexes()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Migration script to add pg_trgm GIN indexes for meeting search
+Indexes title, participants::text and transcription::text so the ILIKE '%term%'
+search filters can use index scans instead of sequential scans
+"""
+
+import sys
+import os
+import logging
+from sqlalchemy import text, create_engine
+
+# Add the parent directory to Python path to import config
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+
+# Setup logging with timestamps
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# Expressions must match the ones used by meeting_service._text_search_clause
+SEARCH_INDEXES = [
+    ("ix_meeting_records_title_trgm", "title"),
+    ("ix_meeting_records_participants_trgm", "(participants::text)"),
+    ("ix_meeting_records_transcription_trgm", "(transcription::text)"),
+]
+
+def migrate_add_search_trgm_indexes():
+    """Enable pg_trgm and add trigram indexes on meeting_records search columns"""
+    
+    engine = create_engine(settings.DATABASE_URL)
+    
+    # CONCURRENTLY builds the indexes without blocking writes to meeting_records; it cannot
+    # run inside a transaction block, hence the autocommit connection
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        try:
+            logger.info("Starting migration to add search trigram indexes...")
+            
+            connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            
+            for index_name, expression in SEARCH_INDEXES:
+                logger.info(f"Creating index {index_name}...")
+                connection.execute(text(f"""
+                    CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name}
+                    ON meeting_records USING gin ({expression} gin_trgm_ops)
+                """))
+            
+            logger.info("Migration completed successfully! Search trigram indexes created.")
+        
+        except Exception as e:
+            # An interrupted concurrent build leaves an INVALID index that IF NOT EXISTS skips;
+            # drop it before re-running
+            logger.error(f"Migration failed: {str(e)}")
+            raise
+
+if __name__ == "__main__":
+    migrate_add_search_trgm_indexes()
@@ -8,9 +8,11 @@ import os
 import sys
 from sqlalchemy import create_engine, text
 
-# Add parent directory to path to import config
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config.settings import settings
+from dotenv import load_dotenv
+
+# Only DATABASE_URL is needed, so read it straight from the environment (.env included)
+load_dotenv()
+DATABASE_URL = os.environ["DATABASE_URL"]
 
 # Default speaker diarization prompt
 DEFAULT_SPEAKER_DIARIZATION_PROMPT = """**SPEAKER IDENTIFICATION:**
@@ -25,81 +27,38 @@ def run_migration():
     """Add speaker_diarization field to templates table"""
     
     # Database connection
-    DATABASE_URL = settings.DATABASE_URL
     engine = create_engine(DATABASE_URL)
     
     try:
         with engine.connect() as connection:
-            # Check if templates table exists
-            result = connection.execute(text("""
-                SELECT EXISTS (
-                    SELECT FROM information_schema.tables 
-                    WHERE table_name = 'templates'
-                )
-            """))
-            
-            if not result.fetchone()[0]:
-                print("❌ Templates table does not exist. Please run the main migration first.")
-                return False
+            print("🔄 Adding speaker_diarization column to templates table...")
             
-            # Check if speaker_diarization column already exists
-            column_check = connection.execute(text("""
-                SELECT EXISTS (
-                    SELECT FROM information_schema.columns 
-                    WHERE table_name = 'templates' AND column_name = 'speaker_diarization'
-                )
+            # Fail early if the templates table is missing
+            connection.execute(text("""
+                DO $$
+                BEGIN
+                    IF to_regclass('public.templates') IS NULL THEN
+                        RAISE EXCEPTION 'Templates table does not exist. Please run the main migration first.';
+                    END IF;
+                END $$;
             """))
             
-            if column_check.fetchone()[0]:
-                print("⚠️  speaker_diarization column already exists in templates table.")
-                return True
-            
-            print("🔄 Adding speaker_diarization column to templates table...")
-            
-            # Add speaker_diarization column
+            # Adding the column with a constant DEFAULT is metadata-only on Postgres 11+: existing
+            # templates read the prompt without a table rewrite or UPDATE pass. The default is then
+            # dropped so new templates keep NULL unless a prompt is set, as before.
+            connection.execute(text("""
+                ALTER TABLE templates 
+                ADD COLUMN IF NOT EXISTS speaker_diarization TEXT DEFAULT :prompt
+            """).bindparams(prompt=DEFAULT_SPEAKER_DIARIZATION_PROMPT))
             connection.execute(text("""
                 ALTER TABLE templates 
-                ADD COLUMN speaker_diarization TEXT
+                ALTER COLUMN speaker_diarization DROP DEFAULT
             """))
             
-            print("✅ Successfully added speaker_diarization column to templates table.")
-            
-            # Update all existing templates with the default speaker diarization prompt
-            print("🔄 Populating speaker_diarization for all existing templates...")
-            
-            update_result = connection.execute(text("""
-                UPDATE templates 
-                SET speaker_diarization = :prompt
-                WHERE speaker_diarization IS NULL
-            """), {"prompt": DEFAULT_SPEAKER_DIARIZATION_PROMPT})
-            
             connection.commit()
             
-            rows_updated = update_result.rowcount
-            print(f"✅ Updated {rows_updated} template(s) with default speaker diarization prompt.")
-            
-            # Verify the column was added
-            verify_result = connection.execute(text("""
-                SELECT column_name, data_type, is_nullable 
-                FROM information_schema.columns 
-                WHERE table_name = 'templates' AND column_name = 'speaker_diarization'
-            """))
-            
-            column_info = verify_result.fetchone()
-            if column_info:
-                print(f"✅ Verification: speaker_diarization column added successfully")
-                print(f"   - Data type: {column_info[1]}")
-                print(f"   - Nullable: {column_info[2]}")
-            else:
-                print("❌ Verification failed: speaker_diarization column not found")
-                return False
-            
-            # Count total templates
-            count_result = connection.execute(text("""
-                SELECT COUNT(*) FROM templates
-            """))
-            total_templates = count_result.fetchone()[0]
-            print(f"📊 Total templates in database: {total_templates}")
+            print("✅ speaker_diarization column is present on templates table.")
+            print("✅ Existing templates default to the speaker diarization prompt.")
             
             return True
             
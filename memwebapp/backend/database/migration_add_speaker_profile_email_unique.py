@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Migration script to enforce unique (user_id, email) on speaker_profiles
+speaker_profile_service relies on the database to reject duplicate emails per
+user (IntegrityError) instead of checking with a SELECT first, so databases
+whose table predates the uix_user_email constraint get an equivalent unique index
+"""
+
+import sys
+import os
+import logging
+from sqlalchemy import text, create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the parent directory to Python path to import config
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+
+# Setup logging with timestamps
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+def migrate_add_speaker_profile_email_unique():
+    """Add a unique (user_id, email) index on speaker_profiles if no constraint exists"""
+    
+    # Create engine and session
+    engine = create_engine(settings.DATABASE_URL)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    
+    with SessionLocal() as db:
+        try:
+            logger.info("Starting migration to enforce unique speaker profile emails...")
+            
+            result = db.execute(text("""
+                SELECT conname
+                FROM pg_constraint
+                WHERE conrelid = 'speaker_profiles'::regclass AND contype = 'u'
+                  AND conname = 'uix_user_email'
+            """))
+            
+            if result.fetchone():
+                logger.info("uix_user_email constraint already exists, skipping")
+                return
+            
+            db.execute(text("""
+                CREATE UNIQUE INDEX IF NOT EXISTS uq_speaker_profiles_user_email
+                ON speaker_profiles (user_id, email)
+                WHERE email IS NOT NULL
+            """))
+            db.commit()
+            
+            logger.info("Migration completed successfully! uq_speaker_profiles_user_email created.")
+        
+        except Exception as e:
+            logger.error(f"Migration failed: {str(e)}")
+            db.rollback()
+            raise
+
+if __name__ == "__main__":
+    migrate_add_speaker_profile_email_unique()
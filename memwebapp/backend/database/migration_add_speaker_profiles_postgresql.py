@@ -5,16 +5,16 @@ import os
 import sys
 from sqlalchemy import create_engine, text
 from sqlalchemy.exc import SQLAlchemyError
-from dotenv import load_dotenv
 
 # Add the parent directory to the path so we can import our models
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from config.env_config import ensure_env_loaded
 from database.base import Base
 from api.models.user import User  # Import User model first for foreign key
 from api.models.speaker_profile import SpeakerProfile
 
-load_dotenv()
+ensure_env_loaded()
 
 def migrate():
     """Add speaker_profiles table to PostgreSQL database"""
@@ -35,11 +35,7 @@ def migrate():
         # Check if table already exists
         with engine.connect() as conn:
             result = conn.execute(text("""
-                SELECT EXISTS (
-                    SELECT FROM information_schema.tables 
-                    WHERE table_schema = 'public' 
-                    AND table_name = 'speaker_profiles'
-                )
+                SELECT to_regclass('public.speaker_profiles') IS NOT NULL
             """))
             table_exists = result.scalar()
             
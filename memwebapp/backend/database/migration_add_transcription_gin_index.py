@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Migration script to add a GIN index on meeting_records.transcription
+The index (jsonb_path_ops on transcription::jsonb) lets speaker lookups run as
+JSONB containment queries instead of scanning every meeting's transcript
+"""
+
+import sys
+import os
+import logging
+from sqlalchemy import text, create_engine
+
+# Add the parent directory to Python path to import config
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+
+# Setup logging with timestamps
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+def migrate_add_transcription_gin_index():
+    """Add GIN index on meeting_records.transcription"""
+    
+    engine = create_engine(settings.DATABASE_URL)
+    
+    # CONCURRENTLY builds the index without blocking writes to meeting_records; it cannot
+    # run inside a transaction block, hence the autocommit connection
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        try:
+            logger.info("Starting migration to add transcription GIN index...")
+            
+            connection.execute(text("""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_meeting_records_transcription_gin
+                ON meeting_records USING gin ((transcription::jsonb) jsonb_path_ops)
+            """))
+            
+            logger.info("Migration completed successfully! ix_meeting_records_transcription_gin created.")
+        
+        except Exception as e:
+            # An interrupted concurrent build leaves an INVALID index that IF NOT EXISTS skips;
+            # drop it before re-running
+            logger.error(f"Migration failed: {str(e)}")
+            raise
+
+if __name__ == "__main__":
+    migrate_add_transcription_gin_index()
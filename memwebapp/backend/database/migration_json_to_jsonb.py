@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Migration script to convert meeting_records JSON columns to JSONB
+Converts participants, transcription, action_items and analytics_data to JSONB and
+unwraps legacy rows that stored the payload as a JSON-encoded string, so readers
+always get lists/dicts back from the driver
+"""
+
+import sys
+import os
+import json
+import logging
+from sqlalchemy import text, create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the parent directory to Python path to import config
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+
+# Setup logging with timestamps
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+JSONB_COLUMNS = ["participants", "transcription", "action_items", "analytics_data"]
+
+def _unwrap_legacy_value(column, value):
+    """Decode a string-encoded payload into the structure the column should hold"""
+    try:
+        return json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        if column == "participants":
+            # Legacy comma-separated participants
+            return [p.strip() for p in value.split(',') if p.strip()]
+        if column == "analytics_data":
+            return None
+        return []
+
+def migrate_json_to_jsonb():
+    """Convert meeting_records JSON columns to JSONB"""
+    
+    # Create engine and session
+    engine = create_engine(settings.DATABASE_URL)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    
+    with SessionLocal() as db:
+        try:
+            logger.info("Starting migration of meeting_records JSON columns to JSONB...")
+            
+            for column in JSONB_COLUMNS:
+                result = db.execute(text("""
+                    SELECT format_type(atttypid, atttypmod) AS data_type
+                    FROM pg_attribute
+                    WHERE attrelid = to_regclass('public.meeting_records') AND attname = :column AND NOT attisdropped
+                """), {"column": column})
+                row = result.fetchone()
+                
+                if not row:
+                    logger.info(f"{column} column does not exist, skipping")
+                    continue
+                
+                if row.data_type != "jsonb":
+                    logger.info(f"Altering {column} from {row.data_type} to JSONB...")
+                    db.execute(text(
+                        f"ALTER TABLE meeting_records ALTER COLUMN {column} TYPE JSONB USING {column}::jsonb"
+                    ))
+                    db.commit()
+                else:
+                    logger.info(f"{column} is already JSONB")
+                
+                # Unwrap rows whose value is a JSON string rather than a list/object
+                result = db.execute(text(f"""
+                    SELECT id, {column} #>> '{{}}' AS raw
+                    FROM meeting_records
+                    WHERE jsonb_typeof({column}) = 'string'
+                """))
+                records = result.fetchall()
+                
+                for record in records:
+                    value = _unwrap_legacy_value(column, record.raw)
+                    db.execute(
+                        text(f"UPDATE meeting_records SET {column} = CAST(:value AS JSONB) WHERE id = :id"),
+                        {"value": json.dumps(value) if value is not None else None, "id": record.id}
+                    )
+                
+                db.commit()
+                logger.info(f"{column}: unwrapped {len(records)} string-encoded records")
+            
+            logger.info("Migration completed successfully!")
+        
+        except Exception as e:
+            logger.error(f"Migration failed: {str(e)}")
+            db.rollback()
+            raise
+
+if __name__ == "__main__":
+    migrate_json_to_jsonb()
@@ -5,16 +5,16 @@ import os
 import sys
 from sqlalchemy import create_engine, text
 from sqlalchemy.exc import SQLAlchemyError
-from dotenv import load_dotenv
 
 # Add the parent directory to the path so we can import our models
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from config.env_config import ensure_env_loaded
 from database.base import Base
 from api.models.meeting import MeetingRecord
 from api.models.user import User
 
-load_dotenv()
+ensure_env_loaded()
 
 def migrate():
     """Set up PostgreSQL database with all required tables"""
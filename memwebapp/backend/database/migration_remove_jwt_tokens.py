@@ -36,18 +36,18 @@ def run_migration():
         with engine.connect() as conn:
             # Check if refresh_token column exists
             result = conn.execute(text("""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name = 'users' AND column_name = 'refresh_token'
+                SELECT attname AS column_name
+                FROM pg_attribute
+                WHERE attrelid = to_regclass('public.users') AND attname = 'refresh_token' AND NOT attisdropped
             """))
             
             refresh_token_exists = result.fetchone() is not None
             
             # Check if refresh_token_expires_at column exists
             result = conn.execute(text("""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name = 'users' AND column_name = 'refresh_token_expires_at'
+                SELECT attname AS column_name
+                FROM pg_attribute
+                WHERE attrelid = to_regclass('public.users') AND attname = 'refresh_token_expires_at' AND NOT attisdropped
             """))
             
             refresh_token_expires_at_exists = result.fetchone() is not None
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Migration script to convert templates.key_points_prompt to JSONB
+Converts the column to JSONB and unwraps legacy rows that stored the key points
+as a JSON-encoded (or plain-text) string, so readers always get a list back
+from the driver without parsing it per response
+"""
+
+import sys
+import os
+import json
+import logging
+from sqlalchemy import text, create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the parent directory to Python path to import config
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+from database.migration_keypoints_to_list import extract_key_points_from_string
+
+# Setup logging with timestamps
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+def _unwrap_legacy_value(value):
+    """Decode a string-encoded key points payload into a list"""
+    try:
+        decoded = json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        # Legacy free-text prompt
+        return extract_key_points_from_string(value)
+    return decoded if isinstance(decoded, list) else []
+
+def migrate_template_key_points_to_jsonb():
+    """Convert templates.key_points_prompt to JSONB"""
+    
+    # Create engine and session
+    engine = create_engine(settings.DATABASE_URL)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    
+    with SessionLocal() as db:
+        try:
+            logger.info("Starting migration of templates.key_points_prompt to JSONB...")
+            
+            result = db.execute(text("""
+                SELECT format_type(atttypid, atttypmod) AS data_type
+                FROM pg_attribute
+                WHERE attrelid = to_regclass('public.templates') AND attname = 'key_points_prompt' AND NOT attisdropped
+            """))
+            row = result.fetchone()
+            
+            if not row:
+                logger.info("key_points_prompt column does not exist, skipping")
+                return
+            
+            if row.data_type != "jsonb":
+                logger.info(f"Altering key_points_prompt from {row.data_type} to JSONB...")
+                db.execute(text(
+                    "ALTER TABLE templates ALTER COLUMN key_points_prompt TYPE JSONB USING key_points_prompt::jsonb"
+                ))
+                db.commit()
+            else:
+                logger.info("key_points_prompt is already JSONB")
+            
+            # Unwrap rows whose value is a JSON string rather than a list
+            result = db.execute(text("""
+                SELECT id, key_points_prompt #>> '{}' AS raw
+                FROM templates
+                WHERE jsonb_typeof(key_points_prompt) = 'string'
+            """))
+            records = result.fetchall()
+            
+            for record in records:
+                db.execute(
+                    text("UPDATE templates SET key_points_prompt = CAST(:value AS JSONB) WHERE id = :id"),
+                    {"value": json.dumps(_unwrap_legacy_value(record.raw)), "id": record.id}
+                )
+            
+            db.commit()
+            logger.info(f"Unwrapped {len(records)} string-encoded templates")
+            logger.info("Migration completed successfully!")
+        
+        except Exception as e:
+            logger.error(f"Migration failed: {str(e)}")
+            db.rollback()
+            raise
+
+if __name__ == "__main__":
+    migrate_template_key_points_to_jsonb()
@@ -1,13 +1,15 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 import uvicorn
 from pathlib import Path
 from contextlib import asynccontextmanager
 import logging
+import threading
 
 from config.settings import settings
+from config.logging_config import setup_logging
 from database.connection import engine
 from database.base import Base
 from api.routers import meetings, auth, microsoft_auth, google_auth, templates, crm, stream, basic_auth, dashboards, charts, generation
@@ -20,16 +22,16 @@ from api.models.dashboard import Dashboard  # Import Dashboard model to create t
 from api.models.chart import Chart  # Import Chart model to create table
 from api.services.background_transcription_service import background_service
 from api.services.watchdog_service import watchdog_service
+from api.services.batch_analytics_service import batch_analytics_service
+from api.services.finalize_worker_service import finalize_worker_service
+from api.services.flat_meeting_analytics import get_flat_analytics
+from api.services import base_auth_service
 
 
 # Set up logging with timestamps
 # Use INFO for production, DEBUG for development
 log_level = logging.DEBUG if settings.NODE_ENV == "development" else logging.INFO
-logging.basicConfig(
-    level=log_level,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+setup_logging(log_level)
 logger = logging.getLogger(__name__)
 
 # Custom AccessFormatter with timestamps for uvicorn access logs
@@ -158,6 +160,22 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"❌ Failed to start watchdog service: {e}")
     
+    # Start batch analytics service
+    try:
+        batch_analytics_service.start()
+    except Exception as e:
+        logger.error(f"❌ Failed to start batch analytics service: {e}")
+    
+    # Create the analytics extractor and pre-warm the Gemini channel in the
+    # background so startup is not delayed
+    def warm_up_analytics():
+        try:
+            get_flat_analytics().warm_up()
+        except Exception as e:
+            logger.warning(f"⚠️  Flat Meeting Analytics not available: {e}")
+    
+    threading.Thread(target=warm_up_analytics, daemon=True).start()
+    
     yield
     
     # Stop watchdog service
@@ -165,6 +183,18 @@ async def lifespan(app: FastAPI):
         watchdog_service.stop()
     except Exception as e:
         logger.error(f"❌ Error stopping watchdog service: {e}")
+    
+    # Stop batch analytics service
+    try:
+        batch_analytics_service.stop()
+    except Exception as e:
+        logger.error(f"❌ Error stopping batch analytics service: {e}")
+    
+    # Stop finalization worker pool
+    try:
+        finalize_worker_service.stop()
+    except Exception as e:
+        logger.error(f"❌ Error stopping finalize worker pool: {e}")
 
     # Stop background transcription service
     try:
@@ -173,6 +203,12 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"❌ Error stopping background transcription service: {str(e)}")
     
+    # Close the pooled OAuth HTTP client
+    try:
+        await base_auth_service.close_http_client()
+    except Exception as e:
+        logger.error(f"❌ Error closing OAuth HTTP client: {e}")
+    
     # Shutdown
     logger.info("🛑 Server is shutting down...")
 
@@ -180,7 +216,8 @@ app = FastAPI(
     title=settings.APP_NAME,
     description=settings.APP_DESCRIPTION,
     version=settings.APP_VERSION,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware with production settings
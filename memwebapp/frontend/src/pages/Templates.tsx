@@ -27,7 +27,7 @@ const TemplateForm: React.FC<TemplateFormProps> = ({ initialData, onSave, onCanc
     const [transcriptionPrompt, setTranscriptionPrompt] = useState(initialData?.transcription_prompt || '');
     const [summaryPrompt, setSummaryPrompt] = useState(initialData?.summary_prompt || '');
     const [keyPointsRaw, setKeyPointsRaw] = useState(
-        (initialData?.key_points_prompt || initialData?.key_points || []).join('\n')
+        (initialData?.key_points_prompt || []).join('\n')
     );
     const [speakerDiarization, setSpeakerDiarization] = useState(initialData?.speaker_diarization || '');
 
@@ -444,18 +444,18 @@ const Templates: React.FC = () => {
 
                                     {/* Key Points preview */}
                                     <div className="space-y-3 pt-4 border-t border-slate-100/80">
-                                        {(template.key_points_prompt || template.key_points || []).length > 0 && (
+                                        {(template.key_points_prompt || []).length > 0 && (
                                             <div className="flex items-start gap-2">
                                                 <ClipboardList className="h-3.5 w-3.5 text-blue-500/60 mt-0.5 shrink-0" />
                                                 <div className="flex flex-wrap gap-1.5">
-                                                    {(template.key_points_prompt || template.key_points || []).slice(0, 3).map((kp, i) => (
+                                                    {(template.key_points_prompt || []).slice(0, 3).map((kp, i) => (
                                                         <span key={i} className="px-2 py-0.5 text-[10px] font-bold uppercase tracking-wider bg-slate-50 text-slate-500 rounded-md border border-slate-100">
                                                             {kp}
                                                         </span>
                                                     ))}
-                                                    {(template.key_points_prompt || template.key_points || []).length > 3 && (
+                                                    {(template.key_points_prompt || []).length > 3 && (
                                                         <span className="px-2 py-0.5 text-[10px] font-bold text-slate-400">
-                                                            +{(template.key_points_prompt || template.key_points || []).length - 3} more
+                                                            +{(template.key_points_prompt || []).length - 3} more
                                                         </span>
                                                     )}
                                                 </div>
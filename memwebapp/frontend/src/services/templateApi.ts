@@ -10,7 +10,6 @@ export interface Template {
     summary_prompt: string | null;
     key_points_prompt: string[] | null;
     speaker_diarization: string | null;
-    key_points: string[] | null;
     created_by: number | null;
     created_at: string;
     updated_at: string;